@@ -15,6 +15,7 @@
 ; bool _string_equals(const char* s1, size_t len1, const char* s2, size_t len2)
 ; x0 = s1, x1 = len1, x2 = s2, x3 = len2
 ; Returns 1 if strings are equal, 0 otherwise in w0
+    .p2align 4
     .globl _string_equals
 _string_equals:
     cmp x1, x3                  ; Compare lengths first
@@ -43,6 +44,7 @@ Lstr_eq_false:
 ; char* _string_concat(char* dest, const char* s1, size_t len1, const char* s2, size_t len2)
 ; x0 = dest, x1 = s1_ptr, x2 = s1_len, x3 = s2_ptr, x4 = s2_len
 ; Returns dest in x0, total length in x1
+    .p2align 4
     .globl _string_concat
 _string_concat:
     stp x29, x30, [sp, #-16]!
@@ -88,6 +90,7 @@ Lconcat_done:
 ; int_to_string: convert integer to string
 ; x0 = buffer, x1 = integer value
 ; Returns: x0 = buffer ptr, x1 = string length
+    .p2align 4
     .globl _int_to_string
 _int_to_string:
     stp x29, x30, [sp, #-16]!
@@ -359,7 +362,7 @@ _result_buf_eval_language_candidates_question:
     .text
 
     .globl _eval_language_candidates_has_grammar
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_has_grammar:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -381,7 +384,7 @@ _eval_language_candidates_has_grammar:
     ret
 
     .globl _eval_language_candidates_question
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_question:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -428,7 +431,7 @@ _eval_language_candidates_question:
     ret
 
     .globl _eval_language_candidates_predicted_answer
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_predicted_answer:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -480,7 +483,7 @@ or_end_2:
     ret
 
     .globl _eval_language_candidates_predicted_biological_language_core
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_predicted_biological_language_core:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -518,7 +521,7 @@ and_end_6:
     ret
 
     .globl _eval_language_candidates_predicted_biological_language_strict
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_predicted_biological_language_strict:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -546,7 +549,7 @@ and_end_8:
     ret
 
     .globl _eval_language_candidates_bio_hockett_score
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_bio_hockett_score:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -686,7 +689,7 @@ if_end_30:
     ret
 
     .globl _eval_language_candidates_prediction_predicates
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_prediction_predicates:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -978,7 +981,7 @@ if_end_46:
     ret
 
     .globl _eval_language_candidates_prediction_fail
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_prediction_fail:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -1136,7 +1139,7 @@ if_end_54:
     ret
 
     .globl _eval_language_candidates_is_description_of
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_is_description_of:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -1158,7 +1161,7 @@ _eval_language_candidates_is_description_of:
     ret
 
     .globl _eval_language_candidates_is_open_closed_world_conflicted
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_is_open_closed_world_conflicted:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -1184,7 +1187,7 @@ and_end_56:
     ret
 
     .globl _eval_language_candidates_relationship_to_concept
-    .p2align 2
+    .p2align 4
 _eval_language_candidates_relationship_to_concept:
     stp x29, x30, [sp, #-16]!
     mov x29, sp
@@ -1221,3 +1224,135 @@ if_end_58:
     ldp x29, x30, [sp], #16
     ret
 
+    .data
+    .globl _eval_all_language_candidates_fields
+_eval_all_language_candidates_fields:
+    .asciz "has_grammar,question,predicted_answer,predicted_biological_language_core,predicted_biological_language_strict,bio_hockett_score,prediction_predicates,prediction_fail,is_description_of,is_open_closed_world_conflicted,relationship_to_concept"
+
+    .text
+    .globl _eval_all_language_candidates
+    .p2align 4
+_eval_all_language_candidates:
+    stp x29, x30, [sp, #-16]!
+    mov x29, sp
+    stp x19, x20, [sp, #-16]!
+    mov x19, x0
+    mov x20, x1
+    mov x0, x19
+    bl _eval_language_candidates_has_grammar
+    add x9, x20, #0
+    mov w0, w0
+    str x0, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_question
+    add x9, x20, #16
+    stp x0, x1, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_predicted_answer
+    add x9, x20, #32
+    mov w0, w0
+    str x0, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_predicted_biological_language_core
+    add x9, x20, #48
+    mov w0, w0
+    str x0, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_predicted_biological_language_strict
+    add x9, x20, #64
+    mov w0, w0
+    str x0, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_bio_hockett_score
+    add x9, x20, #80
+    str x0, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_prediction_predicates
+    add x9, x20, #96
+    stp x0, x1, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_prediction_fail
+    add x9, x20, #112
+    stp x0, x1, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_is_description_of
+    add x9, x20, #128
+    mov w0, w0
+    str x0, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_is_open_closed_world_conflicted
+    add x9, x20, #144
+    mov w0, w0
+    str x0, [x9]
+    mov x0, x19
+    bl _eval_language_candidates_relationship_to_concept
+    add x9, x20, #160
+    stp x0, x1, [x9]
+    ldp x19, x20, [sp], #16
+    ldp x29, x30, [sp], #16
+    ret
+
+    .globl _eval_all_batch_language_candidates
+    .p2align 4
+_eval_all_batch_language_candidates:
+    stp x29, x30, [sp, #-16]!
+    mov x29, sp
+    stp x19, x20, [sp, #-16]!
+    stp x21, x22, [sp, #-16]!
+    stp x23, x24, [sp, #-16]!
+    mov x19, x0
+    mov x20, x1
+    mov x21, x2
+    mov x22, x3
+    mov x23, x4
+    cbz x22, Lbatch_language_candidates_done
+Lbatch_language_candidates_loop:
+    ldr x0, [x19], #8
+    mov x1, x20
+    bl _eval_all_language_candidates
+    add x9, x20, #16
+    ldp x1, x2, [x9]
+    mov x0, x21
+    mov x3, #0
+    mov x4, #0
+    bl _string_concat
+    add x9, x20, #16
+    stp x0, x1, [x9]
+    add x21, x21, x23
+    add x9, x20, #96
+    ldp x1, x2, [x9]
+    mov x0, x21
+    mov x3, #0
+    mov x4, #0
+    bl _string_concat
+    add x9, x20, #96
+    stp x0, x1, [x9]
+    add x21, x21, x23
+    add x9, x20, #112
+    ldp x1, x2, [x9]
+    mov x0, x21
+    mov x3, #0
+    mov x4, #0
+    bl _string_concat
+    add x9, x20, #112
+    stp x0, x1, [x9]
+    add x21, x21, x23
+    add x9, x20, #160
+    ldp x1, x2, [x9]
+    mov x0, x21
+    mov x3, #0
+    mov x4, #0
+    bl _string_concat
+    add x9, x20, #160
+    stp x0, x1, [x9]
+    add x21, x21, x23
+    add x20, x20, #176
+    subs x22, x22, #1
+    b.ne Lbatch_language_candidates_loop
+Lbatch_language_candidates_done:
+    ldp x23, x24, [sp], #16
+    ldp x21, x22, [sp], #16
+    ldp x19, x20, [sp], #16
+    ldp x29, x30, [sp], #16
+    ret
+
@@ -14,6 +14,7 @@ The formula is the source of truth. Assembly is derived, not authored.
 
 import sys
 import re
+import hashlib
 import subprocess
 import platform
 from pathlib import Path
@@ -26,6 +27,11 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from orchestration.shared import load_rulebook, handle_clean_arg, discover_entities, get_entity_schema, to_snake_case
 
+# log2 alignment of function entry points. 16 bytes is what optimizing C
+# compilers (-O2 and up) use for AArch64 functions; .p2align 2 (4 bytes) is
+# only the instruction-size minimum and lets hot entries straddle fetch blocks
+FUNCTION_ALIGN = 4
+
 
 # =============================================================================
 # DATA TYPES
@@ -663,7 +669,7 @@ class AsmGenerator:
 
         # Function header
         lines.append(f"    .globl _{func_name}")
-        lines.append(f"    .p2align 2")
+        lines.append(f"    .p2align {FUNCTION_ALIGN}")
         lines.append(f"_{func_name}:")
 
         # Prologue - save frame pointer and link register, plus callee-saved regs
@@ -973,9 +979,124 @@ def generate_assembly(ir: IRNode, field_name: str, string_literals: Dict[str, st
     return gen.generate_function(ir, f"eval_{field_name}")
 
 
+def generate_eval_all(entity: str, fields: List[tuple]) -> str:
+    """
+    Generate eval_all_<entity>(TestAnswer*, Output*) for one entity (ARM64).
+
+    Calls every compiled evaluator for the entity once and stores each result
+    in a 16-byte output slot, in order: BOOL and INT results in the first 8
+    bytes (bools zero-extended), STRING results as (ptr, len). The slot order
+    is exported as the comma-separated eval_all_<entity>_fields string so the
+    caller never has to guess which formulas compiled.
+
+    fields: list of (field_name, DataType) in slot order.
+    """
+    func_name = f"eval_all_{entity}"
+    lines = [
+        "    .data",
+        f"    .globl _{func_name}_fields",
+        f"_{func_name}_fields:",
+        f'    .asciz "{",".join(name for name, _ in fields)}"',
+        "",
+        "    .text",
+        f"    .globl _{func_name}",
+        f"    .p2align {FUNCTION_ALIGN}",
+        f"_{func_name}:",
+        "    stp x29, x30, [sp, #-16]!",
+        "    mov x29, sp",
+        "    stp x19, x20, [sp, #-16]!",
+        "    mov x19, x0",  # x19 = TestAnswer* ptr
+        "    mov x20, x1",  # x20 = Output* ptr
+    ]
+
+    for slot, (field_name, datatype) in enumerate(fields):
+        lines.append("    mov x0, x19")
+        lines.append(f"    bl _eval_{entity}_{field_name}")
+        lines.append(f"    add x9, x20, #{slot * 16}")
+        if datatype == DataType.STRING:
+            lines.append("    stp x0, x1, [x9]")
+        else:
+            if datatype == DataType.BOOL:
+                lines.append("    mov w0, w0")  # Zero-extend w0 into x0
+            lines.append("    str x0, [x9]")
+
+    lines.append("    ldp x19, x20, [sp], #16")
+    lines.append("    ldp x29, x30, [sp], #16")
+    lines.append("    ret")
+    lines.append("")
+
+    return "\n".join(lines)
+
+
+def generate_eval_all_batch(entity: str, fields: List[tuple]) -> str:
+    """
+    Generate eval_all_batch_<entity>(TestAnswer**, Output*, char* arena,
+    size_t n, size_t arena_stride) for one entity (ARM64).
+
+    Runs eval_all_<entity> for n structs in one call, filling n consecutive
+    rows of output slots. STRING results live in per-function static
+    buffers that the next record would overwrite, so after each record every
+    STRING slot is copied into its own arena_stride-byte cell of the
+    caller's arena (in slot order, record after record) and repointed there.
+
+    fields: list of (field_name, DataType) in slot order, as for eval_all.
+    """
+    func_name = f"eval_all_batch_{entity}"
+    row_size = len(fields) * 16
+    lines = [
+        f"    .globl _{func_name}",
+        f"    .p2align {FUNCTION_ALIGN}",
+        f"_{func_name}:",
+        "    stp x29, x30, [sp, #-16]!",
+        "    mov x29, sp",
+        "    stp x19, x20, [sp, #-16]!",
+        "    stp x21, x22, [sp, #-16]!",
+        "    stp x23, x24, [sp, #-16]!",
+        "    mov x19, x0",  # x19 = next TestAnswer** entry
+        "    mov x20, x1",  # x20 = current output row
+        "    mov x21, x2",  # x21 = next arena cell
+        "    mov x22, x3",  # x22 = records remaining
+        "    mov x23, x4",  # x23 = arena stride
+        f"    cbz x22, Lbatch_{entity}_done",
+        f"Lbatch_{entity}_loop:",
+        "    ldr x0, [x19], #8",
+        "    mov x1, x20",
+        f"    bl _eval_all_{entity}",
+    ]
+
+    for slot, (field_name, datatype) in enumerate(fields):
+        if datatype != DataType.STRING:
+            continue
+        # _string_concat(dest, s1, len1, NULL, 0) doubles as memcpy
+        lines.append(f"    add x9, x20, #{slot * 16}")
+        lines.append("    ldp x1, x2, [x9]")
+        lines.append("    mov x0, x21")
+        lines.append("    mov x3, #0")
+        lines.append("    mov x4, #0")
+        lines.append("    bl _string_concat")
+        lines.append(f"    add x9, x20, #{slot * 16}")
+        lines.append("    stp x0, x1, [x9]")
+        lines.append("    add x21, x21, x23")
+
+    lines.extend([
+        f"    add x20, x20, #{row_size}",
+        "    subs x22, x22, #1",
+        f"    b.ne Lbatch_{entity}_loop",
+        f"Lbatch_{entity}_done:",
+        "    ldp x23, x24, [sp], #16",
+        "    ldp x21, x22, [sp], #16",
+        "    ldp x19, x20, [sp], #16",
+        "    ldp x29, x30, [sp], #16",
+        "    ret",
+        "",
+    ])
+
+    return "\n".join(lines)
+
+
 def generate_string_runtime() -> str:
     """Generate the ARM64 string runtime library in assembly."""
-    return """
+    return f"""
 ; String runtime for ERB Binary Substrate (ARM64 / Apple Silicon)
 ; Calling convention: Apple ARM64 ABI
 
@@ -985,6 +1106,7 @@ def generate_string_runtime() -> str:
 ; bool _string_equals(const char* s1, size_t len1, const char* s2, size_t len2)
 ; x0 = s1, x1 = len1, x2 = s2, x3 = len2
 ; Returns 1 if strings are equal, 0 otherwise in w0
+    .p2align {FUNCTION_ALIGN}
     .globl _string_equals
 _string_equals:
     cmp x1, x3                  ; Compare lengths first
@@ -1013,6 +1135,7 @@ Lstr_eq_false:
 ; char* _string_concat(char* dest, const char* s1, size_t len1, const char* s2, size_t len2)
 ; x0 = dest, x1 = s1_ptr, x2 = s1_len, x3 = s2_ptr, x4 = s2_len
 ; Returns dest in x0, total length in x1
+    .p2align {FUNCTION_ALIGN}
     .globl _string_concat
 _string_concat:
     stp x29, x30, [sp, #-16]!
@@ -1058,6 +1181,7 @@ Lconcat_done:
 ; int_to_string: convert integer to string
 ; x0 = buffer, x1 = integer value
 ; Returns: x0 = buffer ptr, x1 = string length
+    .p2align {FUNCTION_ALIGN}
     .globl _int_to_string
 _int_to_string:
     stp x29, x30, [sp, #-16]!
@@ -1155,11 +1279,19 @@ def generate_data_section(string_literals: Dict[str, str], result_buffers: List[
 # PHASE 4: BUILD PIPELINE
 # =============================================================================
 
-def assemble_and_link(asm_source: str, output_path: Path) -> Path:
-    """Assemble and link the generated assembly to a shared library."""
+def assemble_and_link(asm_source: str, output_path: Path, force: bool = False) -> Path:
+    """Assemble and link the generated assembly to a shared library.
+
+    The SHA-256 of the assembly the library was built from is kept in a
+    sidecar file; when it matches asm_source and the library exists, the
+    assemble/link subprocesses are skipped (unless force is set). Content
+    rather than mtime, because erb_calc.s is regenerated on every run and
+    git checkouts do not preserve timestamps.
+    """
 
     asm_file = output_path / "erb_calc.s"
     obj_file = output_path / "erb_calc.o"
+    hash_file = output_path / ".erb_calc.s.sha256"
 
     system = platform.system()
     if system == "Darwin":
@@ -1171,6 +1303,12 @@ def assemble_and_link(asm_source: str, output_path: Path) -> Path:
     asm_file.write_text(asm_source)
     print(f"   Wrote: {asm_file}")
 
+    source_hash = hashlib.sha256(asm_source.encode('utf-8')).hexdigest()
+    if (not force and lib_file.exists() and hash_file.exists()
+            and hash_file.read_text().strip() == source_hash):
+        print(f"   Up to date: {lib_file} (use --force to rebuild)")
+        return lib_file
+
     # Assemble
     if system == "Darwin":
         # macOS: use clang to assemble (handles .s files with Intel syntax)
@@ -1199,6 +1337,8 @@ def assemble_and_link(asm_source: str, output_path: Path) -> Path:
         raise RuntimeError(f"Linking failed: {result.stderr}")
     print(f"   Created: {lib_file}")
 
+    hash_file.write_text(source_hash + "\n")
+
     return lib_file
 
 
@@ -1213,6 +1353,7 @@ def main():
         'erb_calc.o',
         'erb_calc.dylib',
         'erb_calc.so',
+        '.erb_calc.s.sha256',
         'test-answers.json',
         'test-results.md',
     ]
@@ -1292,6 +1433,7 @@ def main():
 
     # Compile each formula
     all_functions = []
+    compiled_by_entity: Dict[str, List[tuple]] = {}
 
     for cf in calculated_fields:
         # Use the per-entity schema
@@ -1324,6 +1466,7 @@ def main():
         try:
             asm = generate_assembly(ir, func_name, string_literals)
             all_functions.append(asm)
+            compiled_by_entity.setdefault(cf['entity'], []).append((cf['name'], ir.result_type))
             print(f"    Generated {len(asm.splitlines())} lines of assembly")
         except Exception as e:
             print(f"    ⚠️  Skipping (codegen error): {e}")
@@ -1343,6 +1486,16 @@ def main():
         print("=" * 70)
         return
 
+    # One combined entry point per entity, so callers make a single
+    # FFI call per record instead of one per calculated field, plus a
+    # batched variant that takes many records per call
+    for entity_snake, fields in compiled_by_entity.items():
+        if len(fields) * 16 > 4095:  # add immediate range
+            print(f"   Skipping eval_all_{entity_snake}: too many fields ({len(fields)})")
+            continue
+        all_functions.append(generate_eval_all(entity_snake, fields))
+        all_functions.append(generate_eval_all_batch(entity_snake, fields))
+
     print("\n🔨 Building shared library...")
 
     # Generate string runtime
@@ -1369,7 +1522,7 @@ def main():
 """
 
     try:
-        lib_path = assemble_and_link(full_asm, script_dir)
+        lib_path = assemble_and_link(full_asm, script_dir, force='--force' in sys.argv)
         print(f"\n✅ Successfully compiled: {lib_path}")
     except Exception as e:
         print(f"\n❌ Build failed: {e}")
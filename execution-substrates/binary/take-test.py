@@ -5,7 +5,7 @@ Take Test - Binary Execution Substrate
 This script runs the test by:
 1. Loading test data (multi-entity or legacy)
 2. Packing each record into a TestAnswer struct (bytes)
-3. Calling the GENERATED assembly evaluators via ctypes
+3. Calling the GENERATED assembly evaluators via CFFI (ABI mode) or ctypes
 4. Unpacking results back to Python
 5. Saving test-answers
 
@@ -21,22 +21,43 @@ The ABI (ARM64 Apple Silicon):
 
 import argparse
 import ctypes
-import glob as glob_module
-import json
+import io
 import os
 import platform
 import re
 import struct
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from itertools import repeat
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Any, Optional
 from enum import Enum, auto
 
 # Add project root to path for shared imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from orchestration.shared import load_rulebook, discover_entities, get_entity_schema, to_snake_case, get_calculated_fields
+from orchestration.shared import (load_rulebook, discover_entities, get_entity_schema, to_snake_case,
+                                  get_calculated_fields, read_json, write_json)
+
+# CFFI's ABI mode has a cheaper per-call path than ctypes; use it when installed
+try:
+    from cffi import FFI
+    CFFI_AVAILABLE = True
+except ImportError:
+    CFFI_AVAILABLE = False
+
+# Numba can call ctypes functions from nopython code, so the bool evaluators
+# for a whole batch of records run in one compiled loop when it is installed
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 
 # =============================================================================
@@ -57,6 +78,7 @@ class FieldInfo:
     offset: int
     size: int
     json_name: str  # Original JSON field name for lookups
+    pack_fn: Optional[Callable] = field(default=None, repr=False, compare=False)  # (buf, value, string_table)
 
 
 # =============================================================================
@@ -68,6 +90,7 @@ def normalize_field_name(name: str) -> str:
     return to_snake_case(name)
 
 
+@lru_cache(maxsize=None)
 def json_key_to_snake(name: str) -> str:
     """Convert JSON key (snake_case) to normalized internal name."""
     return name.lower().replace(' ', '_')
@@ -77,6 +100,28 @@ def json_key_to_snake(name: str) -> str:
 # STRUCT LAYOUT COMPUTATION
 # =============================================================================
 
+def make_pack_fn(datatype: DataType, offset: int) -> Callable:
+    """Return pack_fn(buf, value, string_table) writing one field at offset."""
+    pack_into = struct.pack_into
+
+    # The struct is zeroed before packing, so False and 0 need no write
+    if datatype == DataType.BOOL:
+        def pack_fn(buf, value, string_table):
+            if value:
+                pack_into('B', buf, offset, 1)
+    elif datatype == DataType.INT:
+        def pack_fn(buf, value, string_table):
+            int_val = int(value)
+            if int_val:
+                pack_into('<q', buf, offset, int_val)
+    else:  # string
+        def pack_fn(buf, value, string_table):
+            ptr, length = string_table.intern(str(value))
+            pack_into('<QQ', buf, offset, ptr, length)  # ptr, len
+
+    return pack_fn
+
+
 def build_schema(columns: List[dict]) -> tuple:
     """
     Build schema with field offsets from column definitions.
@@ -111,7 +156,8 @@ def build_schema(columns: List[dict]) -> tuple:
             datatype=dt,
             offset=offset,
             size=size,
-            json_name=json_key_to_snake(name)
+            json_name=json_key_to_snake(name),
+            pack_fn=make_pack_fn(dt, offset)
         )
         offset += size
 
@@ -120,65 +166,119 @@ def build_schema(columns: List[dict]) -> tuple:
     return schema, total_size
 
 
+def build_pack_map(schema: Dict[str, FieldInfo]) -> List[tuple]:
+    """
+    List each field's accepted JSON key spellings with its pack_fn.
+
+    Records may use the normalized JSON name, the snake_case field name, or
+    the JSON name with underscores stripped, probed in that order; the first
+    key present decides the value, even when it is None. Precomputing the
+    keys leaves the packing loop no str.replace or FieldInfo attribute reads.
+    """
+    return [(tuple(dict.fromkeys([info.json_name, field_name, info.json_name.replace('_', '')])),
+             info.pack_fn)
+            for field_name, info in schema.items()]
+
+
 # =============================================================================
 # STRUCT PACKING
 # =============================================================================
 
 class StringTable:
-    """Manages string interning for struct packing."""
+    """Manages string interning for struct packing.
+
+    Each distinct string is encoded once; repeated values (categorical
+    fields, re-packs across passes) reuse the same entry. The struct points
+    straight into the encoded bytes object, which the table keeps alive, so
+    payloads are not copied again into a separate ctypes buffer. This relies
+    on the evaluators only ever reading input strings.
+    """
 
     def __init__(self):
         self.strings: List[bytes] = []
-        self.buffers: List[ctypes.c_char_p] = []
+        self._cache: Dict[bytes, tuple] = {}
+        self.max_len = 0
 
     def intern(self, s: str) -> tuple:
         """Intern a string, return (ptr, len)."""
         encoded = s.encode('utf-8')
-        # Create a ctypes buffer that won't be garbage collected
-        buf = ctypes.create_string_buffer(encoded)
-        self.buffers.append(buf)
-        ptr = ctypes.addressof(buf)
-        return (ptr, len(encoded))
+        hit = self._cache.get(encoded)
+        if hit is not None:
+            return hit
 
+        # Anchor the bytes object so its storage outlives the struct
+        self.strings.append(encoded)
+        ptr = ctypes.cast(ctypes.c_char_p(encoded), ctypes.c_void_p).value
+        entry = (ptr, len(encoded))
+        self._cache[encoded] = entry
+        self.max_len = max(self.max_len, len(encoded))
+        return entry
 
-def pack_test_answer(record: dict, schema: Dict[str, FieldInfo],
-                     total_size: int, string_table: StringTable) -> bytes:
-    """
-    Pack a JSON record into TestAnswer struct bytes.
+
+def pack_test_answer(record: dict, pack_map: List[tuple],
+                     buf: ctypes.Array, string_table: StringTable) -> None:
     """
-    # Create zeroed buffer
-    buf = bytearray(total_size)
+    Pack a JSON record into a TestAnswer struct buffer in place.
 
-    for field_name, info in schema.items():
-        # Map JSON key variations
-        json_key = info.json_name
+    The buffer is a preallocated ctypes array of the struct size; it is
+    zeroed first so missing fields read as null. pack_map comes from
+    build_pack_map.
+    """
+    ctypes.memset(buf, 0, len(buf))
 
-        # Try multiple key formats
+    for keys, pack_fn in pack_map:
+        # Try the key formats in order: first key present wins
         value = None
-        for key in [json_key, field_name, info.json_name.replace('_', '')]:
+        for key in keys:
             if key in record:
                 value = record[key]
                 break
 
-        if value is None:
-            # Field not in record, leave as zeros (null)
-            continue
+        if value is not None:
+            pack_fn(buf, value, string_table)
 
-        if info.datatype == DataType.BOOL:
-            bool_val = 1 if value else 0
-            struct.pack_into('B', buf, info.offset, bool_val)
 
-        elif info.datatype == DataType.INT:
-            int_val = int(value) if value is not None else 0
-            struct.pack_into('<q', buf, info.offset, int_val)
+def build_packer(schema: Dict[str, FieldInfo], total_size: int):
+    """
+    Generate a packer specialized to one entity's struct layout.
 
+    pack_test_answer re-walks the schema, re-probes key variants and
+    re-dispatches on DataType for every record. The layout is fixed per
+    entity, so this emits straight-line source with the offsets, JSON keys
+    and datatype branches baked in, compiles it once, and returns
+    packer(record, buf, string_table) with the same semantics.
+    """
+    lines = [
+        "def _pack(rec, buf, st):",
+        f"    _memset(buf, 0, {total_size})",
+    ]
+
+    for field_name, info in schema.items():
+        # Same key precedence as pack_test_answer: first key present wins
+        keys = list(dict.fromkeys(
+            [info.json_name, field_name, info.json_name.replace('_', '')]))
+        lookup = f"rec.get({keys[-1]!r})"
+        for key in reversed(keys[:-1]):
+            lookup = f"rec[{key!r}] if {key!r} in rec else {lookup}"
+
+        lines.append(f"    v = {lookup}")
+        # The struct was just zeroed, so False and 0 need no write
+        if info.datatype == DataType.BOOL:
+            lines.append("    if v:")
+            lines.append(f"        _pack_into('B', buf, {info.offset}, 1)")
+        elif info.datatype == DataType.INT:
+            lines.append("    if v is not None:")
+            lines.append("        v = int(v)")
+            lines.append("        if v:")
+            lines.append(f"            _pack_into('<q', buf, {info.offset}, v)")
         elif info.datatype == DataType.STRING:
-            str_val = str(value) if value is not None else ""
-            ptr, length = string_table.intern(str_val)
-            struct.pack_into('<Q', buf, info.offset, ptr)      # ptr
-            struct.pack_into('<Q', buf, info.offset + 8, length)  # len
+            lines.append("    if v is not None:")
+            lines.append("        ptr, length = st.intern(str(v))")
+            lines.append(f"        _pack_into('<QQ', buf, {info.offset}, ptr, length)")
 
-    return bytes(buf)
+    namespace = {'_memset': ctypes.memset, '_pack_into': struct.pack_into}
+    exec(compile("\n".join(lines) + "\n", "<erb-packer>", "exec"), namespace)
+    return namespace['_pack']
 
 
 # =============================================================================
@@ -192,74 +292,172 @@ def load_library(lib_path: Path) -> ctypes.CDLL:
     return ctypes.CDLL(str(lib_path))
 
 
-def setup_function(lib: ctypes.CDLL, func_name: str, returns_string: bool):
-    """Configure a function's signature."""
-    try:
-        func = getattr(lib, func_name)
-        func.argtypes = [ctypes.c_void_p]  # TestAnswer* pointer
+class StringResult(ctypes.Structure):
+    """Structure to capture both ptr (x0) and len (x1) return values."""
+    _fields_ = [("ptr", ctypes.c_uint64), ("len", ctypes.c_uint64)]
 
-        if returns_string:
-            # String functions return (ptr, len) in (x0, x1)
-            # We can use a structure or just get x0 as pointer
-            func.restype = ctypes.c_uint64  # Just get x0 for now
-        else:
-            # Bool functions return 0/1 in w0
-            func.restype = ctypes.c_int
 
+# Resolved function prototypes keyed by (lib, func_name). Configuring argtypes
+# and restype is comparatively expensive, so it happens once per symbol rather
+# than on every call.
+_prototype_cache: Dict[tuple, Any] = {}
+
+
+def setup_function(lib: ctypes.CDLL, func_name: str, ret_type: str):
+    """Resolve a function and configure its signature once.
+
+    Returns the cached ctypes function, or None if the symbol is missing.
+    """
+    key = (lib, func_name)
+    func = _prototype_cache.get(key)
+    if func is not None:
         return func
+
+    try:
+        func = getattr(lib, func_name)
     except AttributeError:
         return None
 
+    func.argtypes = [ctypes.c_void_p]  # TestAnswer* pointer
+    if ret_type == 'string':
+        # String functions return (ptr, len) in (x0, x1)
+        func.restype = StringResult
+    elif ret_type == 'int':
+        func.restype = ctypes.c_int64
+    else:
+        # Bool functions return 0/1 in w0
+        func.restype = ctypes.c_int
 
-class StringResult(ctypes.Structure):
-    """Structure to capture both ptr (x0) and len (x1) return values."""
-    _fields_ = [("ptr", ctypes.c_uint64), ("len", ctypes.c_uint64)]
+    _prototype_cache[key] = func
+    return func
+
+
+# C return types for the CFFI declarations, keyed by ret_type
+_CFFI_RETURN_TYPES = {'bool': 'int', 'int': 'int64_t', 'string': 'StringResult'}
 
+# Opened CFFI libraries keyed by (lib_path, declared functions); holding the
+# FFI and library objects here keeps the resolved functions valid.
+_cffi_cache: Dict[tuple, tuple] = {}
 
-def call_string_function(lib: ctypes.CDLL, func_name: str, struct_ptr: int) -> str:
+
+def load_cffi_functions(lib_path: str, funcs: Dict[str, str]) -> Dict[str, Any]:
     """
-    Call a string-returning function.
+    Resolve evaluators through CFFI's ABI mode.
 
-    The ARM64 assembly returns ptr in x0, len in x1.
-    We use a structure return type to capture both values.
+    funcs maps func_name -> ret_type. The TestAnswer pointer is declared as
+    uintptr_t so callers pass the integer address without a per-call cast,
+    and StringResult mirrors the ctypes structure so string results are read
+    the same way. Returns {func_name: function}; missing symbols are omitted.
     """
-    func = getattr(lib, func_name)
-    func.argtypes = [ctypes.c_void_p]
-    # Use StringResult structure to capture both x0 and x1
-    func.restype = StringResult
+    key = (lib_path, tuple(sorted(funcs.items())))
+    cached = _cffi_cache.get(key)
+    if cached is not None:
+        return cached[2]
+
+    ffi = FFI()
+    decls = ["typedef struct { uint64_t ptr; uint64_t len; } StringResult;"]
+    decls += [f"{_CFFI_RETURN_TYPES[ret_type]} {func_name}(uintptr_t);"
+              for func_name, ret_type in funcs.items()]
+    ffi.cdef("\n".join(decls))
+    clib = ffi.dlopen(lib_path)
+
+    resolved = {}
+    for func_name in funcs:
+        try:
+            resolved[func_name] = getattr(clib, func_name)
+        except AttributeError:
+            pass
 
-    # Call the function
-    result = func(struct_ptr)
+    _cffi_cache[key] = (ffi, clib, resolved)
+    return resolved
 
-    if result.ptr == 0 or result.len == 0:
-        return ""
 
-    # Read exactly 'len' bytes from the pointer
-    try:
-        raw = ctypes.string_at(result.ptr, result.len)
-        return raw.decode('utf-8', errors='replace')
-    except Exception:
+def resolve_functions(lib: ctypes.CDLL, calc_fields: dict) -> dict:
+    """
+    Resolve calculated-field evaluators to callables taking the struct address.
+
+    calc_fields maps field_name -> (func_name, ret_type), as returned by
+    discover_calculated_fields. Uses CFFI when available, otherwise
+    configured ctypes prototypes. Returns
+    {field_name: (func_name, func, ret_type)} for the symbols the library
+    exports; missing ones are left out.
+    """
+    cffi_funcs = {}
+    if CFFI_AVAILABLE:
+        cffi_funcs = load_cffi_functions(
+            lib._name, {func_name: ret_type for func_name, ret_type in calc_fields.values()})
+
+    resolved = {}
+    for field_name, (func_name, ret_type) in calc_fields.items():
+        func = cffi_funcs.get(func_name) or setup_function(lib, func_name, ret_type)
+        if func is not None:
+            resolved[field_name] = (func_name, func, ret_type)
+    return resolved
+
+
+# Compiled bool batch runners keyed by (lib, func_names)
+_bool_batch_cache: Dict[tuple, Any] = {}
+
+
+def build_bool_batch(lib: ctypes.CDLL, func_names: List[str]):
+    """
+    Compile a Numba loop that calls every bool evaluator for a batch of rows.
+
+    The returned runner(ptrs, out) takes a uint64 array of struct addresses
+    and an int32 array of shape (len(ptrs), len(func_names)). The ctypes
+    prototypes are bound as globals of the generated source so each call
+    compiles to a direct native call.
+    """
+    key = (lib, tuple(func_names))
+    runner = _bool_batch_cache.get(key)
+    if runner is not None:
+        return runner
+
+    namespace = {}
+    lines = [
+        "def _batch(ptrs, out):",
+        "    for i in range(ptrs.shape[0]):",
+        "        p = ptrs[i]",
+    ]
+    for col, func_name in enumerate(func_names):
+        namespace[f"_f{col}"] = setup_function(lib, func_name, 'bool')
+        lines.append(f"        out[i, {col}] = _f{col}(p)")
+
+    exec(compile("\n".join(lines) + "\n", "<erb-bool-batch>", "exec"), namespace)
+    runner = njit(namespace['_batch'])
+    _bool_batch_cache[key] = runner
+    return runner
+
+
+def read_string_result(result) -> str:
+    """Decode a (ptr, len) string result returned by the assembly."""
+    ptr, length = result.ptr, result.len
+    if not ptr or not length:
         return ""
 
+    # Read exactly 'len' bytes from the pointer: one copy into bytes, then
+    # the decode. Failures surface as warnings in process_records.
+    return ctypes.string_at(ptr, length).decode('utf-8', errors='replace')
 
-def call_bool_function(lib: ctypes.CDLL, func_name: str, struct_ptr: int) -> bool:
-    """Call a bool-returning function."""
-    func = getattr(lib, func_name)
-    func.argtypes = [ctypes.c_void_p]
-    func.restype = ctypes.c_int
 
-    result = func(struct_ptr)
-    return bool(result)
+def call_string_function(func, struct_ptr: int) -> str:
+    """
+    Call a string-returning function.
 
+    The ARM64 assembly returns ptr in x0, len in x1.
+    The StringResult return type captures both values.
+    """
+    return read_string_result(func(struct_ptr))
 
-def call_int_function(lib: ctypes.CDLL, func_name: str, struct_ptr: int) -> int:
-    """Call an int-returning function."""
-    func = getattr(lib, func_name)
-    func.argtypes = [ctypes.c_void_p]
-    func.restype = ctypes.c_int64
 
-    result = func(struct_ptr)
-    return int(result)
+def call_bool_function(func, struct_ptr: int) -> bool:
+    """Call a bool-returning function."""
+    return bool(func(struct_ptr))
+
+
+def call_int_function(func, struct_ptr: int) -> int:
+    """Call an int-returning function."""
+    return int(func(struct_ptr))
 
 
 # =============================================================================
@@ -279,9 +477,9 @@ def discover_calculated_fields(rulebook: dict, entity_name: str) -> dict:
     entity_snake = to_snake_case(entity_name)
     result = {}
 
-    for field in calc_fields:
-        field_name = to_snake_case(field['name'])
-        datatype = field.get('datatype', 'string').lower()
+    for calc_field in calc_fields:
+        field_name = to_snake_case(calc_field['name'])
+        datatype = calc_field.get('datatype', 'string').lower()
 
         # Map datatype to return type
         if datatype == 'boolean':
@@ -302,47 +500,244 @@ def discover_calculated_fields(rulebook: dict, entity_name: str) -> dict:
 # CORE PROCESSING FUNCTION
 # =============================================================================
 
+# Records per eval_all_batch call; bounds the string arena to a few MB
+BATCH_ROWS = 256
+
+
+def resolve_eval_all(lib: ctypes.CDLL, entity_snake: str) -> Optional[tuple]:
+    """
+    Look up the combined eval_all_<entity>(TestAnswer*, Output*) entry point.
+
+    It fills one 16-byte output slot per compiled field (see
+    inject-into-binary.py); the slot order is exported alongside it as the
+    comma-separated eval_all_<entity>_fields string. Returns
+    (func, field_names, batch_func), or None for libraries built without it.
+    batch_func is eval_all_batch_<entity>, or None if the library predates it.
+    """
+    func_name = f"eval_all_{entity_snake}"
+    try:
+        func = getattr(lib, func_name)
+        fields_sym = ctypes.c_char.in_dll(lib, f"{func_name}_fields")
+    except (AttributeError, ValueError):
+        return None
+
+    func.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    func.restype = None
+    field_names = ctypes.string_at(ctypes.addressof(fields_sym)).decode('utf-8').split(',')
+
+    # (TestAnswer**, Output*, char* arena, size_t n, size_t arena_stride)
+    batch_func = getattr(lib, f"eval_all_batch_{entity_snake}", None)
+    if batch_func is not None:
+        batch_func.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+                               ctypes.c_size_t, ctypes.c_size_t]
+        batch_func.restype = None
+    return func, field_names, batch_func
+
+
+def serialize_calls(read, lock: Optional[threading.Lock] = None):
+    """Wrap an evaluator reader so only one thread runs it at a time.
+
+    Generated evaluators build concatenations in a static per-function
+    result buffer, so the same function must not run concurrently; the lock
+    covers the call and the copy out of that buffer. Readers that drive the
+    same evaluators pass a shared lock.
+    """
+    if lock is None:
+        lock = threading.Lock()
+
+    def locked_read(struct_ptr):
+        with lock:
+            return read(struct_ptr)
+
+    return locked_read
+
+
 def process_records(data: List[dict], lib: ctypes.CDLL, schema: Dict[str, FieldInfo],
-                    struct_size: int, available_funcs: dict) -> List[dict]:
+                    struct_size: int, available_funcs: dict,
+                    packer=None, threads: int = 1,
+                    eval_all: Optional[tuple] = None) -> List[dict]:
     """Process a list of records and compute calculated fields.
 
     Uses multiple passes to handle dependencies between computed fields.
-    Each pass re-packs the struct with latest computed values.
-    """
-    # Keep all string tables alive for the duration
-    all_string_tables = []
+    Every record is packed into its own row of one contiguous block; each
+    pass re-packs the unsettled records with their latest computed values,
+    and a record drops out once a pass leaves it unchanged.
 
-    for i, record in enumerate(data):
-        try:
-            # Multiple passes to resolve dependencies between computed fields
-            max_passes = 5
-            for pass_num in range(max_passes):
-                # Create string table for this pass (keep reference alive)
-                string_table = StringTable()
-                all_string_tables.append(string_table)
+    With Numba available, the bool evaluators for a pass run over the whole
+    batch in one compiled loop; everything else is called per record.
 
-                # Pack record to struct bytes (includes previously computed values)
-                struct_bytes = pack_test_answer(record, schema, struct_size, string_table)
+    available_funcs is the resolved {field_name: (func_name, func, ret_type)}
+    from resolve_functions.
 
-                # Create ctypes buffer from bytes
-                struct_buf = ctypes.create_string_buffer(struct_bytes, struct_size)
-                struct_ptr = ctypes.addressof(struct_buf)
+    packer is an optional specialized packer from build_packer; without one
+    the generic pack_test_answer is used.
+
+    threads > 1 splits the records into that many chunks run on a thread
+    pool. The FFI calls release the GIL, so different evaluators run in
+    parallel; each individual evaluator is serialized (see serialize_calls).
+
+    eval_all is an optional (func, field_names, batch_func) from
+    resolve_eval_all. The fields it covers are computed with a single call
+    per record - or, with batch_func, a single call per BATCH_ROWS records;
+    any others fall back to the paths above.
+    """
+    if packer is None:
+        pack_map = build_pack_map(schema)
+
+        def packer(record, buf, string_table):
+            pack_test_answer(record, pack_map, buf, string_table)
+
+    # One string table for the whole batch, alive until processing ends, so
+    # values repeated across records and passes share a buffer
+    string_table = StringTable()
+
+    # One allocation for all struct rows; evaluators only read them
+    count = len(data)
+    block = (ctypes.c_ubyte * (count * struct_size))()
+    base = ctypes.addressof(block)
+    row_type = ctypes.c_ubyte * struct_size
+    rows = [row_type.from_buffer(block, i * struct_size) for i in range(count)]
+
+    # With a combined entry point, one call per record fills every slot
+    read_all = None
+    read_batch = None
+    eval_all_fields = []
+    if eval_all is not None:
+        eval_all_func, slot_names, eval_all_batch = eval_all
+        slot_readers = {'bool': lambda slot: bool(slot.ptr),
+                        'int': lambda slot: ctypes.c_int64(slot.ptr).value}
+        slot_reads = []
+        for slot, field_name in enumerate(slot_names):
+            if field_name in available_funcs:
+                ret_type = available_funcs[field_name][2]
+                eval_all_fields.append(field_name)
+                slot_reads.append((slot, slot_readers.get(ret_type, read_string_result)))
+
+        out = (StringResult * len(slot_names))()
+        out_ptr = ctypes.addressof(out)
+
+        def read_all(struct_ptr):
+            eval_all_func(struct_ptr, out_ptr)
+            return [read(out[slot]) for slot, read in slot_reads]
+
+        # The batch entry point copies every STRING slot into the arena, so
+        # it needs to know all slot types up front
+        if eval_all_batch is not None and len(slot_reads) == len(slot_names):
+            n_slots = len(slot_names)
+            n_strings = sum(1 for _, read in slot_reads if read is read_string_result)
+
+            def read_batch(struct_ptrs):
+                n = len(struct_ptrs)
+                # Results never outgrow the 1KB concat buffers or the
+                # longest input string they pass through
+                stride = max(1024, string_table.max_len)
+                rows_out = (StringResult * (n * n_slots))()
+                arena = (ctypes.c_char * max(1, n * n_strings * stride))()
+                ptrs = (ctypes.c_uint64 * n)(*struct_ptrs)
+                eval_all_batch(ptrs, rows_out, arena, n, stride)
+                return [[read(rows_out[row * n_slots + slot]) for slot, read in slot_reads]
+                        for row in range(n)]
+
+        if threads > 1:
+            # Both entry points run the same static-buffer evaluators, and a
+            # failed batch falls back to read_all: one lock covers the pair
+            eval_all_lock = threading.Lock()
+            read_all = serialize_calls(read_all, eval_all_lock)
+            if read_batch is not None:
+                read_batch = serialize_calls(read_batch, eval_all_lock)
+
+    covered = set(eval_all_fields)
+    batch_fields = []
+    if NUMBA_AVAILABLE:
+        batch_fields = [(field_name, func_name)
+                        for field_name, (func_name, func, ret_type) in available_funcs.items()
+                        if ret_type == 'bool' and field_name not in covered]
+    runner = build_bool_batch(lib, [func_name for _, func_name in batch_fields]) if batch_fields else None
+
+    # Per-call readers returning the Python value for one struct
+    readers = {'bool': call_bool_function, 'int': call_int_function}
+    call_funcs = []
+    for field_name, (func_name, func, ret_type) in available_funcs.items():
+        if field_name in covered or (runner is not None and ret_type == 'bool'):
+            continue
+        read = partial(readers.get(ret_type, call_string_function), func)
+        if threads > 1:
+            read = serialize_calls(read)
+        call_funcs.append((field_name, func_name, read))
+
+    def run_chunk(indices):
+        pending = list(indices)
+        max_passes = 5
+        for pass_num in range(max_passes):
+            # Pack every unsettled record (includes previously computed values)
+            packed = []
+            mark_packed = packed.append
+            for i in pending:
+                try:
+                    packer(data[i], rows[i], string_table)
+                    mark_packed(i)
+                except Exception as e:
+                    print(f"ERROR processing record {i}: {e}")
+                    import traceback
+                    traceback.print_exc()
+
+            batch_results = None
+            if read_batch is not None:
+                try:
+                    batch_results = []
+                    for start in range(0, len(packed), BATCH_ROWS):
+                        batch_results.extend(read_batch(
+                            [base + i * struct_size for i in packed[start:start + BATCH_ROWS]]))
+                except Exception as e:
+                    print(f"  Warning: Error calling eval_all_batch, falling back per record: {e}")
+                    batch_results = None
+
+            if runner is not None:
+                ptrs = np.array([base + i * struct_size for i in packed], dtype=np.uint64)
+                flags = np.zeros((len(packed), len(batch_fields)), dtype=np.int32)
+                runner(ptrs, flags)
+                flag_rows = flags.tolist()
+
+            pending = []
+            mark_pending = pending.append
+            for row, i in enumerate(packed):
+                record = data[i]
+                get = record.get  # bound once; used for every field below
+                struct_ptr = base + i * struct_size
 
                 # Track if any values changed this pass
                 changes = False
 
-                # Call each available function
-                for field_name, (func_name, ret_type) in available_funcs.items():
+                if batch_results is not None:
+                    for field_name, result in zip(eval_all_fields, batch_results[row]):
+                        if get(field_name) != result:
+                            changes = True
+                            record[field_name] = result
+                elif read_all is not None:
+                    try:
+                        for field_name, result in zip(eval_all_fields, read_all(struct_ptr)):
+                            if get(field_name) != result:
+                                changes = True
+                                record[field_name] = result
+                    except Exception as e:
+                        print(f"  Warning: Error calling eval_all for record {i}: {e}")
+                        import traceback
+                        traceback.print_exc()
+
+                if runner is not None:
+                    for col, (field_name, func_name) in enumerate(batch_fields):
+                        result = bool(flag_rows[row][col])
+                        if get(field_name) != result:
+                            changes = True
+                            record[field_name] = result
+
+                # Call each remaining function
+                for field_name, func_name, read in call_funcs:
                     try:
-                        if ret_type == 'bool':
-                            result = call_bool_function(lib, func_name, struct_ptr)
-                        elif ret_type == 'int':
-                            result = call_int_function(lib, func_name, struct_ptr)
-                        else:  # string
-                            result = call_string_function(lib, func_name, struct_ptr)
+                        result = read(struct_ptr)
 
                         # Check if value changed
-                        if record.get(field_name) != result:
+                        if get(field_name) != result:
                             changes = True
                             record[field_name] = result
                     except Exception as e:
@@ -350,15 +745,23 @@ def process_records(data: List[dict], lib: ctypes.CDLL, schema: Dict[str, FieldI
                         import traceback
                         traceback.print_exc()
 
-                # If no changes, we've reached a fixed point
-                if not changes:
-                    break
+                if changes:
+                    mark_pending(i)
 
-        except Exception as e:
-            print(f"ERROR processing record {i}: {e}")
-            import traceback
-            traceback.print_exc()
-            continue
+            # Stop once every record has reached a fixed point
+            if not pending:
+                break
+
+    if threads > 1 and count > 1:
+        # Records are independent and own disjoint rows, so chunks only
+        # share the string table and the (serialized) evaluators
+        chunk_size = -(-count // threads)
+        chunks = [range(start, min(start + chunk_size, count))
+                  for start in range(0, count, chunk_size)]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            list(pool.map(run_chunk, chunks))
+    else:
+        run_chunk(range(count))
 
     return data
 
@@ -389,8 +792,110 @@ def load_binary_library(script_dir: Path) -> tuple:
 # MULTI-ENTITY MODE
 # =============================================================================
 
-def run_multi_entity(script_dir: Path):
-    """Process all entity files from shared testing/blank-tests/ directory."""
+@lru_cache(maxsize=None)
+def load_entity_context(script_dir: Path) -> tuple:
+    """Load (lib, lib_path, rulebook, entities) once per process."""
+    lib, lib_path = load_binary_library(script_dir)
+    rulebook = load_rulebook()
+    return lib, lib_path, rulebook, discover_entities(rulebook)
+
+
+def process_entity(input_path: Path, test_answers_dir: Path, script_dir: Path,
+                   threads: int = 1) -> tuple:
+    """
+    Process one blank-test entity file into test-answers/.
+
+    Safe to run in a worker process: the library and rulebook are loaded
+    per process (ctypes handles cannot be pickled), and console output is
+    captured so the parent can print it in file order.
+
+    Returns (record_count, output); record_count is None when the file was
+    copied without being processed.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        record_count = _process_entity(input_path, test_answers_dir, script_dir, threads)
+    return record_count, output.getvalue()
+
+
+def _process_entity(input_path: Path, test_answers_dir: Path, script_dir: Path,
+                    threads: int) -> Optional[int]:
+    lib, lib_path, rulebook, entities = load_entity_context(script_dir)
+
+    filename = input_path.name
+    entity = filename.replace('.json', '')
+    output_path = test_answers_dir / filename
+
+    # Find matching rulebook entity (case-insensitive)
+    rulebook_entity = None
+    for e in entities:
+        if to_snake_case(e) == entity:
+            rulebook_entity = e
+            break
+
+    if not rulebook_entity:
+        print(f"  -> {entity}: No matching entity in rulebook, copying as-is")
+        write_json(read_json(input_path), output_path)
+        return None
+
+    # Build schema for this entity
+    columns = get_entity_schema(rulebook, rulebook_entity)
+    schema, struct_size = build_schema(columns)
+    print(f"  Schema for {entity}: {len(schema)} fields, {struct_size} bytes")
+
+    # Discover calculated fields for this entity
+    calc_fields = discover_calculated_fields(rulebook, rulebook_entity)
+
+    # Resolve available functions once; the record loop calls them directly
+    available_funcs = resolve_functions(lib, calc_fields)
+    for field_name, (func_name, ret_type) in calc_fields.items():
+        if field_name in available_funcs:
+            print(f"    Found: {func_name} -> {ret_type}")
+        else:
+            print(f"    Missing: {func_name}")
+
+    if not available_funcs:
+        print(f"  -> {entity}: No assembly functions available, copying blank test")
+        write_json(read_json(input_path), output_path)
+        return None
+
+    # Load input data
+    data = read_json(input_path)
+
+    if not data:
+        # Copy empty arrays as-is
+        write_json(data, output_path)
+        print(f"  -> {entity}: 0 records (empty)")
+        return None
+
+    # Specialize the packer once for this entity's layout
+    packer = build_packer(schema, struct_size)
+
+    # Prefer the combined entry point when the library provides one
+    eval_all = resolve_eval_all(lib, entity)
+    if eval_all is not None:
+        print(f"    Found: eval_all_{entity} -> {len(eval_all[1])} fields")
+        if eval_all[2] is not None:
+            print(f"    Found: eval_all_batch_{entity}")
+
+    # Process records using entity-specific schema and functions
+    processed = process_records(data, lib, schema, struct_size, available_funcs,
+                                packer=packer, threads=threads, eval_all=eval_all)
+
+    # Save results
+    write_json(processed, output_path)
+
+    print(f"  -> {entity}: {len(processed)} records")
+    return len(processed)
+
+
+def run_multi_entity(script_dir: Path, workers: Optional[int] = None, threads: int = 1):
+    """Process all entity files from shared testing/blank-tests/ directory.
+
+    Entity files are independent, so they are spread across up to `workers`
+    processes (default: CPU count). workers=1 processes them in-process.
+    threads is passed to process_records for each entity.
+    """
     # Use shared blank-tests directory at project root
     project_root = script_dir.parent.parent
     blank_tests_dir = project_root / "testing" / "blank-tests"
@@ -408,98 +913,36 @@ def run_multi_entity(script_dir: Path):
     print("=" * 70)
     print()
 
-    # Load library
-    lib, lib_path = load_binary_library(script_dir)
-    print(f"Loaded library: {lib_path}")
-
-    # Load rulebook to get schemas
+    # Load library and rulebook (validates both before any workers start)
     print("Loading rulebook...")
     try:
-        rulebook = load_rulebook()
+        lib, lib_path, rulebook, entities = load_entity_context(script_dir)
     except FileNotFoundError as e:
         print(f"ERROR: {e}")
         sys.exit(1)
-
-    # Discover all entities
-    entities = discover_entities(rulebook)
+    print(f"Loaded library: {lib_path}")
     print(f"Discovered {len(entities)} entities: {', '.join(entities)}")
 
     # Process each entity file (skip metadata files starting with _)
-    total_records = 0
-    entity_count = 0
-
-    for input_path in sorted(glob_module.glob(str(blank_tests_dir / "*.json"))):
-        filename = os.path.basename(input_path)
-
-        # Skip metadata files
-        if filename.startswith('_'):
-            continue
-
-        entity = filename.replace('.json', '')
-        output_path = test_answers_dir / filename
-
-        # Find matching rulebook entity (case-insensitive)
-        rulebook_entity = None
-        for e in entities:
-            if to_snake_case(e) == entity:
-                rulebook_entity = e
-                break
-
-        if not rulebook_entity:
-            print(f"  -> {entity}: No matching entity in rulebook, copying as-is")
-            with open(input_path, 'r') as f:
-                data = json.load(f)
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            continue
+    entity_files = sorted(p for p in blank_tests_dir.iterdir()
+                          if p.suffix == '.json' and not p.name.startswith('_'))
 
-        # Build schema for this entity
-        columns = get_entity_schema(rulebook, rulebook_entity)
-        schema, struct_size = build_schema(columns)
-        print(f"  Schema for {entity}: {len(schema)} fields, {struct_size} bytes")
-
-        # Discover calculated fields for this entity
-        calc_fields = discover_calculated_fields(rulebook, rulebook_entity)
-
-        # Get available functions for this entity
-        available_funcs = {}
-        for field_name, (func_name, ret_type) in calc_fields.items():
-            try:
-                func = getattr(lib, func_name)
-                available_funcs[field_name] = (func_name, ret_type)
-                print(f"    Found: {func_name} -> {ret_type}")
-            except AttributeError:
-                print(f"    Missing: {func_name}")
-
-        if not available_funcs:
-            print(f"  -> {entity}: No assembly functions available, copying blank test")
-            with open(input_path, 'r') as f:
-                data = json.load(f)
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            continue
-
-        # Load input data
-        with open(input_path, 'r') as f:
-            data = json.load(f)
-
-        if not data:
-            # Copy empty arrays as-is
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2)
-            print(f"  -> {entity}: 0 records (empty)")
-            continue
-
-        # Process records using entity-specific schema and functions
-        processed = process_records(data, lib, schema, struct_size, available_funcs)
-
-        # Save results
-        with open(output_path, 'w') as f:
-            json.dump(processed, f, indent=2)
+    workers = min(workers or os.cpu_count() or 1, len(entity_files)) or 1
+    if workers == 1:
+        results = [process_entity(p, test_answers_dir, script_dir, threads) for p in entity_files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(process_entity, entity_files,
+                                    repeat(test_answers_dir), repeat(script_dir),
+                                    repeat(threads)))
 
-        total_records += len(processed)
-        entity_count += 1
-        print(f"  -> {entity}: {len(processed)} records")
+    total_records = 0
+    entity_count = 0
+    for record_count, output in results:
+        print(output, end='')
+        if record_count is not None:
+            total_records += record_count
+            entity_count += 1
 
     print(f"\nBinary substrate: Processed {entity_count} entities, {total_records} total records")
     print("=" * 70)
@@ -546,14 +989,13 @@ def run_legacy(script_dir: Path):
         print(f"ERROR: Test file not found: {test_file}")
         sys.exit(1)
 
-    with open(test_file, "r") as f:
-        data = json.load(f)
+    data = read_json(test_file)
     print(f"Loaded {len(data)} records")
 
     # Get available functions
     print("\nVerifying assembly functions...")
-    available_funcs = get_available_functions(lib)
-    for field_name, (func_name, ret_type) in available_funcs.items():
+    available_funcs = resolve_functions(lib, discover_calculated_fields(rulebook, entity_name))
+    for field_name, (func_name, func, ret_type) in available_funcs.items():
         print(f"  Found: {func_name} -> {ret_type}")
 
     if not available_funcs:
@@ -566,8 +1008,7 @@ def run_legacy(script_dir: Path):
 
     # Save results
     print(f"\nSaving results to: {test_file}")
-    with open(test_file, "w") as f:
-        json.dump(processed, f, indent=2)
+    write_json(processed, test_file)
 
     print("\nTest execution complete!")
     print("=" * 70)
@@ -578,8 +1019,15 @@ def run_legacy(script_dir: Path):
 # =============================================================================
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the binary substrate test")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for entity files (default: CPU count; 1 runs in-process)")
+    parser.add_argument('--threads', type=int, default=1,
+                        help="Threads per entity for record evaluation (default: 1)")
+    args = parser.parse_args()
+
     script_dir = Path(__file__).resolve().parent
-    run_multi_entity(script_dir)
+    run_multi_entity(script_dir, workers=args.workers, threads=args.threads)
 
 
 if __name__ == "__main__":
@@ -11,20 +11,62 @@ all the information needed to populate test answers.
 """
 
 import csv
-import json
-import re
+import io
+import os
+import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
+# Add project root to path for shared imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-def to_snake_case(name):
-    """Convert PascalCase or camelCase to snake_case.
+from orchestration.shared import read_json, write_json_records
 
-    Also handles fields with existing underscores: Bio_HockettScore -> bio_hockett_score
-    """
-    # Use [^_] to avoid doubling underscores when input already has them
-    s1 = re.sub('([^_])([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+# pyarrow's multi-threaded reader, else pandas' C parser, tokenizes large
+# CSVs much faster than the csv module; without either the csv module is used
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Numba scans pyarrow's raw string buffers to type all-integer and
+# all-boolean columns in one native pass. The kernel compiles on first use
+# (~0.7s), so it only pays off for columns of at least NUMBA_MIN_ROWS rows:
+# an integer plus a boolean column convert in 1.15s instead of 1.47s at
+# 750k rows and 1.5s instead of 5.6s at 2M, but still lose at 500k
+# (0.9s vs 0.7s)
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+NUMBA_MIN_ROWS = 750_000
+
+
+_BOOL_MAP = {
+    'true': True, 'True': True, 'TRUE': True,
+    'false': False, 'False': False, 'FALSE': False,
+}
+
+# Characters an int()/float() string can start with (int and float also skip
+# leading whitespace and accept non-ASCII digits, which are always tried)
+_NUMERIC_LEADS = frozenset('+-0123456789. \t\n\r\f\v')
+
+# Text values up to this length are interned: short values (labels,
+# categories) repeat across rows and columns, long free text rarely does
+_INTERN_MAX_LEN = 64
 
 
 def convert_csv_value(value, field_name=None):
@@ -32,21 +74,207 @@ def convert_csv_value(value, field_name=None):
     if value is None or value == '':
         return None
 
-    # Handle boolean strings
-    if value.lower() == 'true':
-        return True
-    elif value.lower() == 'false':
-        return False
+    # Handle boolean strings: the usual spellings in one lookup, other
+    # casings (e.g. 'tRUE') via a single lower()
+    boolean = _BOOL_MAP.get(value)
+    if boolean is not None:
+        return boolean
+    if len(value) in (4, 5):
+        boolean = _BOOL_MAP.get(value.lower())
+        if boolean is not None:
+            return boolean
+
+    # Try numeric conversion, unless the first character rules it out (most
+    # cells are text, and a failed parse raises)
+    c0 = value[0]
+    if c0 in _NUMERIC_LEADS or not c0.isascii():
+        try:
+            if '.' in value:
+                return float(value)
+            return int(value)
+        except (ValueError, TypeError):
+            pass
+
+    if len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
 
-    # Try numeric conversion
-    try:
-        if '.' in value:
-            return float(value)
-        return int(value)
-    except (ValueError, TypeError):
-        pass
 
-    return value
+# Cell kinds reported by _scan_cells
+_CELL_EMPTY, _CELL_INT, _CELL_TRUE, _CELL_FALSE, _CELL_OTHER = range(5)
+
+if NUMBA_AVAILABLE:
+    # No cache=True: numba's on-disk cache records the defining module's
+    # name, which differs between running this script and importing it
+    @njit
+    def _scan_cells(data, offsets, ints):
+        """Classify each UTF-8 cell of a string column, parsing integers.
+
+        Only forms whose convert_csv_value result is certain are recognized:
+        '', ASCII any-case true/false, and -?[0-9]{1,18}. Everything else
+        is _CELL_OTHER and left to Python.
+        """
+        n = len(offsets) - 1
+        kinds = np.empty(n, np.uint8)
+        true_bytes = np.array([116, 114, 117, 101], np.uint8)
+        false_bytes = np.array([102, 97, 108, 115, 101], np.uint8)
+        for i in range(n):
+            start = offsets[i]
+            end = offsets[i + 1]
+            length = end - start
+            if length == 0:
+                kinds[i] = _CELL_EMPTY
+                continue
+
+            if length == 4 or length == 5:
+                target = true_bytes if length == 4 else false_bytes
+                match = True
+                for j in range(length):
+                    c = data[start + j]
+                    if 65 <= c <= 90:
+                        c += 32
+                    if c != target[j]:
+                        match = False
+                        break
+                if match:
+                    kinds[i] = _CELL_TRUE if length == 4 else _CELL_FALSE
+                    continue
+
+            j = start
+            negative = data[j] == 45
+            if negative:
+                j += 1
+            if j == end or end - j > 18:
+                kinds[i] = _CELL_OTHER
+                continue
+            value = 0
+            kinds[i] = _CELL_INT
+            while j < end:
+                c = data[j]
+                if c < 48 or c > 57:
+                    kinds[i] = _CELL_OTHER
+                    break
+                value = value * 10 + (c - 48)
+                j += 1
+            ints[i] = -value if negative else value
+        return kinds
+
+
+def convert_column_numba(array):
+    """Convert an all-integer or all-boolean pyarrow string column natively.
+
+    Returns the converted list, or None when the column holds anything else
+    (it then goes through convert_csv_value).
+    """
+    n = len(array)
+    _, offsets_buf, data_buf = array.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int32)[array.offset:array.offset + n + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf else np.zeros(0, np.uint8)
+    ints = np.zeros(n, np.int64)
+    kinds = _scan_cells(data, offsets, ints)
+
+    present = set(np.unique(kinds).tolist())
+    if _CELL_OTHER in present or (_CELL_INT in present and len(present - {_CELL_EMPTY}) > 1):
+        return None
+    if _CELL_INT in present:
+        values = ints.tolist()
+    else:
+        values = (kinds == _CELL_TRUE).tolist()
+    if _CELL_EMPTY in present:
+        values = [None if kind == _CELL_EMPTY else value
+                  for kind, value in zip(kinds.tolist(), values)]
+    return values
+
+
+def convert_column(column):
+    """Convert one column of raw CSV strings (a list or pyarrow StringArray)."""
+    if PYARROW_AVAILABLE and isinstance(column, pa.Array):
+        if NUMBA_AVAILABLE and not column.null_count and len(column) >= NUMBA_MIN_ROWS:
+            values = convert_column_numba(column)
+            if values is not None:
+                return values
+        column = column.to_pylist()
+
+    # Columns repeat a few values (booleans, categories): convert each
+    # distinct value once
+    distinct = set(column)
+    values = dict(zip(distinct, map(convert_csv_value, distinct)))
+    return list(map(values.__getitem__, column))
+
+
+def read_csv_columns_pyarrow(csv_path):
+    """Read a CSV with pyarrow as (headers, StringArray columns)."""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        headers = next(csv.reader(f), None)
+    if not headers:
+        raise ValueError("No header row")
+
+    # Positional names and string columns: no pyarrow type inference, and
+    # duplicate headers stay distinct columns
+    names = [f'c{i}' for i in range(len(headers))]
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(column_names=names, skip_rows=1),
+        convert_options=pacsv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            null_values=[], strings_can_be_null=False,
+        ),
+    )
+    return headers, [table.column(i).combine_chunks() for i in range(len(names))]
+
+
+def read_csv_columns_pandas(csv_path):
+    """Read a CSV with pandas as (headers, columns of raw strings)."""
+    # header=None keeps duplicate header names as-is (no 'x.1')
+    df = pd.read_csv(csv_path, header=None, dtype=object, encoding='utf-8',
+                     keep_default_na=False, na_filter=False)
+    columns = [df[col].tolist() for col in df.columns]
+    return [column[0] for column in columns], [column[1:] for column in columns]
+
+
+def read_csv_rows(csv_path):
+    """Parse a CSV file into (headers, rows of converted values).
+
+    Uses pyarrow or pandas when available, reading every cell as text so
+    convert_csv_value decides the types exactly as the csv module path
+    does (their own inference would e.g. turn an int column with blanks
+    into floats). Short rows are padded with None; blank lines are skipped.
+    """
+    readers = []
+    if PYARROW_AVAILABLE:
+        readers.append(read_csv_columns_pyarrow)
+    if PANDAS_AVAILABLE:
+        readers.append(read_csv_columns_pandas)
+
+    for read_columns in readers:
+        try:
+            headers, columns = read_columns(csv_path)
+        except ValueError:
+            continue  # Empty file or ragged rows: try the next reader
+
+        return headers, list(zip(*map(convert_column, columns)))
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        # Plain csv.reader + zip: DictReader builds each row dict in Python
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        if headers is None:
+            return [], []
+        padding = [None] * len(headers)
+
+        rows = []
+        for row in reader:
+            if not row:
+                continue  # Blank line (DictReader skips these too)
+
+            # Convert all values to appropriate types; short rows are padded
+            # with None like DictReader's restval
+            converted = [convert_csv_value(value) for value in row]
+            if len(converted) < len(headers):
+                converted += padding[len(converted):]
+            rows.append(converted)
+
+    return headers, rows
 
 
 def load_csv_as_lookup(csv_path, pk_field):
@@ -57,41 +285,75 @@ def load_csv_as_lookup(csv_path, pk_field):
         pk_field: Name of the primary key field (snake_case)
 
     Returns:
-        Dict mapping primary key values to row dicts
+        (headers_index, lookup): headers_index maps each field name to its
+        column index (the last column wins for duplicate headers), and
+        lookup maps primary key values to row tuples indexed by it
     """
+    headers, rows = read_csv_rows(csv_path)
+    headers_index = {header: i for i, header in enumerate(headers)}
+
+    # Rows are kept as the reader's tuples; no per-row dict is built
+    pk_index = headers_index.get(pk_field)
+    if pk_index is None:
+        return headers_index, {}
+
     lookup = {}
+    for row in rows:
+        pk_value = row[pk_index]
+        if pk_value is not None:
+            lookup[pk_value] = row
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    return headers_index, lookup
 
-        for row in reader:
-            # Convert all values to appropriate types
-            converted_row = {}
-            for field_name, value in row.items():
-                converted_row[field_name] = convert_csv_value(value, field_name)
 
-            # Get primary key value
-            pk_value = converted_row.get(pk_field)
-            if pk_value is not None:
-                lookup[pk_value] = converted_row
+def fill_nulls(answers, headers_index, csv_lookup, pk_field, fields):
+    """Fill None answer fields from the matching CSV row, in place.
+
+    fields must all be in headers_index. Returns (fields_filled, records_updated).
+    """
+    fields_filled = 0
+    records_updated = 0
+    columns = [(field, headers_index[field]) for field in fields]
+
+    # Bound methods hoisted out of the record x field loop
+    lookup_get = csv_lookup.get
+    for answer in answers:
+        answer_get = answer.get
+        csv_row = lookup_get(answer_get(pk_field))  # the lookup has no None key
+        if csv_row is None:
+            continue
+
+        filled_before = fields_filled
+        for field, idx in columns:
+            if answer_get(field) is None:
+                value = csv_row[idx]
+                if value is not None:
+                    answer[field] = value
+                    fields_filled += 1
+
+        if fields_filled != filled_before:
+            records_updated += 1
+
+    return fields_filled, records_updated
+
 
-    return lookup
+class EmptyBlankTestError(Exception):
+    """A blank test has no records; the run stops with exit status 1."""
 
 
-def fill_null_fields_from_csv(csv_path, answers_path):
-    """Read test-answers.json and fill null fields from CSV values.
+def fill_null_fields_from_csv(csv_path, blank_path, out_path):
+    """Read a blank test and write it to out_path with null fields filled from CSV values.
 
     Args:
         csv_path: Path to the .csv file
-        answers_path: Path to test-answers.json
+        blank_path: Path to the blank test JSON to read
+        out_path: Path to write the filled test answers to
     """
-    # Load test answers
-    with open(answers_path, 'r', encoding='utf-8') as f:
-        answers = json.load(f)
+    # Load test answers (orjson when available)
+    answers = read_json(blank_path)
 
     if not answers:
-        print("Error: test-answers.json is empty")
-        sys.exit(1)
+        raise EmptyBlankTestError("blank test is empty")
 
     json_fields = list(answers[0].keys())
     print(f"Found {len(json_fields)} fields in test answers")
@@ -101,77 +363,117 @@ def fill_null_fields_from_csv(csv_path, answers_path):
     print(f"Primary key field: {pk_field}")
 
     # Load CSV as lookup
-    csv_lookup = load_csv_as_lookup(csv_path, pk_field)
+    headers_index, csv_lookup = load_csv_as_lookup(csv_path, pk_field)
     print(f"Loaded {len(csv_lookup)} rows from CSV")
 
+    # Only fields the CSV also has can be filled
+    common_fields = tuple(f for f in json_fields if f in headers_index)
+
     # Fill null fields
-    fields_filled = 0
-    records_updated = 0
+    # A plain loop: a pandas mask/fill version measured ~9x slower on 99k
+    # records and a NumPy object-column np.where version ~5x slower on 100k,
+    # as moving the values between dicts and arrays costs more than the fill
+    fields_filled, records_updated = fill_nulls(answers, headers_index, csv_lookup, pk_field, common_fields)
 
-    for answer in answers:
-        pk_value = answer.get(pk_field)
-        if pk_value is None or pk_value not in csv_lookup:
-            continue
+    print(f"Filled {fields_filled} null fields across {records_updated} records")
 
-        csv_row = csv_lookup[pk_value]
-        record_updated = False
+    # Write updated answers, streamed record by record
+    write_json_records(answers, out_path)
 
-        for field in json_fields:
-            if answer.get(field) is None and csv_row.get(field) is not None:
-                answer[field] = csv_row[field]
-                fields_filled += 1
-                record_updated = True
+    print(f"Updated {out_path}")
 
-        if record_updated:
-            records_updated += 1
 
-    print(f"Filled {fields_filled} null fields across {records_updated} records")
+# csv_path -> frozenset of its header names, read once per process
+_HEADER_CACHE = {}
 
-    # Write updated answers
-    with open(answers_path, 'w', encoding='utf-8') as f:
-        json.dump(answers, f, indent=2)
 
-    print(f"Updated {answers_path}")
+def read_csv_headers(csv_path):
+    """Header names of a CSV as a frozenset, cached per path."""
+    headers = _HEADER_CACHE.get(csv_path)
+    if headers is None:
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            headers = frozenset(next(csv.reader(f), []))
+        _HEADER_CACHE[csv_path] = headers
+    return headers
 
 
-def find_csv_for_entity(script_dir, entity):
-    """Find CSV file for an entity in test-data/ directory."""
-    test_data_dir = script_dir / 'test-data'
+def index_csv_files(test_data_dir):
+    """Map lowercase filename -> path for the entity CSVs in test-data/."""
+    if not test_data_dir.is_dir():
+        return {}
+    with os.scandir(test_data_dir) as entries:
+        return {
+            entry.name.lower(): Path(entry.path)
+            for entry in entries
+            if entry.name.endswith('.csv') and not entry.name.startswith('_')
+        }
 
-    # Try exact match first
-    csv_path = test_data_dir / f'{entity}.csv'
-    if csv_path.exists():
-        return csv_path
 
-    # Try with _ to - conversion
-    csv_path = test_data_dir / f'{entity.replace("_", "-")}.csv'
-    if csv_path.exists():
-        return csv_path
+def find_csv_for_entity(csv_by_name, entity):
+    """Find CSV file for an entity in the test-data/ index from index_csv_files."""
+    # Try exact match first, then with _ to - conversion
+    for name in (f'{entity}.csv', f'{entity.replace("_", "-")}.csv'):
+        csv_path = csv_by_name.get(name.lower())
+        if csv_path is not None:
+            return csv_path
 
     # Try all csv files and match by content
-    if test_data_dir.exists():
-        for csv_file in test_data_dir.glob('*.csv'):
-            if csv_file.name.startswith('_'):
-                continue
-            # Check if this might be the right CSV by looking at headers
-            try:
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    headers = next(reader, [])
-                    # If entity pk field exists in headers, this is likely the file
-                    pk_field = f'{entity.rstrip("s")}_id'  # Simple singularize
-                    if pk_field in headers:
-                        return csv_file
-            except:
-                pass
+    # If entity pk field exists in headers, this is likely the file
+    pk_field = f'{entity.rstrip("s")}_id'  # Simple singularize
+    for csv_file in csv_by_name.values():
+        # Check if this might be the right CSV by looking at headers
+        try:
+            if pk_field in read_csv_headers(csv_file):
+                return csv_file
+        except:
+            pass
 
     return None
 
 
+def process_entity(entity, blank_test_path, output_path, csv_path):
+    """Fill one entity's blank test from its CSV into test-answers/.
+
+    Safe to run in a worker process; console output is captured so the
+    parent can print it in entity order.
+
+    Returns (processed, output); processed is False when the blank test
+    was copied as-is, and None when the run must stop. A worker never
+    exits itself: the parent prints the captured output first.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            processed = _process_entity(entity, blank_test_path, output_path, csv_path)
+        except EmptyBlankTestError as e:
+            print(f"Error: {e}")
+            processed = None
+    return processed, output.getvalue()
+
+
+def _process_entity(entity, blank_test_path, output_path, csv_path):
+    if csv_path is None:
+        print(f"  Warning: No CSV file found for {entity}")
+        # Copy blank test as-is
+        shutil.copy(blank_test_path, output_path)
+        return False
+
+    print(f"\n  Processing {entity} from {csv_path.name}...")
+
+    try:
+        fill_null_fields_from_csv(csv_path, blank_test_path, output_path)
+        return True
+    except EmptyBlankTestError:
+        raise
+    except Exception as e:
+        print(f"  Warning: Could not process {entity}: {e}")
+        # Leave the blank test as the answer, as if nothing was filled
+        shutil.copy(blank_test_path, output_path)
+        return False
+
+
 def run_multi_entity(script_dir):
     """Process all entity files from shared testing/blank-tests/ directory."""
-    import shutil
-
     # Use shared blank-tests directory at project root
     project_root = script_dir.parent.parent
     blank_tests_dir = project_root / 'testing' / 'blank-tests'
@@ -184,10 +486,11 @@ def run_multi_entity(script_dir):
     # Ensure output directory exists
     test_answers_dir.mkdir(exist_ok=True)
 
-    # Process each entity file (skip metadata files)
-    total_filled = 0
-    entity_count = 0
+    # One directory listing serves every entity's CSV lookup
+    csv_by_name = index_csv_files(script_dir / 'test-data')
 
+    # Process each entity file (skip metadata files)
+    tasks = []
     for blank_test_path in sorted(blank_tests_dir.glob("*.json")):
         filename = blank_test_path.name
 
@@ -199,24 +502,24 @@ def run_multi_entity(script_dir):
         output_path = test_answers_dir / filename
 
         # Find CSV file for this entity
-        csv_path = find_csv_for_entity(script_dir, entity)
-
-        if csv_path is None:
-            print(f"  Warning: No CSV file found for {entity}")
-            # Copy blank test as-is
-            shutil.copy(blank_test_path, output_path)
-            continue
+        csv_path = find_csv_for_entity(csv_by_name, entity)
+        tasks.append((entity, blank_test_path, output_path, csv_path))
+
+    # Entities are independent (own blank test, CSV and output), so several
+    # are parsed and filled in parallel worker processes
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        results = [process_entity(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(process_entity, *zip(*tasks)))
 
-        print(f"\n  Processing {entity} from {csv_path.name}...")
-
-        # Copy blank test to output path first
-        shutil.copy(blank_test_path, output_path)
-
-        try:
-            fill_null_fields_from_csv(csv_path, output_path)
-            entity_count += 1
-        except Exception as e:
-            print(f"  Warning: Could not process {entity}: {e}")
+    entity_count = 0
+    for processed, output in results:
+        print(output, end='')
+        if processed is None:
+            sys.exit(1)
+        entity_count += processed
 
     print(f"\ncsv: Processed {entity_count} entities")
 
@@ -17,11 +17,17 @@ to serve as an "execution substrate."
 DOMAIN-AGNOSTIC: Works with any Airtable schema, not hardcoded to any specific domain.
 """
 
+import asyncio
 import glob as glob_module
+import hashlib
+import importlib.util
 import json
 import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 # Get script directory
 script_dir = Path(__file__).parent.resolve()
@@ -36,7 +42,11 @@ from orchestration.shared import (
     get_calculated_fields,
     get_raw_fields,
     to_snake_case,
-    to_pascal_case
+    to_pascal_case,
+    read_json,
+    write_json,
+    dumps_json,
+    loads_json
 )
 
 
@@ -47,14 +57,27 @@ from orchestration.shared import (
 DEFAULT_PROVIDER = os.environ.get("LLM_PROVIDER", "openai")
 DEFAULT_MODEL = os.environ.get("LLM_MODEL", "gpt-4o-mini")
 
+# Input-token budget for marshaling several entities into one prompt
+ENTITY_BATCH_TOKENS = int(os.environ.get("LLM_ENTITY_BATCH_TOKENS", "6000"))
 
-def call_llm(prompt: str, skip_confirmation: bool = False) -> str:
-    """Call the OpenAI API to get computed values.
+# Maximum LLM requests in flight at once (match the provider's rate limit)
+LLM_CONCURRENCY = int(os.environ.get("LLM_CONCURRENCY", "8"))
 
-    ALWAYS asks for user confirmation before making the API call,
-    unless skip_confirmation=True or running non-interactively.
-    """
+# Records per prompt when a single entity is too large to send whole
+BATCH_SIZE = 10
+
+# Responses are cached on disk keyed by a hash of the prompt; bump
+# PROMPT_VERSION when the prompt builders change to invalidate old entries.
+# Set LLM_CACHE=0 to always call the API.
+PROMPT_VERSION = 1
+LLM_CACHE_DIR = script_dir.parent / ".llm_cache"
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE", "1") != "0"
+
+
+def create_llm_client():
+    """Create the async OpenAI client, exiting if the package or API key is missing."""
     try:
+        import httpx
         import openai
     except ImportError:
         print("Error: openai package not installed")
@@ -66,59 +89,146 @@ def call_llm(prompt: str, skip_confirmation: bool = False) -> str:
         print("Error: OPENAI_API_KEY environment variable not set")
         sys.exit(1)
 
-    client = openai.OpenAI()
+    # One keep-alive pool shared by every in-flight request, over HTTP/2 when
+    # the h2 package is installed, so concurrent prompts reach the server
+    # within the same scheduling window
+    http2 = importlib.util.find_spec("h2") is not None
+    http_client = openai.DefaultAsyncHttpxClient(
+        http2=http2,
+        limits=httpx.Limits(max_connections=LLM_CONCURRENCY,
+                            max_keepalive_connections=LLM_CONCURRENCY),
+    )
+    return openai.AsyncOpenAI(http_client=http_client)
+
+
+def confirm_llm_calls(call_count: int) -> bool:
+    """Ask once before dispatching LLM calls.
+
+    ALWAYS asks for user confirmation when running interactively; returns
+    True without asking when stdin is not a TTY. call_count excludes
+    prompts the on-disk cache answers, which are used either way.
+    """
+    if not sys.stdin.isatty():
+        return True
+
+    print(f"\n  This will make {call_count} call(s) to OpenAI ({DEFAULT_MODEL}),")
+    print(f"  up to {LLM_CONCURRENCY} at a time.")
+    try:
+        response = input("  Proceed with LLM calls? [y/N]: ").strip().lower()
+    except (EOFError, KeyboardInterrupt):
+        print()
+        response = ''
+    if response not in ('y', 'yes'):
+        print("  Skipping LLM calls.")
+        return False
+    return True
+
+
+def llm_cache_key(prompt: str, model: str) -> str:
+    """Content hash identifying a response in the on-disk LLM cache.
+
+    The prompt embeds the specification, schema and record payload, so any
+    change to the inputs produces a new key.
+    """
+    return hashlib.sha256(dumps_json([PROMPT_VERSION, model, prompt])).hexdigest()
+
+
+def llm_cache_path(prompt: str) -> Optional[Path]:
+    """Cache file for a prompt's response, or None when caching is off."""
+    if not LLM_CACHE_ENABLED:
+        return None
+    return LLM_CACHE_DIR / f"{llm_cache_key(prompt, DEFAULT_MODEL)}.json"
+
+
+def read_llm_cache(prompt: str) -> Optional[str]:
+    """Return the cached response for a prompt, or None on a miss."""
+    cache_path = llm_cache_path(prompt)
+    if cache_path is None or not cache_path.exists():
+        return None
+    response_text = read_json(cache_path)
+    print(f"  Response: cache hit ({len(response_text)} chars)")
+    return response_text
+
+
+def evict_llm_cache(prompt: str) -> None:
+    """Drop a prompt's cached response once it fails to parse.
+
+    Responses are cached as received, so a truncated or garbled answer would
+    otherwise be replayed on every run; evicting it retries the API next time.
+    """
+    cache_path = llm_cache_path(prompt)
+    if cache_path is not None:
+        cache_path.unlink(missing_ok=True)
+
+
+def count_uncached(prompts: list) -> int:
+    """Number of prompts the cache cannot answer, i.e. real API calls."""
+    paths = [llm_cache_path(prompt) for prompt in prompts]
+    return sum(1 for path in paths if path is None or not path.exists())
+
+
+async def call_llm_async(prompt: str, client, semaphore: asyncio.Semaphore) -> str:
+    """Call the OpenAI API to get computed values.
+
+    The semaphore bounds the number of requests in flight so concurrent
+    entities stay under the provider's rate limit. Cached responses are
+    returned without touching the API.
+    """
     model = DEFAULT_MODEL
 
-    # Log prompt info
-    prompt_lines = prompt.split('\n')
-    print("=" * 60)
-    print("PROMPT (first 2 lines):")
-    for line in prompt_lines[:2]:
-        print(f"  {line[:100]}")
-    print(f"  ... ({len(prompt_lines)} total lines, {len(prompt)} chars)")
-    print("=" * 60)
-
-    # ALWAYS ask before making LLM call (unless skip_confirmation or non-interactive)
-    if not skip_confirmation and sys.stdin.isatty():
-        print(f"\n  This will call OpenAI ({model}).")
-        try:
-            response = input("  Proceed with LLM call? [y/N]: ").strip().lower()
-            if response not in ('y', 'yes'):
-                print("  Skipping LLM call.")
-                return '[]'  # Return empty JSON array
-        except (EOFError, KeyboardInterrupt):
-            print("\n  Skipping LLM call.")
-            return '[]'
-
-    print(f"Calling OpenAI ({model})... please wait...")
-    sys.stdout.flush()
+    response_text = read_llm_cache(prompt)
+    if response_text is not None:
+        return response_text
+    cache_path = llm_cache_path(prompt)
 
-    response = client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        max_tokens=16384,  # Increased from 8096 to handle larger outputs
-    )
+    async with semaphore:
+        print(f"Calling OpenAI ({model}) with {len(prompt)} char prompt...")
+        sys.stdout.flush()
+
+        response = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=16384,  # Increased from 8096 to handle larger outputs
+        )
 
     response_text = response.choices[0].message.content
 
-    # Log response info
+    if cache_path is not None:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_json(response_text, cache_path)
+
+    # Log response info (one line - calls complete in any order)
     response_lines = response_text.split('\n')
-    print("=" * 60)
-    print("RESPONSE (first 2 lines):")
-    for line in response_lines[:2]:
-        print(f"  {line[:100]}")
-    print(f"  ... ({len(response_lines)} total lines, {len(response_text)} chars)")
-    print("=" * 60)
+    print(f"  Response: {len(response_lines)} lines, {len(response_text)} chars")
     sys.stdout.flush()
 
     return response_text
 
 
+async def skip_llm_async(prompt: str) -> str:
+    """Stand-in for call_llm_async when the user declines; answers from the
+    cache only, and nothing on a miss."""
+    response_text = read_llm_cache(prompt)
+    return response_text if response_text is not None else '[]'
+
+
 # =============================================================================
 # ENGLISH DOCUMENT LOADING
 # =============================================================================
 
+@lru_cache(maxsize=8)
+def _read_document(path: str, mtime_ns: int) -> str:
+    """Read a document; keyed on mtime so re-entrant runs only re-read edited files."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def read_document(path: Path) -> str:
+    """Read a UTF-8 document, memoized until the file changes on disk."""
+    return _read_document(str(path), path.stat().st_mtime_ns)
+
+
 def load_english_documents() -> tuple:
     """
     Load the generated English prose documents.
@@ -135,14 +245,12 @@ def load_english_documents() -> tuple:
 
     # Glossary is optional - specification.md now contains everything
     if glossary_path.exists():
-        with open(glossary_path, 'r', encoding='utf-8') as f:
-            glossary_content = f.read()
+        glossary_content = read_document(glossary_path)
         print(f"  Loaded glossary.md ({len(glossary_content)} chars)")
 
     # Specification is required
     if spec_path.exists():
-        with open(spec_path, 'r', encoding='utf-8') as f:
-            spec_content = f.read()
+        spec_content = read_document(spec_path)
         print(f"  Loaded specification.md ({len(spec_content)} chars)")
     else:
         print(f"  ERROR: specification.md not found at {spec_path}")
@@ -155,15 +263,57 @@ def load_english_documents() -> tuple:
 # PROMPT BUILDING (Uses English Documents)
 # =============================================================================
 
-def build_schema_description(schema: list) -> str:
-    """Build a human-readable description of the schema for the LLM.
+class SchemaBundle(NamedTuple):
+    """Schema-derived prompt inputs, computed once per entity."""
+    raw_fields: list
+    calc_fields: list
+    computed_columns: list
+    schema_description: str
+    computed_cols_desc: str
 
-    NOTE: This is a FALLBACK only used if English documents don't exist.
-    The preferred path uses glossary.md and specification.md directly.
+
+# id(schema) -> (schema, SchemaBundle); the schema is held so its id stays unique
+_schema_bundles = {}
+
+
+def schema_bundle(schema: list) -> SchemaBundle:
+    """Walk the schema once and cache everything the prompt builders need.
+
+    Schemas are lists (unhashable), so the cache is keyed by identity; the
+    rulebook keeps each entity's schema alive for the whole run.
     """
+    cached = _schema_bundles.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
     raw_fields = get_raw_fields(schema)
     calc_fields = get_calculated_fields(schema)
 
+    # Bullet list of computed columns with their types and formulas
+    computed_cols_desc = []
+    for field in calc_fields:
+        name = to_snake_case(field.get('name', ''))
+        datatype = field.get('datatype', 'string')
+        formula = field.get('formula', '')
+        computed_cols_desc.append(f"- {name} ({datatype}): {formula}")
+
+    bundle = SchemaBundle(
+        raw_fields=raw_fields,
+        calc_fields=calc_fields,
+        computed_columns=build_computed_columns_list(calc_fields),
+        schema_description=build_schema_description(raw_fields, calc_fields),
+        computed_cols_desc="\n".join(computed_cols_desc),
+    )
+    _schema_bundles[id(schema)] = (schema, bundle)
+    return bundle
+
+
+def build_schema_description(raw_fields: list, calc_fields: list) -> str:
+    """Build a human-readable description of the schema for the LLM.
+
+    NOTE: This is a FALLBACK only used if English documents don't exist.
+    The preferred path uses glossary.md and specification.md directly.
+    """
     lines = []
 
     # Raw fields section
@@ -196,20 +346,20 @@ def build_schema_description(schema: list) -> str:
     return "\n".join(lines)
 
 
-def build_computed_columns_list(schema: list) -> list:
+def build_computed_columns_list(calc_fields: list) -> list:
     """Get list of calculated column names in snake_case."""
-    calc_fields = get_calculated_fields(schema)
     return [to_snake_case(f.get('name', '')) for f in calc_fields]
 
 
-def build_prompt_with_english_docs(glossary: str, specification: str, entity_name: str,
-                                    test_data: list, computed_columns: list) -> str:
-    """
-    Build the prompt using the ENGLISH PROSE documents (specification.md, optionally glossary.md).
+# Stands in for the record payload while a prompt template is rendered, so
+# the static text around it is built once and reused for every batch
+_PAYLOAD = "\x00PAYLOAD\x00"
 
-    This is the PRIMARY prompt builder - it tests whether the LLM can execute
-    English as a programming language by reading human-readable specifications.
-    """
+
+@lru_cache(maxsize=64)
+def english_prompt_template(glossary: str, specification: str, entity_name: str,
+                            computed_columns: tuple) -> tuple:
+    """Render the English-docs prompt around the payload; returns (head, tail)."""
     # Build glossary section only if we have one
     glossary_section = ""
     if glossary:
@@ -242,7 +392,7 @@ Below is a JSON array of "{entity_name}" records. Each record has raw input fiel
 ## Input Data (with null values for computed fields)
 
 ```json
-{json.dumps(test_data, indent=2)}
+{_PAYLOAD}
 ```
 
 ## Instructions
@@ -258,23 +408,28 @@ Below is a JSON array of "{entity_name}" records. Each record has raw input fiel
 
 Return ONLY valid JSON - no markdown code blocks, no explanations, just the JSON array."""
 
-    return prompt
+    head, tail = prompt.split(_PAYLOAD)
+    return head, tail
 
 
-def build_prompt(schema: list, entity_name: str, test_data: list) -> str:
-    """FALLBACK: Build the prompt from raw schema if English docs don't exist."""
-    schema_description = build_schema_description(schema)
-    calc_fields = get_calculated_fields(schema)
-    computed_columns = build_computed_columns_list(schema)
 
-    # Build bullet list of computed columns with their types and formulas
-    computed_cols_desc = []
-    for field in calc_fields:
-        name = to_snake_case(field.get('name', ''))
-        datatype = field.get('datatype', 'string')
-        formula = field.get('formula', '')
-        computed_cols_desc.append(f"- {name} ({datatype}): {formula}")
+def build_prompt_with_english_docs(glossary: str, specification: str, entity_name: str,
+                                    test_data: list, computed_columns: list) -> str:
+    """
+    Build the prompt using the ENGLISH PROSE documents (specification.md, optionally glossary.md).
+
+    This is the PRIMARY prompt builder - it tests whether the LLM can execute
+    English as a programming language by reading human-readable specifications.
+    """
+    head, tail = english_prompt_template(glossary, specification, entity_name,
+                                         tuple(computed_columns))
+    return head + dumps_json(test_data, indent=True).decode('utf-8') + tail
+
 
+@lru_cache(maxsize=64)
+def fallback_prompt_template(schema_description: str, computed_cols_desc: str,
+                             entity_name: str) -> tuple:
+    """Render the raw-schema prompt around the payload; returns (head, tail)."""
     prompt = f"""You are taking a test. Your task is to fill in the computed columns for each record in the "{entity_name}" entity based on the schema and formulas provided.
 
 ## Schema Definition
@@ -285,12 +440,12 @@ def build_prompt(schema: list, entity_name: str, test_data: list) -> str:
 
 Below is a JSON array of {entity_name} records. Each record has raw input fields already filled in, but the following computed columns are null and need to be calculated:
 
-{chr(10).join(computed_cols_desc)}
+{computed_cols_desc}
 
 ## Input Data (with null values for computed fields)
 
 ```json
-{json.dumps(test_data, indent=2)}
+{_PAYLOAD}
 ```
 
 ## Instructions
@@ -305,51 +460,167 @@ Below is a JSON array of {entity_name} records. Each record has raw input fields
 
 Return ONLY valid JSON - no markdown code blocks, no explanations, just the JSON array."""
 
+    head, tail = prompt.split(_PAYLOAD)
+    return head, tail
+
+
+
+def build_prompt(bundle: SchemaBundle, entity_name: str, test_data: list) -> str:
+    """FALLBACK: Build the prompt from raw schema if English docs don't exist."""
+    head, tail = fallback_prompt_template(bundle.schema_description,
+                                          bundle.computed_cols_desc, entity_name)
+    return head + dumps_json(test_data, indent=True).decode('utf-8') + tail
+
+
+def record_batches(test_data: list) -> list:
+    """Split records into BATCH_SIZE chunks, one LLM prompt each."""
+    return [test_data[start:start + BATCH_SIZE]
+            for start in range(0, len(test_data), BATCH_SIZE)]
+
+
+def build_entity_prompts(bundle: SchemaBundle, entity_name: str, batches: list,
+                         glossary: str = "", specification: str = "") -> list:
+    """One prompt per record batch - from the English documents when
+    available, otherwise from the raw schema."""
+    if specification:
+        return [build_prompt_with_english_docs(glossary, specification, entity_name,
+                                               batch_data, bundle.computed_columns)
+                for batch_data in batches]
+    return [build_prompt(bundle, entity_name, batch_data) for batch_data in batches]
+
+
+def build_multi_entity_prompt(glossary: str, specification: str, batch: list) -> str:
+    """
+    Build one prompt covering several entities (row-marshaling).
+
+    batch is a list of (entity_name, computed_columns, test_data) tuples. The
+    records are sent as a single JSON object keyed by entity name and the LLM
+    is asked to answer with an object of the same shape, so one round-trip
+    serves every entity in the batch.
+    """
+    glossary_section = ""
+    if glossary:
+        glossary_section = f"""
+# GLOSSARY (Predicate Definitions)
+
+{glossary}
+
+---
+"""
+
+    column_lines = []
+    for entity_name, computed_columns, _ in batch:
+        column_lines.append(f"- **{entity_name}**: {', '.join(computed_columns)}")
+
+    payload = {entity_name: test_data for entity_name, _, test_data in batch}
+
+    prompt = f"""You are taking a test. Your task is to fill in the computed columns for each record based on the English language specification provided below.
+
+IMPORTANT: You must follow the instructions in the specification document EXACTLY. The specification contains human-readable instructions for how to compute each calculated field.
+
+---
+{glossary_section}
+# SPECIFICATION (Calculation Instructions)
+
+{specification}
+
+---
+
+# YOUR TASK
+
+Below is a JSON object whose keys are entity names and whose values are arrays of records for that entity. Each record has raw input fields already filled in, but the following computed columns are null and need to be calculated:
+
+{chr(10).join(column_lines)}
+
+## Input Data (with null values for computed fields)
+
+```json
+{dumps_json(payload, indent=True).decode('utf-8')}
+```
+
+## Instructions
+
+1. Read the SPECIFICATION above carefully - it tells you exactly how to compute each field
+2. For EACH record of EACH entity, compute the null fields following the specification instructions
+3. Return ONLY a JSON object with the same entity keys, each mapped to its complete array of records
+4. Keep the records of each entity in the same order as the input
+5. Use exact field names as shown (snake_case)
+6. Boolean values should be true/false (lowercase, no quotes)
+7. String values should be in quotes
+8. null should remain null (not "null") if the formula cannot be computed
+9. Preserve ALL other fields exactly as they appear in the input
+
+Return ONLY valid JSON - no markdown code blocks, no explanations, just the JSON object."""
+
     return prompt
 
 
-def extract_json_from_response(response_text: str) -> list:
+def estimate_tokens(test_data: list) -> int:
+    """Rough input-token estimate for a record payload (~4 chars per token)."""
+    return len(dumps_json(test_data)) // 4
+
+
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.S)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.S)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def extract_json_from_response(response_text: str, expect_object: bool = False):
     """Extract JSON array from LLM response.
 
     Handles various LLM response formats:
     - Raw JSON array
     - Markdown code blocks (```json ... ```)
     - Truncated responses (attempts partial recovery)
+
+    With expect_object=True a multi-entity JSON object is extracted instead;
+    truncated objects are not recovered.
     """
-    # Try to parse directly first
+    # Fast path: the LLM followed instructions and returned clean JSON
     try:
-        return json.loads(response_text)
+        return loads_json(response_text)
     except json.JSONDecodeError:
         pass
 
-    # Try to find JSON array in the response
-    text = response_text.strip()
-
-    # Remove markdown code blocks if present (strip first to handle trailing newlines)
-    if text.startswith("```json"):
-        text = text[7:]
-    elif text.startswith("```"):
-        text = text[3:]
-
-    # Strip again before checking end (handles newlines between JSON and closing ```)
-    text = text.strip()
-
-    if text.endswith("```"):
-        text = text[:-3]
-
-    text = text.strip()
+    # Remove markdown code blocks if present (strip between steps to handle
+    # newlines around the fences)
+    text = (response_text.strip()
+            .removeprefix("```json").removeprefix("```")
+            .strip()
+            .removesuffix("```")
+            .strip())
+
+    # Decode the first JSON value starting at the first opener; it stops at
+    # the value's end, so trailing prose needs no scan for the last closer.
+    # Prose can contain an opener too ("Computed [2] fields:"), so only a
+    # dict, or a list of dicts, is taken as the answer
+    start = text.find('{' if expect_object else '[')
+    if start >= 0:
+        try:
+            value = _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError:
+            pass
+        else:
+            if expect_object:
+                if isinstance(value, dict):
+                    return value
+            elif isinstance(value, list) and all(isinstance(item, dict) for item in value):
+                return value
 
-    # Find the array bounds
-    start = text.find('[')
-    end = text.rfind(']')
+    # Otherwise take the first opener to the last closer
+    match = (_JSON_OBJECT_RE if expect_object else _JSON_ARRAY_RE).search(text)
 
-    if start != -1 and end != -1:
+    if match:
+        start, end = match.start(), match.end() - 1
         try:
-            return json.loads(text[start:end+1])
+            return loads_json(text[start:end+1])
         except json.JSONDecodeError as e:
             print(f"JSON parse error: {e}")
             print(f"Attempted to parse: {text[start:start+200]}...")
 
+            if expect_object:
+                return None
+
             # Try to recover partial data from truncated response
             # Find the last complete object by looking for },
             truncated_json = text[start:end+1]
@@ -358,7 +629,7 @@ def extract_json_from_response(response_text: str) -> list:
                 # Try parsing up to the last complete object
                 partial = truncated_json[:last_complete+1] + ']'
                 try:
-                    records = json.loads(partial)
+                    records = loads_json(partial)
                     print(f"RECOVERED {len(records)} complete records from truncated response")
                     return records
                 except json.JSONDecodeError:
@@ -371,103 +642,148 @@ def extract_json_from_response(response_text: str) -> list:
 # MULTI-ENTITY PROCESSING
 # =============================================================================
 
-def process_entity(input_path: str, output_path: str, entity_name: str,
-                   schema: list, glossary: str = "", specification: str = "") -> tuple:
+async def process_entity_async(input_path: str, output_path: str, entity_name: str,
+                               bundle: SchemaBundle, llm, glossary: str = "",
+                               specification: str = "",
+                               prompts: Optional[list] = None) -> tuple:
     """
     Process a single entity file using the LLM.
 
     If glossary and specification are provided (the English documents),
     uses those for the prompt. Otherwise falls back to raw schema.
 
-    Uses batching for large datasets to avoid token limits.
+    Uses batching for large datasets to avoid token limits; the record
+    batches are dispatched concurrently through llm (an async prompt -> text
+    callable). prompts, when given, are the batch prompts already built by
+    the planner (see build_entity_prompts).
 
     Returns: (record_count, filled_field_count)
     """
     # Load input data
-    with open(input_path, 'r', encoding='utf-8') as f:
-        test_data = json.load(f)
+    test_data = read_json(input_path)
 
     if not test_data:
         # Empty file - just copy it
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f, indent=2)
+        write_json(test_data, output_path)
         return (0, 0)
 
-    computed_columns = build_computed_columns_list(schema)
+    computed_columns = bundle.computed_columns
 
     if not computed_columns:
         # No calculated fields - just copy the data
         print(f"    No calculated fields for {entity_name}, copying as-is")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f, indent=2)
+        write_json(test_data, output_path)
         return (len(test_data), 0)
 
     # Use batching for large datasets to avoid token limits
-    BATCH_SIZE = 10  # Process 10 records at a time
-    all_filled_answers = []
+    batches = record_batches(test_data)
 
-    if len(test_data) > BATCH_SIZE:
-        print(f"    Processing {len(test_data)} records in batches of {BATCH_SIZE}...")
+    if len(batches) > 1:
+        print(f"    Processing {len(test_data)} records of {entity_name} in {len(batches)} batches of {BATCH_SIZE}...")
 
-    for batch_start in range(0, len(test_data), BATCH_SIZE):
-        batch_end = min(batch_start + BATCH_SIZE, len(test_data))
-        batch_data = test_data[batch_start:batch_end]
-
-        if len(test_data) > BATCH_SIZE:
-            print(f"    Batch {batch_start//BATCH_SIZE + 1}/{(len(test_data) + BATCH_SIZE - 1)//BATCH_SIZE}: records {batch_start+1}-{batch_end}")
-
-        # Build prompt - prefer English documents if available
-        if specification:
-            doc_desc = "specification" + (" + glossary" if glossary else "")
-            if batch_start == 0:  # Only print on first batch
-                print(f"    Using English prose documents ({doc_desc})")
-            prompt = build_prompt_with_english_docs(glossary, specification, entity_name,
-                                                     batch_data, computed_columns)
-        else:
-            if batch_start == 0:  # Only print on first batch
-                print(f"    WARNING: English documents not available, using raw schema fallback")
-            prompt = build_prompt(schema, entity_name, batch_data)
+    # Build prompts - prefer English documents if available
+    if specification:
+        doc_desc = "specification" + (" + glossary" if glossary else "")
+        print(f"    Using English prose documents ({doc_desc})")
+    else:
+        print(f"    WARNING: English documents not available, using raw schema fallback")
+    if prompts is None:
+        prompts = build_entity_prompts(bundle, entity_name, batches, glossary, specification)
 
-        response = call_llm(prompt, skip_confirmation=batch_start > 0)
+    responses = await asyncio.gather(*(llm(prompt) for prompt in prompts))
 
+    all_filled_answers = []
+    for batch_number, (batch_data, prompt, response) in enumerate(zip(batches, prompts, responses), 1):
         # Parse response
         batch_answers = extract_json_from_response(response)
 
         if batch_answers is None:
-            print(f"Error: Could not parse LLM response as JSON for {entity_name} (batch {batch_start//BATCH_SIZE + 1})")
+            evict_llm_cache(prompt)
+            print(f"Error: Could not parse LLM response as JSON for {entity_name} (batch {batch_number})")
             print("Response was:")
             print(response[:1000])
             # Use original data for this batch (null values remain)
             all_filled_answers.extend(batch_data)
             continue
 
-        if len(batch_answers) != len(batch_data):
-            print(f"Warning: LLM returned {len(batch_answers)} records, expected {len(batch_data)}")
-            # Pad or truncate as needed
-            if len(batch_answers) < len(batch_data):
-                batch_answers.extend(batch_data[len(batch_answers):])
-            else:
-                batch_answers = batch_answers[:len(batch_data)]
-
-        all_filled_answers.extend(batch_answers)
+        all_filled_answers.extend(reconcile_answers(batch_answers, batch_data))
 
     filled_answers = all_filled_answers
 
     if len(filled_answers) != len(test_data):
         print(f"Warning: Total results {len(filled_answers)} records, expected {len(test_data)}")
 
-    # Count filled fields
-    filled_count = 0
-    for record in filled_answers:
-        for col in computed_columns:
-            if record.get(col) is not None:
-                filled_count += 1
-
     # Write results
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(filled_answers, f, indent=2)
+    write_json(filled_answers, output_path)
+
+    return (len(filled_answers), count_filled(filled_answers, computed_columns))
 
-    return (len(filled_answers), filled_count)
+
+def reconcile_answers(answers: list, expected: list) -> list:
+    """Pad or truncate LLM answers so they line up with the input records."""
+    if len(answers) != len(expected):
+        print(f"Warning: LLM returned {len(answers)} records, expected {len(expected)}")
+        # Pad or truncate as needed
+        if len(answers) < len(expected):
+            answers = answers + expected[len(answers):]
+        else:
+            answers = answers[:len(expected)]
+    return answers
+
+
+def count_filled(records: list, computed_columns: list) -> int:
+    """Count computed fields the LLM filled with a non-null value."""
+    return sum(record.get(col) is not None
+               for record in records for col in computed_columns)
+
+
+async def process_entity_batch_async(jobs: list, llm, glossary: str,
+                                     specification: str, prompt: Optional[str] = None) -> list:
+    """
+    Process several small entities with a single LLM call.
+
+    jobs is a list of (entity_name, output_path, computed_columns, test_data)
+    tuples. The composite response is demultiplexed by entity key; an entity
+    missing from the response keeps its input data (null values remain).
+    prompt, when given, is the prompt already built by the planner.
+
+    Returns: list of (record_count, filled_field_count), one per job
+    """
+    names = ', '.join(job[0] for job in jobs)
+    print(f"    Batching {len(jobs)} entities into one LLM call: {names}")
+
+    if prompt is None:
+        prompt = build_batch_prompt(jobs, glossary, specification)
+    response = await llm(prompt)
+    answers_by_entity = extract_json_from_response(response, expect_object=True)
+
+    if not isinstance(answers_by_entity, dict):
+        evict_llm_cache(prompt)
+        print(f"Error: Could not parse LLM response as JSON object for {names}")
+        print("Response was:")
+        print(response[:1000])
+        answers_by_entity = {}
+
+    results = []
+    for entity_name, output_path, computed_columns, test_data in jobs:
+        answers = answers_by_entity.get(entity_name)
+        if not isinstance(answers, list):
+            print(f"Error: LLM response has no records for {entity_name}")
+            answers = test_data
+        filled_answers = reconcile_answers(answers, test_data)
+        write_json(filled_answers, output_path)
+        results.append((len(filled_answers), count_filled(filled_answers, computed_columns)))
+
+    return results
+
+
+def build_batch_prompt(jobs: list, glossary: str, specification: str) -> str:
+    """Multi-entity prompt for a list of process_entity_batch_async jobs."""
+    return build_multi_entity_prompt(
+        glossary, specification,
+        [(entity_name, computed_columns, test_data)
+         for entity_name, _, computed_columns, test_data in jobs]
+    )
 
 
 def run_multi_entity():
@@ -516,10 +832,17 @@ def run_multi_entity():
     entities = discover_entities(rulebook)
     print(f"Discovered {len(entities)} entities: {', '.join(entities)}")
 
-    # Process each entity file (skip metadata files starting with _)
-    total_records = 0
-    total_filled = 0
-    entity_count = 0
+    # Plan the LLM work for each entity file (skip metadata files starting with _).
+    # Small entities are queued and sent together in one LLM call once their
+    # combined payload reaches the token budget; each job is
+    # ('batch', [queued entities], tokens, prompt) or
+    # ('entity', process_entity_async args, tokens, prompts). Prompts are
+    # built here so only cache misses count as calls to confirm.
+    snake_to_entity = {to_snake_case(e): e for e in entities}
+    jobs = []
+    pending = []
+    pending_tokens = 0
+    call_count = 0
 
     for input_path in sorted(glob_module.glob(str(blank_tests_dir / "*.json"))):
         filename = os.path.basename(input_path)
@@ -532,38 +855,99 @@ def run_multi_entity():
         output_path = test_answers_dir / filename
 
         # Find matching rulebook entity (case-insensitive)
-        rulebook_entity = None
-        for e in entities:
-            if to_snake_case(e) == entity_snake:
-                rulebook_entity = e
-                break
+        rulebook_entity = snake_to_entity.get(entity_snake)
 
         if not rulebook_entity:
             print(f"  -> {entity_snake}: No matching entity in rulebook, copying as-is")
-            with open(input_path, 'r') as f:
-                data = json.load(f)
-            with open(output_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_json(read_json(input_path), output_path)
             continue
 
         # Get schema for this entity
         schema = get_entity_schema(rulebook, rulebook_entity)
-        calc_fields = get_calculated_fields(schema)
+        bundle = schema_bundle(schema)
+        calc_fields = bundle.calc_fields
 
-        print(f"\nProcessing {entity_snake}...")
+        print(f"\nPlanning {entity_snake}...")
         print(f"  Schema: {len(schema)} fields, {len(calc_fields)} calculated")
 
-        # Process the entity using English documents
-        record_count, filled_count = process_entity(
-            input_path, output_path, entity_snake, schema,
-            glossary=glossary, specification=specification
-        )
+        test_data = read_json(input_path)
+        computed_columns = bundle.computed_columns
+        tokens = estimate_tokens(test_data)
+
+        if test_data and computed_columns and tokens <= ENTITY_BATCH_TOKENS:
+            if pending and pending_tokens + tokens > ENTITY_BATCH_TOKENS:
+                prompt = build_batch_prompt(pending, glossary, specification)
+                jobs.append(('batch', pending, pending_tokens, prompt))
+                call_count += count_uncached([prompt])
+                pending = []
+                pending_tokens = 0
+            print(f"  Queued for batched LLM call (~{tokens} tokens)")
+            pending.append((entity_snake, output_path, computed_columns, test_data))
+            pending_tokens += tokens
+            continue
+
+        # Entities over the budget are chunked by record on their own
+        prompts = None
+        if test_data and computed_columns:
+            prompts = build_entity_prompts(bundle, entity_snake, record_batches(test_data),
+                                           glossary, specification)
+            call_count += count_uncached(prompts)
+        jobs.append(('entity', (input_path, output_path, entity_snake, bundle), tokens, prompts))
+
+    if pending:
+        prompt = build_batch_prompt(pending, glossary, specification)
+        jobs.append(('batch', pending, pending_tokens, prompt))
+        call_count += count_uncached([prompt])
 
-        total_records += record_count
-        total_filled += filled_count
-        entity_count += 1
+    proceed = call_count == 0 or confirm_llm_calls(call_count)
+
+    async def dispatch():
+        if call_count and proceed:
+            client = create_llm_client()
+            semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+
+            async def llm(prompt):
+                return await call_llm_async(prompt, client, semaphore)
+        else:
+            llm = skip_llm_async
+
+        # Dispatch the longest prompts first so similar lengths are in
+        # flight together (less padding in the server's batches); results
+        # are put back in job order
+        order = sorted(range(len(jobs)), key=lambda i: -jobs[i][2])
+        coros = []
+        for i in order:
+            kind, payload, _, prompts = jobs[i]
+            if kind == 'batch':
+                coros.append(process_entity_batch_async(payload, llm, glossary, specification,
+                                                        prompt=prompts))
+            else:
+                coros.append(process_entity_async(*payload, llm, glossary=glossary,
+                                                  specification=specification,
+                                                  prompts=prompts))
+        results = [None] * len(jobs)
+        for i, result in zip(order, await asyncio.gather(*coros)):
+            results[i] = result
+        return results
+
+    print()
+    results = asyncio.run(dispatch())
+
+    total_records = 0
+    total_filled = 0
+    entity_count = 0
+
+    for (kind, payload, _, _), result in zip(jobs, results):
+        if kind == 'batch':
+            reports = [(job[0], counts) for job, counts in zip(payload, result)]
+        else:
+            reports = [(payload[2], result)]
 
-        print(f"  -> {entity_snake}: {record_count} records, {filled_count} computed fields filled")
+        for entity_name, (record_count, filled_count) in reports:
+            total_records += record_count
+            total_filled += filled_count
+            entity_count += 1
+            print(f"  -> {entity_name}: {record_count} records, {filled_count} computed fields filled")
 
     print()
     print("=" * 70)
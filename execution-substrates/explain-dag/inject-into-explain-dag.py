@@ -10,7 +10,6 @@ The key insight: separate TEMPLATE (formula structure) from INSTANCE (witnessed
 """
 
 import sys
-import json
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Any, Set, Optional
@@ -22,7 +21,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from orchestration.shared import (
     load_rulebook, get_candidate_name_from_cwd, handle_clean_arg,
     discover_entities, get_entity_schema, to_snake_case,
-    get_calculated_fields, get_raw_fields
+    get_calculated_fields, get_raw_fields, dumps_json, rulebook_canonical
 )
 from orchestration.formula_parser import (
     parse_formula, get_field_dependencies,
@@ -35,6 +34,99 @@ from orchestration.formula_parser import (
 # AST TO GRAPH CONVERSION
 # =============================================================================
 
+def _const_handler(type_name: str):
+    """Build the handler for a literal node of the given explanation type."""
+    def visit_const(node, visit, nodes, edges, make_node_id) -> str:
+        node_id = make_node_id("const")
+        nodes[node_id] = {
+            "kind": "const",
+            "value": node.value,
+            "type": type_name
+        }
+        return node_id
+    return visit_const
+
+
+_visit_bool = _const_handler("boolean")
+_visit_int = _const_handler("integer")
+_visit_string = _const_handler("string")
+
+
+def _visit_ref(node, visit, nodes, edges, make_node_id) -> str:
+    node_id = make_node_id("ref")
+    nodes[node_id] = {
+        "kind": "field_ref",
+        "field": node.name,
+        "field_snake": to_snake_case(node.name)
+    }
+    return node_id
+
+
+def _visit_unary(node, visit, nodes, edges, make_node_id) -> str:
+    operand_id = visit(node.operand)
+    node_id = make_node_id("fn")
+    nodes[node_id] = {
+        "kind": "fn",
+        "name": node.op,
+        "args": [operand_id]
+    }
+    edges.append([operand_id, node_id])
+    return node_id
+
+
+def _visit_binary(node, visit, nodes, edges, make_node_id) -> str:
+    left_id = visit(node.left)
+    right_id = visit(node.right)
+    node_id = make_node_id("op")
+    nodes[node_id] = {
+        "kind": "op",
+        "name": node.op,
+        "args": [left_id, right_id]
+    }
+    edges.append([left_id, node_id])
+    edges.append([right_id, node_id])
+    return node_id
+
+
+def _visit_func(node, visit, nodes, edges, make_node_id) -> str:
+    arg_ids = [visit(arg) for arg in node.args]
+    node_id = make_node_id("fn")
+    nodes[node_id] = {
+        "kind": "fn",
+        "name": node.name,
+        "args": arg_ids
+    }
+    for arg_id in arg_ids:
+        edges.append([arg_id, node_id])
+    return node_id
+
+
+def _visit_concat(node, visit, nodes, edges, make_node_id) -> str:
+    part_ids = [visit(part) for part in node.parts]
+    node_id = make_node_id("op")
+    nodes[node_id] = {
+        "kind": "op",
+        "name": "CONCAT",
+        "args": part_ids
+    }
+    for part_id in part_ids:
+        edges.append([part_id, node_id])
+    return node_id
+
+
+# One dict lookup on type(node) replaces a chain of isinstance checks
+_HANDLERS = {
+    LiteralBool: _visit_bool,
+    LiteralInt: _visit_int,
+    LiteralString: _visit_string,
+    FieldRef: _visit_ref,
+    UnaryOp: _visit_unary,
+    BinaryOp: _visit_binary,
+    FuncCall: _visit_func,
+    Concat: _visit_concat,
+}
+
+
 def ast_to_graph(ast: ASTNode, field_name: str) -> Dict[str, Any]:
     """
     Convert a parsed AST into a graph representation suitable for explanations.
@@ -50,96 +142,15 @@ def ast_to_graph(ast: ASTNode, field_name: str) -> Dict[str, Any]:
 
     def make_node_id(prefix: str) -> str:
         node_counter[0] += 1
-        return f"n_{prefix}_{node_counter[0]}"
+        return "n_%s_%d" % (prefix, node_counter[0])
 
     def visit(node: ASTNode) -> str:
         """Visit an AST node and return its graph node ID."""
-
-        if isinstance(node, LiteralBool):
-            node_id = make_node_id("const")
-            nodes[node_id] = {
-                "kind": "const",
-                "value": node.value,
-                "type": "boolean"
-            }
-            return node_id
-
-        if isinstance(node, LiteralInt):
-            node_id = make_node_id("const")
-            nodes[node_id] = {
-                "kind": "const",
-                "value": node.value,
-                "type": "integer"
-            }
-            return node_id
-
-        if isinstance(node, LiteralString):
-            node_id = make_node_id("const")
-            nodes[node_id] = {
-                "kind": "const",
-                "value": node.value,
-                "type": "string"
-            }
-            return node_id
-
-        if isinstance(node, FieldRef):
-            node_id = make_node_id("ref")
-            nodes[node_id] = {
-                "kind": "field_ref",
-                "field": node.name,
-                "field_snake": to_snake_case(node.name)
-            }
-            return node_id
-
-        if isinstance(node, UnaryOp):
-            operand_id = visit(node.operand)
-            node_id = make_node_id("fn")
-            nodes[node_id] = {
-                "kind": "fn",
-                "name": node.op,
-                "args": [operand_id]
-            }
-            edges.append([operand_id, node_id])
-            return node_id
-
-        if isinstance(node, BinaryOp):
-            left_id = visit(node.left)
-            right_id = visit(node.right)
-            node_id = make_node_id("op")
-            nodes[node_id] = {
-                "kind": "op",
-                "name": node.op,
-                "args": [left_id, right_id]
-            }
-            edges.append([left_id, node_id])
-            edges.append([right_id, node_id])
-            return node_id
-
-        if isinstance(node, FuncCall):
-            arg_ids = [visit(arg) for arg in node.args]
-            node_id = make_node_id("fn")
-            nodes[node_id] = {
-                "kind": "fn",
-                "name": node.name,
-                "args": arg_ids
-            }
-            for arg_id in arg_ids:
-                edges.append([arg_id, node_id])
-            return node_id
-
-        if isinstance(node, Concat):
-            part_ids = [visit(part) for part in node.parts]
-            node_id = make_node_id("op")
-            nodes[node_id] = {
-                "kind": "op",
-                "name": "CONCAT",
-                "args": part_ids
-            }
-            for part_id in part_ids:
-                edges.append([part_id, node_id])
-            return node_id
-
-        raise ValueError(f"Unknown AST node type: {type(node)}")
+        try:
+            handler = _HANDLERS[type(node)]
+        except KeyError:
+            raise ValueError(f"Unknown AST node type: {type(node)}") from None
+        return handler(node, visit, nodes, edges, make_node_id)
 
     # Visit the AST and get the expression root
     expr_root_id = visit(ast)
@@ -162,71 +173,108 @@ def ast_to_graph(ast: ASTNode, field_name: str) -> Dict[str, Any]:
 
 
 def compute_template_hash(graph: Dict[str, Any], formula: str) -> str:
-    """Compute a deterministic hash for a template graph."""
-    # Create a canonical representation
-    canonical = {
-        "formula": formula,
-        "nodes": sorted(graph["nodes"].items()),
-        "edges": sorted([tuple(e) for e in graph["edges"]])
-    }
-    content = json.dumps(canonical, sort_keys=True)
-    return f"sha256:{hashlib.sha256(content.encode()).hexdigest()[:16]}"
+    """Compute a deterministic hash for a template graph.
+
+    Feeds the formula, each node (in id order) and the sorted edges into
+    the digest incrementally rather than serializing one canonical object.
+    """
+    h = hashlib.sha256()
+    h.update(formula.encode())
+    nodes = graph["nodes"]
+    for node_id in sorted(nodes):
+        h.update(node_id.encode())
+        h.update(dumps_json(nodes[node_id], sort_keys=True))
+    h.update(dumps_json(sorted(map(tuple, graph["edges"]))))
+    return f"sha256:{h.hexdigest()[:16]}"
 
 
 # =============================================================================
 # DEPENDENCY DAG BUILDING
 # =============================================================================
 
-def build_calc_order(calculated_fields: List[Dict], raw_field_names: Set[str]) -> tuple:
+def parse_calculated_fields(calculated_fields: List[Dict]) -> tuple:
+    """
+    Parse every calculated field's formula exactly once.
+
+    Returns:
+    - asts: dict of field name -> parsed AST
+    - errors: dict of field name -> parse exception
+    """
+    asts = {}
+    errors = {}
+    for field in calculated_fields:
+        try:
+            asts[field['name']] = parse_formula(field.get('formula', ''))
+        except Exception as e:
+            print(f"Warning: Failed to parse formula for {field['name']}: {e}")
+            errors[field['name']] = e
+    return asts, errors
+
+
+def build_calc_order(calculated_fields: List[Dict], raw_field_names: Set[str],
+                     asts: Optional[Dict[str, ASTNode]] = None) -> tuple:
     """
     Build calculation order (topological sort) for calculated fields.
 
+    asts maps field names to already-parsed formulas (see
+    parse_calculated_fields); formulas are parsed here when it is omitted.
+    Fields without an AST are treated as having no dependencies.
+
     Returns:
     - calc_order: list of field names in evaluation order
     - dep_edges: list of [dependency, dependent] pairs
     """
-    # Parse formulas and get dependencies
+    if asts is None:
+        asts, _ = parse_calculated_fields(calculated_fields)
+
+    # Get dependencies from the parsed formulas
     field_deps = {}
     for field in calculated_fields:
-        formula = field.get('formula', '')
-        try:
-            ast = parse_formula(formula)
-            deps = get_field_dependencies(ast)
-            field_deps[field['name']] = set(deps)
-        except Exception as e:
-            print(f"Warning: Failed to parse formula for {field['name']}: {e}")
-            field_deps[field['name']] = set()
+        ast = asts.get(field['name'])
+        field_deps[field['name']] = set(get_field_dependencies(ast)) if ast is not None else set()
 
-    # Build dependency edges
+    # Build dependency edges (deps sorted so the spec is reproducible)
     dep_edges = []
     for field_name, deps in field_deps.items():
-        for dep in deps:
+        for dep in sorted(deps):
             dep_edges.append([dep, field_name])
 
-    # Topological sort
+    # Topological sort (Kahn's algorithm). indegree counts the deps of each
+    # field that are still unassigned; a dep that is neither raw nor
+    # calculated can never be assigned, so such fields stay blocked and are
+    # reported with the cycles.
+    calc_names = {f['name'] for f in calculated_fields}
+    dependents = {name: [] for name in calc_names}
+    indegree = {}
+    for name in calc_names:
+        count = 0
+        for dep in field_deps.get(name, set()):
+            if dep in raw_field_names:
+                continue
+            count += 1
+            if dep in calc_names:
+                dependents[dep].append(name)
+        indegree[name] = count
+
+    # Emit ready fields a level at a time (sorted within each level for
+    # determinism), the same order the previous rescanning loop produced
     calc_order = []
-    assigned = set(raw_field_names)
-    remaining = {f['name'] for f in calculated_fields}
-
-    while remaining:
-        # Find fields whose dependencies are all assigned
-        ready = []
-        for name in remaining:
-            deps = field_deps.get(name, set())
-            if deps <= assigned:
-                ready.append(name)
-
-        if not ready:
-            # Circular dependency - add remaining and warn
-            print(f"Warning: Possible circular dependency in: {remaining}")
-            calc_order.extend(sorted(remaining))
-            break
-
-        # Add ready fields (sorted for determinism)
-        for name in sorted(ready):
-            calc_order.append(name)
-            assigned.add(name)
-            remaining.remove(name)
+    ready = sorted(name for name, count in indegree.items() if count == 0)
+    while ready:
+        calc_order.extend(ready)
+        next_ready = []
+        for name in ready:
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    next_ready.append(dependent)
+        ready = sorted(next_ready)
+
+    if len(calc_order) < len(calc_names):
+        # Circular dependency - add remaining and warn
+        remaining = calc_names - set(calc_order)
+        print(f"Warning: Possible circular dependency in: {remaining}")
+        calc_order.extend(sorted(remaining))
 
     return calc_order, dep_edges
 
@@ -239,8 +287,9 @@ def generate_explain_spec(rulebook: Dict) -> Dict[str, Any]:
     """Generate the complete explain_spec.json content."""
 
     # Compute rulebook hash
-    rulebook_content = json.dumps(rulebook, sort_keys=True)
-    rulebook_hash = f"sha256:{hashlib.sha256(rulebook_content.encode()).hexdigest()[:32]}"
+    rulebook_digest = hashlib.sha256()
+    rulebook_digest.update(rulebook_canonical(rulebook))
+    rulebook_hash = f"sha256:{rulebook_digest.hexdigest()[:32]}"
 
     spec = {
         "schema_version": "erb.explain_spec.v1",
@@ -286,15 +335,20 @@ def generate_explain_spec(rulebook: Dict) -> Dict[str, Any]:
                 "type": field.get('type', 'raw')
             }
 
+        # Parse each formula once for both the DAG and the templates
+        asts, parse_errors = parse_calculated_fields(calculated_fields)
+
         # Build calculation order and dependency edges
-        calc_order, dep_edges = build_calc_order(calculated_fields, raw_field_names)
+        calc_order, dep_edges = build_calc_order(calculated_fields, raw_field_names, asts)
 
         # Build expression templates for each calculated field
         expr_templates = {}
         for field in calculated_fields:
             formula = field.get('formula', '')
             try:
-                ast = parse_formula(formula)
+                if field['name'] in parse_errors:
+                    raise parse_errors[field['name']]
+                ast = asts[field['name']]
                 graph = ast_to_graph(ast, field['name'])
                 template_hash = compute_template_hash(graph, formula)
 
@@ -384,7 +438,7 @@ def main():
     generated_dir.mkdir(exist_ok=True)
 
     spec_path = generated_dir / "explain_spec.json"
-    spec_path.write_text(json.dumps(spec, indent=2), encoding='utf-8')
+    spec_path.write_bytes(dumps_json(spec, indent=True))
     print(f"Wrote: {spec_path}")
 
     # Print summary
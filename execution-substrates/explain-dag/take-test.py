@@ -26,7 +26,7 @@ from dataclasses import dataclass
 script_dir = Path(__file__).resolve().parent
 sys.path.insert(0, str(script_dir.parent.parent))
 
-from orchestration.shared import to_snake_case
+from orchestration.shared import to_snake_case, read_json, write_json
 
 
 # =============================================================================
@@ -387,8 +387,7 @@ def process_entity(
 ) -> int:
     """Process a single entity, producing answers and explanations."""
 
-    with open(input_path, 'r') as f:
-        records = json.load(f)
+    records = read_json(input_path)
 
     evaluator = ExplainEvaluator(semantics)
     templates = entity_spec.get("expr_templates", {})
@@ -442,8 +441,7 @@ def process_entity(
         explanation_bundles.append(bundle)
 
     # Write answers (for grading)
-    with open(answers_path, 'w') as f:
-        json.dump(computed_records, f, indent=2)
+    write_json(computed_records, answers_path)
 
     # Write explanations (JSONL format)
     with open(explanations_path, 'w') as f:
@@ -466,8 +464,7 @@ def main():
         sys.exit(1)
 
     # Load spec
-    with open(spec_path, 'r') as f:
-        spec = json.load(f)
+    spec = read_json(spec_path)
 
     semantics = spec.get("semantics", {})
     entities = spec.get("entities", {})
@@ -477,6 +474,11 @@ def main():
     test_answers_dir.mkdir(exist_ok=True)
     test_explanations_dir.mkdir(exist_ok=True)
 
+    # Index entity specs by snake_case name for case-insensitive matching
+    snake_to_spec = {}
+    for spec_entity, entity_spec in entities.items():
+        snake_to_spec.setdefault(to_snake_case(spec_entity), entity_spec)
+
     # Process each entity
     total_records = 0
     entity_count = 0
@@ -491,19 +493,14 @@ def main():
         entity_name = filename.replace('.json', '')
 
         # Check if we have a spec for this entity
-        entity_spec = None
-        for spec_entity in entities:
-            if to_snake_case(spec_entity) == to_snake_case(entity_name):
-                entity_spec = entities[spec_entity]
-                entity_spec["rulebook_hash"] = rulebook_hash
-                break
+        entity_spec = snake_to_spec.get(to_snake_case(entity_name))
+        if entity_spec:
+            entity_spec["rulebook_hash"] = rulebook_hash
 
         if not entity_spec:
             # No calculated fields for this entity, just copy
-            with open(input_path, 'r') as f:
-                records = json.load(f)
-            with open(test_answers_dir / filename, 'w') as f:
-                json.dump(records, f, indent=2)
+            records = read_json(input_path)
+            write_json(records, test_answers_dir / filename)
             print(f"  -> {entity_name}: {len(records)} records (no calculated fields)")
             continue
 
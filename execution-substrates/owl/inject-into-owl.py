@@ -615,8 +615,45 @@ def generate_individuals_ttl(tables: Dict[str, Any]) -> str:
     return '\n'.join(lines)
 
 
+def compute_rule_stages(field_deps: Dict[str, set]) -> Optional[Dict[str, int]]:
+    """
+    Assign each calculated field a stage equal to its dependency depth.
+
+    A field whose formula reads only raw fields is stage 0; otherwise its
+    stage is one more than the deepest calculated field it reads. Running
+    the stages in order resolves every rule in a single pass each.
+
+    Returns None if the calculated fields contain a cycle.
+    """
+    stages = {}
+    visiting = set()
+
+    def stage_of(name: str) -> int:
+        if name in stages:
+            return stages[name]
+        if name in visiting:
+            raise ValueError(f"cycle through {name}")
+        visiting.add(name)
+        calc_deps = [dep for dep in field_deps[name] if dep in field_deps]
+        stages[name] = 1 + max((stage_of(dep) for dep in calc_deps), default=-1)
+        visiting.discard(name)
+        return stages[name]
+
+    try:
+        for name in field_deps:
+            stage_of(name)
+    except ValueError:
+        return None
+    return stages
+
+
 def generate_shacl_rules(tables: Dict[str, Any]) -> str:
-    """Generate SHACL-SPARQL rules from formulas."""
+    """Generate SHACL-SPARQL rules from formulas.
+
+    Each rule is tagged with erb:stage (and the equivalent sh:order) from
+    compute_rule_stages so take-test.py can run the stages once each in
+    dependency order. Tables with cyclic formulas get no stage tags.
+    """
     lines = []
 
     # Prefixes
@@ -653,6 +690,23 @@ def generate_shacl_rules(tables: Dict[str, Any]) -> str:
         if not calc_fields:
             continue
 
+        # Compile every formula up front so rule stages can be derived from
+        # the fields each one reads
+        compiled = {}
+        for calc in calc_fields:
+            try:
+                ast = parse_formula(calc['formula'])
+                field_bindings = {}
+                sparql_expr = compile_to_sparql(ast, field_bindings)
+                compiled[calc['name']] = (sparql_expr, field_bindings)
+            except Exception as e:
+                compiled[calc['name']] = e
+
+        stages = compute_rule_stages({
+            name: set(result[1]) if isinstance(result, tuple) else set()
+            for name, result in compiled.items()
+        })
+
         # Generate NodeShape with rules
         shape_uri = f'erb:{table_name}Shape'
         lines.append(f'# === Shape with rules for {table_name} ===')
@@ -665,9 +719,10 @@ def generate_shacl_rules(tables: Dict[str, Any]) -> str:
             rule_name = f'rule_{table_name}_{calc["name"]}'
 
             try:
-                ast = parse_formula(calc['formula'])
-                field_bindings = {}
-                sparql_expr = compile_to_sparql(ast, field_bindings)
+                result = compiled[calc['name']]
+                if isinstance(result, Exception):
+                    raise result
+                sparql_expr, field_bindings = result
 
                 # Build WHERE clause bindings
                 where_parts = ['    $this a erb:' + table_name + ' .']
@@ -683,6 +738,9 @@ def generate_shacl_rules(tables: Dict[str, Any]) -> str:
                 lines.append(f'    sh:rule [')
                 lines.append(f'        a sh:SPARQLRule ;')
                 lines.append(f'        rdfs:label "{rule_name}" ;')
+                if stages is not None:
+                    lines.append(f'        sh:order {stages[calc["name"]]} ;')
+                    lines.append(f'        erb:stage {stages[calc["name"]]} ;')
                 lines.append(f'        sh:prefixes erb: ;')
                 lines.append(f'        sh:construct """')
                 lines.append(f'            PREFIX erb: <http://example.org/erb#>')
@@ -11,20 +11,20 @@ The computation happens in the SHACL reasoner, not in Python code.
 This script is 100% domain-agnostic - all field names come from the rulebook.
 """
 
-import json
+import gzip
+import importlib.util
 import os
-import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import List, Optional
 
 # Auto-install dependencies if needed
 def ensure_dependencies():
-    """Install required packages if not present."""
-    try:
-        import rdflib
-        import pyshacl
-    except ImportError:
+    """Install required packages if not present (checked without importing them)."""
+    if any(importlib.util.find_spec(name) is None for name in ("rdflib", "pyshacl")):
         print("Installing dependencies...")
         subprocess.check_call([
             sys.executable, "-m", "pip", "install",
@@ -35,12 +35,12 @@ ensure_dependencies()
 
 from rdflib import Graph, Namespace, Literal, URIRef
 from rdflib.namespace import RDF, RDFS, XSD
-import pyshacl
+from rdflib.plugins.sparql import prepareQuery
 
 # Add project root to path for shared imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from orchestration.shared import load_rulebook
+from orchestration.shared import camel_to_snake, load_rulebook, write_json
 
 # Script directory
 script_dir = Path(__file__).parent.resolve()
@@ -58,6 +58,7 @@ SH = Namespace("http://www.w3.org/ns/shacl#")
 # UTILITY FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=None)
 def field_to_property_uri(field_name: str) -> str:
     """Convert field name to property URI (camelCase) - must match injector."""
     if field_name:
@@ -65,14 +66,6 @@ def field_to_property_uri(field_name: str) -> str:
     return 'unknown'
 
 
-def camel_to_snake(name: str) -> str:
-    """Convert CamelCase to snake_case for output compatibility."""
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-    # Normalize consecutive underscores to single underscore
-    return re.sub('_+', '_', s2)
-
-
 def rdf_value_to_python(value):
     """Convert an RDF value to Python native type."""
     if value is None:
@@ -92,35 +85,159 @@ def rdf_value_to_python(value):
     return str(value)
 
 
+# =============================================================================
+# PARSE CACHE
+# =============================================================================
+
+def parse_turtle_cached(graph: Graph, path: Path) -> None:
+    """
+    Parse a Turtle file into graph, via an N-Triples cache keyed on its mtime.
+
+    rdflib parses N-Triples several times faster than Turtle, and the
+    ontology and rules rarely change between runs. Caches live in .cache/;
+    a changed file gets a new key and its stale caches are removed.
+    """
+    cache_dir = script_dir / ".cache"
+    cache_path = cache_dir / f"{path.name}.{path.stat().st_mtime_ns}.nt.gz"
+
+    if cache_path.exists():
+        with gzip.open(cache_path, 'rb') as f:
+            graph.parse(data=f.read(), format='nt')
+        return
+
+    parsed = Graph().parse(path, format='turtle')
+    for prefix, namespace in parsed.namespaces():
+        graph.bind(prefix, namespace, override=False)
+    graph += parsed
+
+    cache_dir.mkdir(exist_ok=True)
+    for stale in cache_dir.glob(f"{path.name}.*.nt.gz"):
+        stale.unlink()
+    with gzip.open(cache_path, 'wb') as f:
+        f.write(parsed.serialize(format='nt', encoding='utf-8'))
+
+
 # =============================================================================
 # SHACL REASONING
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def prepare_sparql(query_text: str, namespaces: tuple):
+    """Parse and translate a SPARQL query once per (text, prefixes)."""
+    return prepareQuery(query_text, initNs=dict(namespaces))
+
+
+class PreparedQueryGraph(Graph):
+    """
+    Graph whose string queries are parsed once and then reused.
+
+    pyshacl re-submits the same sh:construct text for every focus node of a
+    SPARQLRule, and rdflib re-parses a query string on every call - with
+    pyparsing that was ~90% of reasoning time. Prepared queries take
+    different initBindings per call, so caching the translated query is safe.
+    """
+
+    def query(self, query_object, processor='sparql', result='sparql',
+              initNs=None, initBindings=None, use_store_provided=True, **kwargs):
+        if isinstance(query_object, str) and processor == 'sparql' and 'base' not in kwargs:
+            # Same default prefixes rdflib would use to parse the string
+            namespaces = tuple(initNs.items()) if initNs else tuple(self.namespaces())
+            query_object = prepare_sparql(query_object, namespaces)
+        return super().query(query_object, processor, result, initNs, initBindings,
+                             use_store_provided, **kwargs)
+
+
+def split_rule_stages(shacl_graph: Graph) -> Optional[List[Graph]]:
+    """
+    Split the SHACL graph into one graph per erb:stage, in stage order.
+
+    Each stage graph keeps every non-rule triple plus only the sh:rule links
+    for rules of that stage, so pyshacl runs just those rules. Returns None
+    when any rule lacks a stage tag (e.g. the injector found a cycle).
+    """
+    rule_links = list(shacl_graph.triples((None, SH.rule, None)))
+    if not rule_links:
+        return None
+
+    links_by_stage = {}
+    for link in rule_links:
+        stage = shacl_graph.value(link[2], ERB.stage)
+        if stage is None:
+            return None
+        links_by_stage.setdefault(int(stage.toPython()), []).append(link)
+
+    base_triples = [t for t in shacl_graph if t[1] != SH.rule]
+    stage_graphs = []
+    for stage in sorted(links_by_stage):
+        stage_graph = Graph()
+        for prefix, namespace in shacl_graph.namespaces():
+            stage_graph.bind(prefix, namespace)
+        for triple in base_triples:
+            stage_graph.add(triple)
+        for link in links_by_stage[stage]:
+            stage_graph.add(link)
+        stage_graphs.append(stage_graph)
+    return stage_graphs
+
+
+# RDFS inference is off by default: individuals are typed explicitly and the
+# injector emits no class hierarchy, so the rules' sh:targetClass matches
+# without it, while inference more than doubled reasoning time (it entails
+# domain/range triples on every pass). SHACL_INFERENCE=rdfs restores it.
+SHACL_INFERENCE = os.environ.get("SHACL_INFERENCE") or "none"
+
+# oxrdflib registers pyoxigraph as the rdflib "Oxigraph" store; string queries
+# sent to it run on Oxigraph's native SPARQL engine, which halves reasoning
+# time. Checked without importing: rdflib loads the plugin when it is used.
+OXIGRAPH_AVAILABLE = importlib.util.find_spec("oxrdflib") is not None
+
+
+def run_shacl_pass(data_graph: Graph, shacl_graph: Graph, label: str) -> int:
+    """Run one in-place pyshacl pass and return the number of triples added."""
+    # Imported here: only reasoning needs pyshacl (~0.1s to import), not
+    # extraction workers or runs that stop before reasoning
+    import pyshacl
+
+    before = len(data_graph)
+    pyshacl.validate(
+        data_graph,
+        shacl_graph=shacl_graph,
+        inference=SHACL_INFERENCE,
+        inplace=True,
+        advanced=True,
+        debug=False
+    )
+    after = len(data_graph)
+    added = after - before
+    print(f"   {label}: {before} -> {after} triples ({added} added)")
+    return added
+
+
 def run_shacl_reasoning(data_graph: Graph, shacl_graph: Graph, max_passes: int = 5) -> int:
     """
-    Run SHACL reasoning with multiple passes to resolve dependencies.
+    Run SHACL reasoning, resolving dependencies between computed fields.
 
-    Some computed fields depend on other computed fields. SHACL-SPARQL rules
-    don't automatically handle this in a single pass, so we run multiple passes
-    until no new triples are added.
+    Some computed fields depend on other computed fields. When the rules
+    carry erb:stage tags (dependency depth, written by inject-into-owl.py)
+    each stage runs exactly once, in order. Otherwise - or with
+    SHACL_FIXPOINT=1 - we run multiple full passes until no new triples are
+    added.
 
     Returns the number of passes executed.
     """
+    stage_graphs = None
+    if os.environ.get("SHACL_FIXPOINT") != "1":
+        stage_graphs = split_rule_stages(shacl_graph)
+
+    if stage_graphs is not None:
+        for i, stage_graph in enumerate(stage_graphs):
+            run_shacl_pass(data_graph, stage_graph, f"Stage {i}")
+        return len(stage_graphs)
+
     passes = 0
     for i in range(max_passes):
-        before = len(data_graph)
-        pyshacl.validate(
-            data_graph,
-            shacl_graph=shacl_graph,
-            inference='rdfs',
-            inplace=True,
-            advanced=True,
-            debug=False
-        )
-        after = len(data_graph)
+        added = run_shacl_pass(data_graph, shacl_graph, f"Pass {i+1}")
         passes += 1
-        added = after - before
-        print(f"   Pass {i+1}: {before} -> {after} triples ({added} added)")
 
         if added == 0:
             break
@@ -128,6 +245,88 @@ def run_shacl_reasoning(data_graph: Graph, shacl_graph: Graph, max_passes: int =
     return passes
 
 
+# Placeholder for a field a row has neither in its source data nor in the graph
+_MISSING = object()
+
+
+def extract_entity_columns(
+    data_graph: Graph,
+    table_name: str,
+    schema: list,
+    data: list
+) -> dict:
+    """
+    Extract computed results from RDF graph for a single entity type.
+
+    Returns a column-oriented dict mapping each snake_case field name (raw +
+    computed) to a list with one value per record. Fields a record does not
+    have hold _MISSING; columns_to_records() drops them and restores each
+    record's key order.
+    """
+    n = len(data)
+    individuals = {ERB[f"{table_name}_{i}"]: i for i in range(n)}
+
+    # Schema fields, then any extra keys the data rows carry; the set keeps
+    # the rows x keys scan from searching the list each time
+    field_names = [col.get('name', '') for col in schema]
+    known_fields = set(field_names)
+    for original_row in data:
+        for key in original_row:
+            if key not in known_fields:
+                known_fields.add(key)
+                field_names.append(key)
+
+    columns = {}
+    for field_name in field_names:
+        snake_key = camel_to_snake(field_name)
+        if snake_key in columns:
+            continue
+
+        # Start with original data, normalizing empty strings to None
+        # (matches semantic intent - empty string means "no value")
+        column = [row.get(field_name, _MISSING) for row in data]
+        column = [None if value == "" else value for value in column]
+
+        # Overlay the graph values (includes computed values) with one
+        # indexed scan per property; one SPARQL SELECT over every
+        # individual's triples measured ~10x slower than all these scans.
+        # Like Graph.value(), the first value seen for an individual wins.
+        seen = set()
+        prop_uri = ERB[field_to_property_uri(field_name)]
+        for ind_uri, _, value in data_graph.triples((None, prop_uri, None)):
+            i = individuals.get(ind_uri)
+            if i is None or i in seen:
+                continue
+            seen.add(i)
+            py_value = rdf_value_to_python(value)
+            column[i] = None if py_value == "" else py_value
+
+        columns[snake_key] = column
+
+    return columns
+
+
+def columns_to_records(columns: dict, data: list) -> list:
+    """Materialize column-oriented results as a list of per-record dicts.
+
+    Each record keeps its data row's key order, followed by the remaining
+    fields in schema order. Rows nearly always share one key layout, so the
+    column order is worked out once per distinct layout.
+    """
+    orders = {}
+    records = []
+    for i, row in enumerate(data):
+        layout = tuple(row)
+        order = orders.get(layout)
+        if order is None:
+            row_keys = dict.fromkeys(camel_to_snake(key) for key in layout)
+            order = [(key, columns[key]) for key in row_keys]
+            order += [(key, column) for key, column in columns.items() if key not in row_keys]
+            orders[layout] = order
+        records.append({key: column[i] for key, column in order if column[i] is not _MISSING})
+    return records
+
+
 def extract_entity_results(
     data_graph: Graph,
     table_name: str,
@@ -139,49 +338,27 @@ def extract_entity_results(
 
     Returns list of records with all fields (raw + computed) in snake_case.
     """
-    records = []
+    return columns_to_records(extract_entity_columns(data_graph, table_name, schema, data), data)
 
-    # Build field info map
-    all_fields = []
-    for col in schema:
-        all_fields.append({
-            'name': col.get('name', ''),
-            'datatype': col.get('datatype', 'string'),
-            'type': col.get('type', 'raw')
-        })
-
-    # Extract each individual
-    for i, original_row in enumerate(data):
-        ind_uri = ERB[f"{table_name}_{i}"]
-
-        # Start with original data (snake_case keys)
-        record = {}
-        for key, value in original_row.items():
-            snake_key = camel_to_snake(key)
-            record[snake_key] = value
-
-        # Query each field from the graph (includes computed values)
-        for field_info in all_fields:
-            field_name = field_info['name']
-            prop_name = field_to_property_uri(field_name)
-            prop_uri = ERB[prop_name]
-
-            value = data_graph.value(ind_uri, prop_uri)
-
-            if value is not None:
-                py_value = rdf_value_to_python(value)
-                snake_key = camel_to_snake(field_name)
-                record[snake_key] = py_value
-
-        # Normalize empty strings to None for all string fields
-        # (matches semantic intent - empty string means "no value")
-        for key, value in record.items():
-            if value == "":
-                record[key] = None
 
-        records.append(record)
+def extract_table(table_name: str, table_def: dict, graph, test_answers_dir: Path) -> int:
+    """
+    Extract one table's results and write them to test-answers/.
+
+    graph is the reasoned Graph, or its N-Triples bytes when running in a
+    worker process. Returns the number of records written.
+    """
+    if isinstance(graph, bytes):
+        graph = Graph().parse(data=graph, format='nt')
+
+    data = table_def.get('data', [])
+    columns = extract_entity_columns(graph, table_name, table_def.get('schema', []), data)
+    records = columns_to_records(columns, data)
 
-    return records
+    # Convert table name to snake_case for filename
+    filename = camel_to_snake(table_name) + ".json"
+    write_json(records, test_answers_dir / filename)
+    return len(records)
 
 
 # =============================================================================
@@ -231,11 +408,17 @@ def main():
 
     # Load ontology + individuals into a single graph
     print("\nLoading ontology and data...")
-    data_graph = Graph()
+    # Prefer the Oxigraph store (its own SPARQL engine replaces the prepared
+    # query cache). Keep rdflib's default in-memory store when RDFS inference
+    # is on: it adds triples with literal subjects, which Oxigraph rejects
+    if OXIGRAPH_AVAILABLE and SHACL_INFERENCE == "none":
+        data_graph = Graph(store="Oxigraph")
+    else:
+        data_graph = PreparedQueryGraph()
     data_graph.bind('erb', ERB)
     data_graph.bind('xsd', XSD)
 
-    data_graph.parse(ontology_path, format='turtle')
+    parse_turtle_cached(data_graph, ontology_path)
     print(f"   Loaded: {ontology_path}")
 
     data_graph.parse(individuals_path, format='turtle')
@@ -247,13 +430,13 @@ def main():
     shacl_graph = Graph()
     shacl_graph.bind('erb', ERB)
     shacl_graph.bind('sh', SH)
-    shacl_graph.parse(rules_path, format='turtle')
+    parse_turtle_cached(shacl_graph, rules_path)
     print(f"   Loaded: {rules_path}")
     print(f"   Rule triples: {len(shacl_graph)}")
 
     # Run SHACL reasoning with multiple passes
     print("\nRunning SHACL-SPARQL reasoning...")
-    print("   (Multiple passes to resolve dependencies between computed fields)")
+    print("   (Rule stages or repeated passes resolve dependencies between computed fields)")
 
     try:
         passes = run_shacl_reasoning(data_graph, shacl_graph)
@@ -271,26 +454,30 @@ def main():
 
     total_records = 0
 
-    for table_name in tables_with_computed:
-        table_def = tables[table_name]
-        schema = table_def.get('schema', [])
-        data = table_def.get('data', [])
-
-        if not schema or not data:
-            continue
-
-        records = extract_entity_results(data_graph, table_name, schema, data)
-        total_records += len(records)
-
-        # Convert table name to snake_case for filename
-        filename = camel_to_snake(table_name) + ".json"
-        output_path = test_answers_dir / filename
-
-        with open(output_path, "w", encoding='utf-8') as f:
-            json.dump(records, f, indent=2)
-
+    jobs = [(table_name, tables[table_name]) for table_name in tables_with_computed
+            if tables[table_name].get('schema') and tables[table_name].get('data')]
+
+    if len(jobs) > 1:
+        # Tables are independent: extract them in worker processes, each
+        # re-parsing the graph from N-Triples (pickling a Graph is slower).
+        # RDFS inference leaves literal-subject triples N-Triples can't
+        # express; extraction never reads them.
+        transfer_graph = Graph()
+        transfer_graph += (t for t in data_graph if not isinstance(t[0], Literal))
+        graph_bytes = transfer_graph.serialize(format='nt', encoding='utf-8')
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(extract_table, table_name, table_def,
+                                       graph_bytes, test_answers_dir)
+                       for table_name, table_def in jobs]
+            counts = [future.result() for future in futures]
+    else:
+        counts = [extract_table(table_name, table_def, data_graph, test_answers_dir)
+                  for table_name, table_def in jobs]
+
+    for (table_name, _), count in zip(jobs, counts):
+        total_records += count
         computed_cols = tables_with_computed[table_name]
-        print(f"   {table_name}: {len(records)} records ({len(computed_cols)} computed fields)")
+        print(f"   {table_name}: {count} records ({len(computed_cols)} computed fields)")
 
     print(f"\nTotal: {total_records} records extracted")
     print(f"Output: {test_answers_dir}/")
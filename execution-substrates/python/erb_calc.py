@@ -7,8 +7,57 @@ This file contains pure functions that compute calculated fields
 from raw field values. Supports multiple entities.
 """
 
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional, Any
 
+# NumPy evaluates boolean/integer formulas a whole column at a time in the
+# *_batch functions; without it they run the per-record functions
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Numba fuses each column kernel into one native loop; only worth its
+# compile time for batches of at least NUMBA_MIN_RECORDS records
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+NUMBA_MIN_RECORDS = 10000
+
+
+@lru_cache(maxsize=None)
+def _jit(kernel):
+    """Numba-compiled column kernel (compiled, or loaded from cache, on first use)."""
+    return njit(cache=True, parallel=True)(kernel)
+
+
+def _no_jit(kernel):
+    """Run a column kernel as plain NumPy."""
+    return kernel
+
+
+class _ScalarFallback(Exception):
+    """Raised when a column cannot be evaluated exactly with NumPy."""
+
+
+def _values(column: list):
+    """Column as a numeric array; None or non-numeric values fall back."""
+    values = np.array(column)
+    if values.dtype.kind not in 'biuf':
+        raise _ScalarFallback
+    return values
+
+
+def _truthy(column: list):
+    """Elementwise `bool(value)`."""
+    return np.fromiter(map(bool, column), dtype=bool, count=len(column))
+
 
 # =============================================================================
 # LANGUAGECANDIDATES CALCULATIONS
@@ -16,15 +65,15 @@ from typing import Optional, Any
 
 # Level 1
 
-def calc_language_candidates_has_grammar(has_syntax):
+def calc_language_candidates_has_grammar(has_syntax) -> bool:
     """Formula: ={{HasSyntax}} = TRUE()"""
     return (has_syntax == True)
 
-def calc_language_candidates_question(name):
+def calc_language_candidates_question(name) -> str:
     """Formula: ="Is " & {{Name}} & " a language?" """
-    return ('Is ' + str(name or "") + ' a language?')
+    return f'Is {name or ""} a language?'
 
-def calc_language_candidates_predicted_biological_language_core(bio_is_evolved_communication_system, bio_has_semanticity, bio_has_arbitrariness, bio_has_discreteness, bio_has_duality_of_patterning, bio_has_productivity, bio_has_displacement, bio_has_cultural_transmission):
+def calc_language_candidates_predicted_biological_language_core(bio_is_evolved_communication_system, bio_has_semanticity, bio_has_arbitrariness, bio_has_discreteness, bio_has_duality_of_patterning, bio_has_productivity, bio_has_displacement, bio_has_cultural_transmission) -> bool:
     """Formula: =AND(
   {{Bio_IsEvolvedCommunicationSystem}},
   {{Bio_HasSemanticity}},
@@ -35,7 +84,7 @@ def calc_language_candidates_predicted_biological_language_core(bio_is_evolved_c
   {{Bio_HasDisplacement}},
   {{Bio_HasCulturalTransmission}}
 )"""
-    return ((bio_is_evolved_communication_system is True) and (bio_has_semanticity is True) and (bio_has_arbitrariness is True) and (bio_has_discreteness is True) and (bio_has_duality_of_patterning is True) and (bio_has_productivity is True) and (bio_has_displacement is True) and (bio_has_cultural_transmission is True))
+    return bool(bio_is_evolved_communication_system and bio_has_semanticity and bio_has_arbitrariness and bio_has_discreteness and bio_has_duality_of_patterning and bio_has_productivity and bio_has_displacement and bio_has_cultural_transmission)
 
 def calc_language_candidates_bio_hockett_score(bio_has_semanticity, bio_has_arbitrariness, bio_has_discreteness, bio_has_duality_of_patterning, bio_has_productivity, bio_has_displacement, bio_has_cultural_transmission, bio_has_interchangeability, bio_has_feedback, bio_has_broadcast_transmission, bio_has_rapid_fading):
     """Formula: =SUM(IF({{Bio_HasSemanticity}},1,0),
@@ -51,21 +100,21 @@ IF({{Bio_HasBroadcastTransmission}},1,0),
 IF({{Bio_HasRapidFading}},1,0))"""
     return ((1 if bio_has_semanticity else 0) + (1 if bio_has_arbitrariness else 0) + (1 if bio_has_discreteness else 0) + (1 if bio_has_duality_of_patterning else 0) + (1 if bio_has_productivity else 0) + (1 if bio_has_displacement else 0) + (1 if bio_has_cultural_transmission else 0) + (1 if bio_has_interchangeability else 0) + (1 if bio_has_feedback else 0) + (1 if bio_has_broadcast_transmission else 0) + (1 if bio_has_rapid_fading else 0))
 
-def calc_language_candidates_is_description_of(distance_from_concept):
+def calc_language_candidates_is_description_of(distance_from_concept) -> bool:
     """Formula: ={{DistanceFromConcept}} > 1"""
     return (distance_from_concept > 1)
 
-def calc_language_candidates_is_open_closed_world_conflicted(is_open_world, is_closed_world):
+def calc_language_candidates_is_open_closed_world_conflicted(is_open_world, is_closed_world) -> bool:
     """Formula: =AND({{IsOpenWorld}}, {{IsClosedWorld}})"""
-    return ((is_open_world is True) and (is_closed_world is True))
+    return bool(is_open_world and is_closed_world)
 
-def calc_language_candidates_relationship_to_concept(distance_from_concept):
+def calc_language_candidates_relationship_to_concept(distance_from_concept) -> str:
     """Formula: =IF({{DistanceFromConcept}} = 1, "IsMirrorOf", "IsDescriptionOf")"""
     return ('IsMirrorOf' if (distance_from_concept == 1) else 'IsDescriptionOf')
 
 # Level 2
 
-def calc_language_candidates_predicted_answer(has_syntax, is_parsed, is_description_of, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity, bio_hockett_score):
+def calc_language_candidates_predicted_answer(has_syntax, is_parsed, is_description_of, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity, bio_hockett_score) -> bool:
     """Formula: =OR(
   AND(
     {{HasSyntax}},
@@ -79,82 +128,187 @@ def calc_language_candidates_predicted_answer(has_syntax, is_parsed, is_descript
   ),
   {{Bio_HockettScore}} > 0
 )"""
-    return (((has_syntax is True) and (is_parsed is True) and (is_description_of is True) and (has_linear_decoding_pressure is True) and (resolves_to_an_ast is True) and (is_stable_ontology_reference is True) and (can_be_held is not True) and (has_identity is not True)) or (bio_hockett_score > 0))
+    return bool((has_syntax and is_parsed and is_description_of and has_linear_decoding_pressure and resolves_to_an_ast and is_stable_ontology_reference and (not can_be_held) and (not has_identity)) or (bio_hockett_score > 0))
 
-def calc_language_candidates_predicted_biological_language_strict(predicted_biological_language_core, bio_has_interchangeability, bio_has_feedback):
+def calc_language_candidates_predicted_biological_language_strict(predicted_biological_language_core, bio_has_interchangeability, bio_has_feedback) -> bool:
     """Formula: =AND(
   {{PredictedBiologicalLanguage_Core}},
   {{Bio_HasInterchangeability}},
   {{Bio_HasFeedback}}
 )"""
-    return ((predicted_biological_language_core is True) and (bio_has_interchangeability is True) and (bio_has_feedback is True))
+    return bool(predicted_biological_language_core and bio_has_interchangeability and bio_has_feedback)
 
-def calc_language_candidates_prediction_predicates(has_syntax, is_parsed, is_description_of, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity):
+def calc_language_candidates_prediction_predicates(has_syntax, is_parsed, is_description_of, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity) -> str:
     """Formula: =IF({{HasSyntax}}, "Has Syntax", "No Syntax") & " & " & IF({{IsParsed}}, "Requires Parsing", "No Parsing Neede") & " & " & IF({{IsDescriptionOf}}, "Describes the thing", "Is the Thing") & " & " & IF({{HasLinearDecodingPressure}}, "Has Linear Decoding Pressure", "No Decoding Pressure") & " & " & IF({{ResolvesToAnAST}}, "Resolves to AST", "No AST") & ", " & IF({{IsStableOntologyReference}}, "Is Stable Ontology", "Not 'Ontology'") & " AND " & IF({{CanBeHeld}}, "Can Be Held", "Can't Be Held") & ", " &IF({{HasIdentity}}, "Has Identity", "Has no Identity")"""
-    return (str(('Has Syntax' if has_syntax else 'No Syntax') if ('Has Syntax' if has_syntax else 'No Syntax') is not None else "") + ' & ' + str(('Requires Parsing' if is_parsed else 'No Parsing Neede') if ('Requires Parsing' if is_parsed else 'No Parsing Neede') is not None else "") + ' & ' + str(('Describes the thing' if is_description_of else 'Is the Thing') if ('Describes the thing' if is_description_of else 'Is the Thing') is not None else "") + ' & ' + str(('Has Linear Decoding Pressure' if has_linear_decoding_pressure else 'No Decoding Pressure') if ('Has Linear Decoding Pressure' if has_linear_decoding_pressure else 'No Decoding Pressure') is not None else "") + ' & ' + str(('Resolves to AST' if resolves_to_an_ast else 'No AST') if ('Resolves to AST' if resolves_to_an_ast else 'No AST') is not None else "") + ', ' + str(('Is Stable Ontology' if is_stable_ontology_reference else "Not 'Ontology'") if ('Is Stable Ontology' if is_stable_ontology_reference else "Not 'Ontology'") is not None else "") + ' AND ' + str(('Can Be Held' if can_be_held else "Can't Be Held") if ('Can Be Held' if can_be_held else "Can't Be Held") is not None else "") + ', ' + str(('Has Identity' if has_identity else 'Has no Identity') if ('Has Identity' if has_identity else 'Has no Identity') is not None else ""))
+    return sys.intern(''.join((('Has Syntax' if has_syntax else 'No Syntax'), ' & ', ('Requires Parsing' if is_parsed else 'No Parsing Neede'), ' & ', ('Describes the thing' if is_description_of else 'Is the Thing'), ' & ', ('Has Linear Decoding Pressure' if has_linear_decoding_pressure else 'No Decoding Pressure'), ' & ', ('Resolves to AST' if resolves_to_an_ast else 'No AST'), ', ', ('Is Stable Ontology' if is_stable_ontology_reference else "Not 'Ontology'"), ' AND ', ('Can Be Held' if can_be_held else "Can't Be Held"), ', ', ('Has Identity' if has_identity else 'Has no Identity'))))
 
 # Level 3
 
-def calc_language_candidates_prediction_fail(predicted_answer, is_language, name, is_open_closed_world_conflicted):
+def calc_language_candidates_prediction_fail(predicted_answer, is_language, name, is_open_closed_world_conflicted) -> str:
     """Formula: =IF(NOT({{PredictedAnswer}} = {{IsLanguage}}),
   {{Name}} & " " & IF({{PredictedAnswer}}, "Is", "Isn't") & " a Family Feud Language, but " & 
   IF({{IsLanguage}}, "Is", "Is Not") & " marked as a 'Language Candidate.'", "") & IF({{IsOpenClosedWorldConflicted}}, " - Open World vs. Closed World Conflict.", "")"""
-    return (str(((str(name or "") + ' ' + str(('Is' if predicted_answer else "Isn't") if ('Is' if predicted_answer else "Isn't") is not None else "") + ' a Family Feud Language, but ' + str(('Is' if is_language else 'Is Not') if ('Is' if is_language else 'Is Not') is not None else "") + " marked as a 'Language Candidate.'") if (not (predicted_answer == is_language)) else '') if ((str(name or "") + ' ' + str(('Is' if predicted_answer else "Isn't") if ('Is' if predicted_answer else "Isn't") is not None else "") + ' a Family Feud Language, but ' + str(('Is' if is_language else 'Is Not') if ('Is' if is_language else 'Is Not') is not None else "") + " marked as a 'Language Candidate.'") if (not (predicted_answer == is_language)) else '') is not None else "") + str((' - Open World vs. Closed World Conflict.' if is_open_closed_world_conflicted else '') if (' - Open World vs. Closed World Conflict.' if is_open_closed_world_conflicted else '') is not None else ""))
+    return ((''.join((str(name or ""), ' ', ('Is' if predicted_answer else "Isn't"), ' a Family Feud Language, but ', ('Is' if is_language else 'Is Not'), " marked as a 'Language Candidate.'")) if (not (predicted_answer == is_language)) else '') + (' - Open World vs. Closed World Conflict.' if is_open_closed_world_conflicted else ''))
 
 
-def compute_language_candidates_fields(record: dict) -> dict:
-    """Compute all calculated fields for LanguageCandidates."""
-    result = dict(record)
+_LANGUAGE_CANDIDATES_INPUTS = ('has_syntax', 'name', 'bio_is_evolved_communication_system', 'bio_has_semanticity', 'bio_has_arbitrariness', 'bio_has_discreteness', 'bio_has_duality_of_patterning', 'bio_has_productivity', 'bio_has_displacement', 'bio_has_cultural_transmission', 'bio_has_interchangeability', 'bio_has_feedback', 'bio_has_broadcast_transmission', 'bio_has_rapid_fading', 'distance_from_concept', 'is_open_world', 'is_closed_world', 'is_parsed', 'has_linear_decoding_pressure', 'resolves_to_an_ast', 'is_stable_ontology_reference', 'can_be_held', 'has_identity', 'is_language',)
+_get_language_candidates_inputs = itemgetter(*_LANGUAGE_CANDIDATES_INPUTS)
+
+
+def compute_language_candidates_fields(record: dict, *, inplace: bool = False) -> dict:
+    """Compute all calculated fields for LanguageCandidates.
+
+    With inplace=True the fields are written into record itself instead of
+    a copy - for callers that own the record (e.g. freshly parsed JSON).
+    """
+    result = record if inplace else dict(record)
+    try:
+        has_syntax, name, bio_is_evolved_communication_system, bio_has_semanticity, bio_has_arbitrariness, bio_has_discreteness, bio_has_duality_of_patterning, bio_has_productivity, bio_has_displacement, bio_has_cultural_transmission, bio_has_interchangeability, bio_has_feedback, bio_has_broadcast_transmission, bio_has_rapid_fading, distance_from_concept, is_open_world, is_closed_world, is_parsed, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity, is_language = _get_language_candidates_inputs(result)
+    except KeyError:
+        has_syntax, name, bio_is_evolved_communication_system, bio_has_semanticity, bio_has_arbitrariness, bio_has_discreteness, bio_has_duality_of_patterning, bio_has_productivity, bio_has_displacement, bio_has_cultural_transmission, bio_has_interchangeability, bio_has_feedback, bio_has_broadcast_transmission, bio_has_rapid_fading, distance_from_concept, is_open_world, is_closed_world, is_parsed, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity, is_language = map(result.get, _LANGUAGE_CANDIDATES_INPUTS)
 
     # Level 1 calculations
-    result['has_grammar'] = calc_language_candidates_has_grammar(result.get('has_syntax'))
-    result['question'] = calc_language_candidates_question(result.get('name'))
-    result['predicted_biological_language_core'] = calc_language_candidates_predicted_biological_language_core(result.get('bio_is_evolved_communication_system'), result.get('bio_has_semanticity'), result.get('bio_has_arbitrariness'), result.get('bio_has_discreteness'), result.get('bio_has_duality_of_patterning'), result.get('bio_has_productivity'), result.get('bio_has_displacement'), result.get('bio_has_cultural_transmission'))
-    result['bio_hockett_score'] = calc_language_candidates_bio_hockett_score(result.get('bio_has_semanticity'), result.get('bio_has_arbitrariness'), result.get('bio_has_discreteness'), result.get('bio_has_duality_of_patterning'), result.get('bio_has_productivity'), result.get('bio_has_displacement'), result.get('bio_has_cultural_transmission'), result.get('bio_has_interchangeability'), result.get('bio_has_feedback'), result.get('bio_has_broadcast_transmission'), result.get('bio_has_rapid_fading'))
-    result['is_description_of'] = calc_language_candidates_is_description_of(result.get('distance_from_concept'))
-    result['is_open_closed_world_conflicted'] = calc_language_candidates_is_open_closed_world_conflicted(result.get('is_open_world'), result.get('is_closed_world'))
-    result['relationship_to_concept'] = calc_language_candidates_relationship_to_concept(result.get('distance_from_concept'))
+    result['has_grammar'] = calc_language_candidates_has_grammar(has_syntax)
+    result['question'] = calc_language_candidates_question(name)
+    predicted_biological_language_core = result['predicted_biological_language_core'] = calc_language_candidates_predicted_biological_language_core(bio_is_evolved_communication_system, bio_has_semanticity, bio_has_arbitrariness, bio_has_discreteness, bio_has_duality_of_patterning, bio_has_productivity, bio_has_displacement, bio_has_cultural_transmission)
+    bio_hockett_score = result['bio_hockett_score'] = calc_language_candidates_bio_hockett_score(bio_has_semanticity, bio_has_arbitrariness, bio_has_discreteness, bio_has_duality_of_patterning, bio_has_productivity, bio_has_displacement, bio_has_cultural_transmission, bio_has_interchangeability, bio_has_feedback, bio_has_broadcast_transmission, bio_has_rapid_fading)
+    is_description_of = result['is_description_of'] = calc_language_candidates_is_description_of(distance_from_concept)
+    is_open_closed_world_conflicted = result['is_open_closed_world_conflicted'] = calc_language_candidates_is_open_closed_world_conflicted(is_open_world, is_closed_world)
+    result['relationship_to_concept'] = calc_language_candidates_relationship_to_concept(distance_from_concept)
 
     # Level 2 calculations
-    result['predicted_answer'] = calc_language_candidates_predicted_answer(result.get('has_syntax'), result.get('is_parsed'), result.get('is_description_of'), result.get('has_linear_decoding_pressure'), result.get('resolves_to_an_ast'), result.get('is_stable_ontology_reference'), result.get('can_be_held'), result.get('has_identity'), result.get('bio_hockett_score'))
-    result['predicted_biological_language_strict'] = calc_language_candidates_predicted_biological_language_strict(result.get('predicted_biological_language_core'), result.get('bio_has_interchangeability'), result.get('bio_has_feedback'))
-    result['prediction_predicates'] = calc_language_candidates_prediction_predicates(result.get('has_syntax'), result.get('is_parsed'), result.get('is_description_of'), result.get('has_linear_decoding_pressure'), result.get('resolves_to_an_ast'), result.get('is_stable_ontology_reference'), result.get('can_be_held'), result.get('has_identity'))
+    predicted_answer = result['predicted_answer'] = calc_language_candidates_predicted_answer(has_syntax, is_parsed, is_description_of, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity, bio_hockett_score)
+    result['predicted_biological_language_strict'] = calc_language_candidates_predicted_biological_language_strict(predicted_biological_language_core, bio_has_interchangeability, bio_has_feedback)
+    result['prediction_predicates'] = calc_language_candidates_prediction_predicates(has_syntax, is_parsed, is_description_of, has_linear_decoding_pressure, resolves_to_an_ast, is_stable_ontology_reference, can_be_held, has_identity)
 
     # Level 3 calculations
-    result['prediction_fail'] = calc_language_candidates_prediction_fail(result.get('predicted_answer'), result.get('is_language'), result.get('name'), result.get('is_open_closed_world_conflicted'))
+    prediction_fail = calc_language_candidates_prediction_fail(predicted_answer, is_language, name, is_open_closed_world_conflicted)
+    result['prediction_fail'] = None if prediction_fail == '' else prediction_fail
+
+    return result
+
+
+def _kernel_language_candidates_has_grammar(has_syntax_values):
+    """Column kernel for has_grammar."""
+    return (has_syntax_values == True)
+
+
+def _kernel_language_candidates_predicted_biological_language_core(bio_is_evolved_communication_system_truthy, bio_has_semanticity_truthy, bio_has_arbitrariness_truthy, bio_has_discreteness_truthy, bio_has_duality_of_patterning_truthy, bio_has_productivity_truthy, bio_has_displacement_truthy, bio_has_cultural_transmission_truthy):
+    """Column kernel for predicted_biological_language_core."""
+    return (bio_is_evolved_communication_system_truthy & bio_has_semanticity_truthy & bio_has_arbitrariness_truthy & bio_has_discreteness_truthy & bio_has_duality_of_patterning_truthy & bio_has_productivity_truthy & bio_has_displacement_truthy & bio_has_cultural_transmission_truthy)
+
+
+def _kernel_language_candidates_bio_hockett_score(bio_has_semanticity_truthy, bio_has_arbitrariness_truthy, bio_has_discreteness_truthy, bio_has_duality_of_patterning_truthy, bio_has_productivity_truthy, bio_has_displacement_truthy, bio_has_cultural_transmission_truthy, bio_has_interchangeability_truthy, bio_has_feedback_truthy, bio_has_broadcast_transmission_truthy, bio_has_rapid_fading_truthy):
+    """Column kernel for bio_hockett_score."""
+    return (np.where(bio_has_semanticity_truthy, 1, 0) + np.where(bio_has_arbitrariness_truthy, 1, 0) + np.where(bio_has_discreteness_truthy, 1, 0) + np.where(bio_has_duality_of_patterning_truthy, 1, 0) + np.where(bio_has_productivity_truthy, 1, 0) + np.where(bio_has_displacement_truthy, 1, 0) + np.where(bio_has_cultural_transmission_truthy, 1, 0) + np.where(bio_has_interchangeability_truthy, 1, 0) + np.where(bio_has_feedback_truthy, 1, 0) + np.where(bio_has_broadcast_transmission_truthy, 1, 0) + np.where(bio_has_rapid_fading_truthy, 1, 0))
+
+
+def _kernel_language_candidates_is_description_of(distance_from_concept_values):
+    """Column kernel for is_description_of."""
+    return (distance_from_concept_values > 1)
+
+
+def _kernel_language_candidates_is_open_closed_world_conflicted(is_open_world_truthy, is_closed_world_truthy):
+    """Column kernel for is_open_closed_world_conflicted."""
+    return (is_open_world_truthy & is_closed_world_truthy)
+
+
+def _kernel_language_candidates_predicted_answer(has_syntax_truthy, is_parsed_truthy, is_description_of_truthy, has_linear_decoding_pressure_truthy, resolves_to_an_ast_truthy, is_stable_ontology_reference_truthy, can_be_held_truthy, has_identity_truthy, bio_hockett_score_values):
+    """Column kernel for predicted_answer."""
+    return ((has_syntax_truthy & is_parsed_truthy & is_description_of_truthy & has_linear_decoding_pressure_truthy & resolves_to_an_ast_truthy & is_stable_ontology_reference_truthy & (~can_be_held_truthy) & (~has_identity_truthy)) | (bio_hockett_score_values > 0))
+
+
+def _kernel_language_candidates_predicted_biological_language_strict(predicted_biological_language_core_truthy, bio_has_interchangeability_truthy, bio_has_feedback_truthy):
+    """Column kernel for predicted_biological_language_strict."""
+    return (predicted_biological_language_core_truthy & bio_has_interchangeability_truthy & bio_has_feedback_truthy)
+
+
+def compute_language_candidates_fields_batch(records: list, *, inplace: bool = False) -> list:
+    """Compute all calculated fields for a list of LanguageCandidates records."""
+    if not NUMPY_AVAILABLE:
+        return [compute_language_candidates_fields(record, inplace=inplace) for record in records]
+
+    jit = _jit if NUMBA_AVAILABLE and len(records) >= NUMBA_MIN_RECORDS else _no_jit
+    try:
+        cols = {key: [record.get(key) for record in records] for key in ['has_syntax', 'name', 'bio_is_evolved_communication_system', 'bio_has_semanticity', 'bio_has_arbitrariness', 'bio_has_discreteness', 'bio_has_duality_of_patterning', 'bio_has_productivity', 'bio_has_displacement', 'bio_has_cultural_transmission', 'bio_has_interchangeability', 'bio_has_feedback', 'bio_has_broadcast_transmission', 'bio_has_rapid_fading', 'distance_from_concept', 'is_open_world', 'is_closed_world', 'is_parsed', 'has_linear_decoding_pressure', 'resolves_to_an_ast', 'is_stable_ontology_reference', 'can_be_held', 'has_identity', 'is_language']}
+
+        # Level 1 calculations
+        cols['has_grammar'] = jit(_kernel_language_candidates_has_grammar)(_values(cols['has_syntax'])).tolist()
+        cols['question'] = list(map(calc_language_candidates_question, cols['name']))
+        cols['predicted_biological_language_core'] = jit(_kernel_language_candidates_predicted_biological_language_core)(_truthy(cols['bio_is_evolved_communication_system']), _truthy(cols['bio_has_semanticity']), _truthy(cols['bio_has_arbitrariness']), _truthy(cols['bio_has_discreteness']), _truthy(cols['bio_has_duality_of_patterning']), _truthy(cols['bio_has_productivity']), _truthy(cols['bio_has_displacement']), _truthy(cols['bio_has_cultural_transmission'])).tolist()
+        cols['bio_hockett_score'] = jit(_kernel_language_candidates_bio_hockett_score)(_truthy(cols['bio_has_semanticity']), _truthy(cols['bio_has_arbitrariness']), _truthy(cols['bio_has_discreteness']), _truthy(cols['bio_has_duality_of_patterning']), _truthy(cols['bio_has_productivity']), _truthy(cols['bio_has_displacement']), _truthy(cols['bio_has_cultural_transmission']), _truthy(cols['bio_has_interchangeability']), _truthy(cols['bio_has_feedback']), _truthy(cols['bio_has_broadcast_transmission']), _truthy(cols['bio_has_rapid_fading'])).tolist()
+        cols['is_description_of'] = jit(_kernel_language_candidates_is_description_of)(_values(cols['distance_from_concept'])).tolist()
+        cols['is_open_closed_world_conflicted'] = jit(_kernel_language_candidates_is_open_closed_world_conflicted)(_truthy(cols['is_open_world']), _truthy(cols['is_closed_world'])).tolist()
+        cols['relationship_to_concept'] = list(map(calc_language_candidates_relationship_to_concept, cols['distance_from_concept']))
+
+        # Level 2 calculations
+        cols['predicted_answer'] = jit(_kernel_language_candidates_predicted_answer)(_truthy(cols['has_syntax']), _truthy(cols['is_parsed']), _truthy(cols['is_description_of']), _truthy(cols['has_linear_decoding_pressure']), _truthy(cols['resolves_to_an_ast']), _truthy(cols['is_stable_ontology_reference']), _truthy(cols['can_be_held']), _truthy(cols['has_identity']), _values(cols['bio_hockett_score'])).tolist()
+        cols['predicted_biological_language_strict'] = jit(_kernel_language_candidates_predicted_biological_language_strict)(_truthy(cols['predicted_biological_language_core']), _truthy(cols['bio_has_interchangeability']), _truthy(cols['bio_has_feedback'])).tolist()
+        cols['prediction_predicates'] = list(map(calc_language_candidates_prediction_predicates, cols['has_syntax'], cols['is_parsed'], cols['is_description_of'], cols['has_linear_decoding_pressure'], cols['resolves_to_an_ast'], cols['is_stable_ontology_reference'], cols['can_be_held'], cols['has_identity']))
+
+        # Level 3 calculations
+        cols['prediction_fail'] = list(map(calc_language_candidates_prediction_fail, cols['predicted_answer'], cols['is_language'], cols['name'], cols['is_open_closed_world_conflicted']))
+
+    except _ScalarFallback:
+        return [compute_language_candidates_fields(record, inplace=inplace) for record in records]
+
+    results = list(records) if inplace else [dict(record) for record in records]
+    for key in ['has_grammar', 'question', 'predicted_biological_language_core', 'bio_hockett_score', 'is_description_of', 'is_open_closed_world_conflicted', 'relationship_to_concept', 'predicted_answer', 'predicted_biological_language_strict', 'prediction_predicates', 'prediction_fail']:
+        for result, value in zip(results, cols[key]):
+            result[key] = value
 
     # Convert empty strings to None for string fields
-    for key in ['question', 'prediction_predicates', 'prediction_fail', 'relationship_to_concept']:
-        if result.get(key) == '':
-            result[key] = None
+    for key in ['prediction_fail']:
+        for result in results:
+            if result.get(key) == '':
+                result[key] = None
 
-    return result
+    return results
 
 
 # =============================================================================
 # DISPATCHER FUNCTION
 # =============================================================================
 
-def compute_all_calculated_fields(record: dict, entity_name: str = None) -> dict:
+@lru_cache(maxsize=64)
+def _normalize(entity_name: str) -> str:
+    """Normalize an entity name to snake_case for dispatch."""
+    return entity_name.lower().replace('-', '_')
+
+
+_DISPATCH = {
+    'language_candidates': compute_language_candidates_fields,
+}
+
+_BATCH_DISPATCH = {
+    'language_candidates': compute_language_candidates_fields_batch,
+}
+
+
+def compute_all_calculated_fields(record: dict, entity_name: str = None, *,
+                                  inplace: bool = False) -> dict:
     """
     Compute all calculated fields for a record.
     
     Args:
         record: The record dict with raw field values
         entity_name: Entity name (snake_case or PascalCase)
+        inplace: Fill in record itself instead of a copy
     
     Returns:
         Record dict with calculated fields filled in
     """
-    if entity_name is None:
-        # Try to infer from record keys
-        return dict(record)
-
-    # Normalize to snake_case
-    entity_lower = entity_name.lower().replace('-', '_')
-
-    if entity_lower == 'language_candidates':
-        return compute_language_candidates_fields(record)
-    else:
-        # Unknown entity, return as-is
-        return dict(record)
\ No newline at end of file
+    fn = _DISPATCH.get(_normalize(entity_name)) if entity_name is not None else None
+    if fn is None:
+        # No entity name or unknown entity, return as-is
+        return record if inplace else dict(record)
+    return fn(record, inplace=inplace)
+
+
+def compute_all_calculated_fields_batch(records: list, entity_name: str = None, *,
+                                        inplace: bool = False) -> list:
+    """Compute all calculated fields for a list of records of one entity."""
+    fn = _BATCH_DISPATCH.get(_normalize(entity_name)) if entity_name is not None else None
+    if fn is None:
+        return list(records) if inplace else [dict(record) for record in records]
+    return fn(records, inplace=inplace)
\ No newline at end of file
@@ -8,6 +8,7 @@ with proper calculation functions for ALL entities with calculated fields.
 Generated file is shared by Python, English, YAML, and other substrates.
 """
 
+import hashlib
 import sys
 from pathlib import Path
 from typing import Dict, List, Any, Set
@@ -18,11 +19,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from orchestration.shared import (
     load_rulebook, get_candidate_name_from_cwd, handle_clean_arg,
     discover_entities, get_entity_schema, to_snake_case,
-    get_calculated_fields, get_raw_fields
+    get_calculated_fields, get_raw_fields, rulebook_canonical
 )
 from orchestration.formula_parser import (
-    parse_formula, compile_to_python, get_field_dependencies,
-    ASTNode, FieldRef, FuncCall, Concat, LiteralString
+    parse_formula, compile_to_python, compile_to_numpy, numpy_field_kinds,
+    get_field_dependencies, can_be_empty_string, is_computed_label, python_return_type,
+    ASTNode, FieldRef, FuncCall, Concat, LiteralString, LiteralBool, UnaryOp
 )
 
 
@@ -73,14 +75,20 @@ def build_dag_levels(calculated_fields: List[Dict], raw_field_names: Set[str]) -
     return levels
 
 
-def generate_function_signature(entity_name: str, field_name: str, deps: List[str]) -> str:
-    """Generate function signature with entity-namespaced function name."""
+def generate_function_signature(entity_name: str, field_name: str, deps: List[str],
+                                returns: str = None) -> str:
+    """Generate function signature with entity-namespaced function name.
+
+    returns annotates the return type when the formula's result type is
+    certain; parameters stay unannotated since any field may be None.
+    """
     entity_snake = to_snake_case(entity_name)
     field_snake = to_snake_case(field_name)
     func_name = f"calc_{entity_snake}_{field_snake}"
     params = [to_snake_case(d) for d in deps]
     params_str = ", ".join(params) if params else ""
-    return f"def {func_name}({params_str}):"
+    annotation = f" -> {returns}" if returns else ""
+    return f"def {func_name}({params_str}){annotation}:"
 
 
 def generate_calc_function(entity_name: str, field: Dict) -> str:
@@ -105,7 +113,7 @@ def calc_{entity_snake}_{field_snake}():
 
     # Generate function
     lines = []
-    sig = generate_function_signature(entity_name, name, deps)
+    sig = generate_function_signature(entity_name, name, deps, python_return_type(ast))
     lines.append(sig)
 
     # Docstring with formula (escape triple quotes and trailing double quotes)
@@ -115,102 +123,452 @@ def calc_{entity_snake}_{field_snake}():
         formula_escaped = formula_escaped + ' '
     lines.append(f'    """Formula: {formula_escaped}"""')
 
-    # Return expression
+    # Return expression. Labels assembled from literals are interned so every
+    # record shares one str per distinct label (plain literals already are)
+    if is_computed_label(ast):
+        python_expr = f'sys.intern({python_expr})'
     lines.append(f'    return {python_expr}')
 
     return '\n'.join(lines)
 
 
+def formula_can_be_empty(field: Dict) -> bool:
+    """Check if a calculated field's formula may produce an empty string."""
+    try:
+        return can_be_empty_string(parse_formula(field.get('formula', '')))
+    except:
+        return True
+
+
 def generate_entity_compute_function(
     entity_name: str,
     calculated_fields: List[Dict],
     dag_levels: List[List[Dict]],
     string_fields: List[str]
 ) -> str:
-    """Generate compute function for a specific entity."""
-    entity_snake = to_snake_case(entity_name)
+    """Generate compute function for a specific entity.
 
-    lines = []
-    lines.append(f'def compute_{entity_snake}_fields(record: dict) -> dict:')
-    lines.append(f'    """Compute all calculated fields for {entity_name}."""')
-    lines.append('    result = dict(record)')
-    lines.append('')
+    Every input a formula reads before it is computed is fetched into a
+    local with one module-level operator.itemgetter call (falling back to
+    per-key .get() when a key is missing); calculated values stay in locals
+    only when a later level depends on them.
+    """
+    entity_snake = to_snake_case(entity_name)
 
-    # Process each level
-    for level_idx, level_fields in enumerate(dag_levels):
-        lines.append(f'    # Level {level_idx + 1} calculations')
+    # Resolve each field's dependencies once, in evaluation order
+    ordered = []
+    for level_fields in dag_levels:
+        level = []
         for field in level_fields:
-            name = field['name']
-            snake_name = to_snake_case(name)
-
             try:
                 ast = parse_formula(field.get('formula', ''))
-                deps = get_field_dependencies(ast)
+                deps = [to_snake_case(d) for d in get_field_dependencies(ast)]
             except:
                 deps = []
+            level.append((to_snake_case(field['name']), deps))
+        ordered.append(level)
+
+    assigned = set()
+    inputs = []
+    referenced = set()
+    for level in ordered:
+        for snake_name, deps in level:
+            inputs.extend(d for d in deps if d not in assigned and d not in inputs)
+            referenced.update(deps)
+            assigned.add(snake_name)
+
+    getter_name = f"_get_{entity_snake}_inputs"
+    inputs_name = f"_{entity_snake.upper()}_INPUTS"
+    lines = []
+    if len(inputs) > 1:
+        inputs_list = ', '.join(f"'{d}'" for d in inputs)
+        lines.append(f"{inputs_name} = ({inputs_list},)")
+        lines.append(f"{getter_name} = itemgetter(*{inputs_name})")
+        lines.append('')
+        lines.append('')
+    lines.append(f'def compute_{entity_snake}_fields(record: dict, *, inplace: bool = False) -> dict:')
+    lines.append(f'    """Compute all calculated fields for {entity_name}.')
+    lines.append('')
+    lines.append('    With inplace=True the fields are written into record itself instead of')
+    lines.append('    a copy - for callers that own the record (e.g. freshly parsed JSON).')
+    lines.append('    """')
+    # Not pre-sized with {**record, 'field': None, ...}: dict(record) takes
+    # CPython's whole-table copy fast path, while the literal re-inserts every
+    # key and measured ~2x slower. Test records already carry every
+    # calculated key (as None), so the assignments below never grow the dict.
+    lines.append('    result = record if inplace else dict(record)')
+    if len(inputs) == 1:
+        lines.append(f"    {inputs[0]} = result.get('{inputs[0]}')")
+    elif inputs:
+        targets = ', '.join(inputs)
+        lines.append('    try:')
+        lines.append(f'        {targets} = {getter_name}(result)')
+        lines.append('    except KeyError:')
+        lines.append(f'        {targets} = map(result.get, {inputs_name})')
+    lines.append('')
 
-            # Generate function call
+    # Process each level
+    for level_idx, level in enumerate(ordered):
+        lines.append(f'    # Level {level_idx + 1} calculations')
+        for snake_name, deps in level:
             func_name = f"calc_{entity_snake}_{snake_name}"
-            if deps:
-                args = [f"result.get('{to_snake_case(dep)}')" for dep in deps]
-                args_str = ', '.join(args)
-                lines.append(f"    result['{snake_name}'] = {func_name}({args_str})")
+            if snake_name in string_fields:
+                # Store '' as None; later levels still see the raw value
+                lines.append(f"    {snake_name} = {func_name}({', '.join(deps)})")
+                lines.append(f"    result['{snake_name}'] = None if {snake_name} == '' else {snake_name}")
+            elif snake_name in referenced:
+                lines.append(f"    {snake_name} = result['{snake_name}'] = {func_name}({', '.join(deps)})")
             else:
-                lines.append(f"    result['{snake_name}'] = {func_name}()")
+                lines.append(f"    result['{snake_name}'] = {func_name}({', '.join(deps)})")
         lines.append('')
 
-    # Post-process: convert empty strings to None for string fields
+    lines.append('    return result')
+
+    return '\n'.join(lines)
+
+
+def compile_column_kernel(ast: ASTNode, field_kinds: Dict[str, str]):
+    """Compile a formula to a NumPy column kernel.
+
+    Returns (params, args, expr): the kernel's parameter names, the coerced
+    column expressions the batch function passes for them, and the kernel
+    body expression. Returns None when the formula cannot be vectorized.
+    """
+    params, args = [], []
+
+    def column_ref(helper, name):
+        param = f"{name}{helper}"
+        if param not in params:
+            params.append(param)
+            args.append(f"{helper}(cols['{name}'])")
+        return param
+
+    try:
+        expr = compile_to_numpy(ast, field_kinds, column_ref=column_ref)
+    except ValueError:
+        return None
+    return params, args, expr
+
+
+def generate_entity_batch_function(
+    entity_name: str,
+    dag_levels: List[List[Dict]],
+    string_fields: List[str],
+    field_kinds: Dict[str, str]
+) -> str:
+    """Generate a column-at-a-time batch compute function for an entity.
+
+    Boolean/integer formulas become NumPy column kernels (JIT-compiled by
+    Numba for large batches); the rest map their calc_* function over the
+    columns. Results match compute_<entity>_fields record for record, which
+    is also the fallback when NumPy is missing or a column holds
+    None/non-numeric values.
+    """
+    entity_snake = to_snake_case(entity_name)
+    scalar_fn = f"compute_{entity_snake}_fields"
+    calc_names = [to_snake_case(f['name']) for level in dag_levels for f in level]
+
+    kernels = []
+    body = []
+    raw_deps = []
+    for level_idx, level_fields in enumerate(dag_levels):
+        body.append(f'        # Level {level_idx + 1} calculations')
+        for field in level_fields:
+            snake_name = to_snake_case(field['name'])
+            try:
+                ast = parse_formula(field.get('formula', ''))
+                deps = [to_snake_case(d) for d in get_field_dependencies(ast)]
+            except Exception:
+                ast, deps = None, []
+            raw_deps.extend(d for d in deps if d not in calc_names and d not in raw_deps)
+
+            kernel = compile_column_kernel(ast, field_kinds) if ast is not None else None
+
+            if kernel is not None:
+                params, args, expr = kernel
+                kernel_name = f"_kernel_{entity_snake}_{snake_name}"
+                kernels.append(f"def {kernel_name}({', '.join(params)}):")
+                kernels.append(f'    """Column kernel for {snake_name}."""')
+                kernels.append(f"    return {expr}")
+                kernels.append('')
+                kernels.append('')
+                body.append(f"        cols['{snake_name}'] = jit({kernel_name})({', '.join(args)}).tolist()")
+            elif deps:
+                args_str = ', '.join(f"cols['{d}']" for d in deps)
+                body.append(f"        cols['{snake_name}'] = list(map(calc_{entity_snake}_{snake_name}, {args_str}))")
+            else:
+                body.append(f"        cols['{snake_name}'] = [calc_{entity_snake}_{snake_name}() for _ in records]")
+        body.append('')
+
+    lines = list(kernels)
+    lines.append(f'def {scalar_fn}_batch(records: list, *, inplace: bool = False) -> list:')
+    lines.append(f'    """Compute all calculated fields for a list of {entity_name} records."""')
+    lines.append('    if not NUMPY_AVAILABLE:')
+    lines.append(f'        return [{scalar_fn}(record, inplace=inplace) for record in records]')
+    lines.append('')
+    lines.append('    jit = _jit if NUMBA_AVAILABLE and len(records) >= NUMBA_MIN_RECORDS else _no_jit')
+    lines.append('    try:')
+    raw_list = ', '.join(f"'{d}'" for d in raw_deps)
+    lines.append(f'        cols = {{key: [record.get(key) for record in records] for key in [{raw_list}]}}')
+    lines.append('')
+    lines.extend(body)
+    lines.append('    except _ScalarFallback:')
+    lines.append(f'        return [{scalar_fn}(record, inplace=inplace) for record in records]')
+    lines.append('')
+    lines.append('    results = list(records) if inplace else [dict(record) for record in records]')
+    calc_list = ', '.join(f"'{name}'" for name in calc_names)
+    lines.append(f'    for key in [{calc_list}]:')
+    lines.append('        for result, value in zip(results, cols[key]):')
+    lines.append('            result[key] = value')
+    lines.append('')
+
     if string_fields:
         lines.append('    # Convert empty strings to None for string fields')
         fields_list = ', '.join(f"'{f}'" for f in string_fields)
         lines.append(f"    for key in [{fields_list}]:")
-        lines.append("        if result.get(key) == '':")
-        lines.append('            result[key] = None')
+        lines.append('        for result in results:')
+        lines.append("            if result.get(key) == '':")
+        lines.append('                result[key] = None')
         lines.append('')
 
-    lines.append('    return result')
+    lines.append('    return results')
 
     return '\n'.join(lines)
 
 
+def generate_batch_helpers() -> str:
+    """Generate the column coercion and JIT helpers used by the batch functions."""
+    return '''@lru_cache(maxsize=None)
+def _jit(kernel):
+    """Numba-compiled column kernel (compiled, or loaded from cache, on first use)."""
+    return njit(cache=True, parallel=True)(kernel)
+
+
+def _no_jit(kernel):
+    """Run a column kernel as plain NumPy."""
+    return kernel
+
+
+class _ScalarFallback(Exception):
+    """Raised when a column cannot be evaluated exactly with NumPy."""
+
+
+def _values(column: list):
+    """Column as a numeric array; None or non-numeric values fall back."""
+    values = np.array(column)
+    if values.dtype.kind not in 'biuf':
+        raise _ScalarFallback
+    return values
+
+
+def _truthy(column: list):
+    """Elementwise `bool(value)`."""
+    return np.fromiter(map(bool, column), dtype=bool, count=len(column))'''
+
+
 def generate_dispatcher_function(entities_with_calcs: List[str]) -> str:
-    """Generate a dispatcher that routes to the correct entity's compute function."""
+    """Generate a dispatcher that routes to the correct entity's compute function.
+
+    Entity names are normalized once per distinct name (memoized) and looked
+    up in a table built at import time, so bulk per-record calls cost a
+    single dict lookup.
+    """
     lines = []
-    lines.append('def compute_all_calculated_fields(record: dict, entity_name: str = None) -> dict:')
+    lines.append('@lru_cache(maxsize=64)')
+    lines.append('def _normalize(entity_name: str) -> str:')
+    lines.append('    """Normalize an entity name to snake_case for dispatch."""')
+    lines.append("    return entity_name.lower().replace('-', '_')")
+    lines.append('')
+    lines.append('')
+    lines.append('_DISPATCH = {')
+    for entity in entities_with_calcs:
+        entity_snake = to_snake_case(entity)
+        lines.append(f"    '{entity_snake}': compute_{entity_snake}_fields,")
+    lines.append('}')
+    lines.append('')
+    lines.append('_BATCH_DISPATCH = {')
+    for entity in entities_with_calcs:
+        entity_snake = to_snake_case(entity)
+        lines.append(f"    '{entity_snake}': compute_{entity_snake}_fields_batch,")
+    lines.append('}')
+    lines.append('')
+    lines.append('')
+    lines.append('def compute_all_calculated_fields(record: dict, entity_name: str = None, *,')
+    lines.append('                                  inplace: bool = False) -> dict:')
     lines.append('    """')
     lines.append('    Compute all calculated fields for a record.')
     lines.append('    ')
     lines.append('    Args:')
     lines.append('        record: The record dict with raw field values')
     lines.append('        entity_name: Entity name (snake_case or PascalCase)')
+    lines.append('        inplace: Fill in record itself instead of a copy')
     lines.append('    ')
     lines.append('    Returns:')
     lines.append('        Record dict with calculated fields filled in')
     lines.append('    """')
-    lines.append('    if entity_name is None:')
-    lines.append('        # Try to infer from record keys')
-    lines.append('        return dict(record)')
+    lines.append('    fn = _DISPATCH.get(_normalize(entity_name)) if entity_name is not None else None')
+    lines.append('    if fn is None:')
+    lines.append('        # No entity name or unknown entity, return as-is')
+    lines.append('        return record if inplace else dict(record)')
+    lines.append('    return fn(record, inplace=inplace)')
     lines.append('')
-    lines.append('    # Normalize to snake_case')
-    lines.append("    entity_lower = entity_name.lower().replace('-', '_')")
     lines.append('')
+    lines.append('def compute_all_calculated_fields_batch(records: list, entity_name: str = None, *,')
+    lines.append('                                        inplace: bool = False) -> list:')
+    lines.append('    """Compute all calculated fields for a list of records of one entity."""')
+    lines.append('    fn = _BATCH_DISPATCH.get(_normalize(entity_name)) if entity_name is not None else None')
+    lines.append('    if fn is None:')
+    lines.append('        return list(records) if inplace else [dict(record) for record in records]')
+    lines.append('    return fn(records, inplace=inplace)')
 
-    # Generate dispatch logic
-    for i, entity in enumerate(entities_with_calcs):
-        entity_snake = to_snake_case(entity)
-        prefix = 'if' if i == 0 else 'elif'
-        lines.append(f"    {prefix} entity_lower == '{entity_snake}':")
-        lines.append(f"        return compute_{entity_snake}_fields(record)")
+    return '\n'.join(lines)
+
+
+# =============================================================================
+# CYTHON MODULES (--cython)
+# =============================================================================
+
+def _is_truthiness_formula(ast: ASTNode) -> bool:
+    """Check if a formula only combines field truthiness with AND/OR/NOT.
+
+    Such formulas give the same result with every field coerced to a C
+    bint (None -> False), so the Cython version can type them natively.
+    """
+    if isinstance(ast, (FieldRef, LiteralBool)):
+        return True
+    if isinstance(ast, UnaryOp) and ast.op == 'NOT':
+        return _is_truthiness_formula(ast.operand)
+    if isinstance(ast, FuncCall) and ast.name in ('AND', 'OR', 'NOT'):
+        return bool(ast.args) and all(_is_truthiness_formula(arg) for arg in ast.args)
+    return False
+
+
+def cython_module_name(entity_name: str) -> str:
+    """Module name of an entity's generated Cython extension."""
+    return f"erb_calc_{to_snake_case(entity_name)}"
+
+
+def rulebook_sha256(rulebook: Dict) -> str:
+    """SHA-256 of the canonical rulebook, tying compiled modules to it."""
+    return hashlib.sha256(rulebook_canonical(rulebook)).hexdigest()
+
+
+def generate_cython_module(rulebook: Dict, entity_name: str, rulebook_sha256: str) -> str:
+    """Generate a Cython (.pyx) mirror of an entity's calc/compute functions.
+
+    AND/OR/NOT-only formulas become nogil cpdef bint functions over bint
+    arguments; everything else keeps the Python expression with object
+    arguments (still compiled to C).
+    """
+    entity_snake = to_snake_case(entity_name)
+    schema = get_entity_schema(rulebook, entity_name)
+    calculated_fields = get_calculated_fields(schema)
+    raw_field_names = {f['name'] for f in get_raw_fields(schema)}
+    dag_levels = build_dag_levels(calculated_fields, raw_field_names)
+    string_fields = [
+        to_snake_case(f['name'])
+        for f in calculated_fields
+        if f.get('datatype') == 'string' and formula_can_be_empty(f)
+    ]
+
+    lines = []
+    lines.append('# cython: language_level=3')
+    lines.append('"""')
+    lines.append(f'ERB Calculation Library - {entity_name} (GENERATED - DO NOT EDIT)')
+    lines.append('Generated by: inject-into-python.py --cython')
+    lines.append('')
+    lines.append(f'Build with `cythonize -3 -i {cython_module_name(entity_name)}.pyx`; erb_calc.py')
+    lines.append('uses the compiled module when its RULEBOOK_SHA256 matches.')
+    lines.append('"""')
+    lines.append('')
+    lines.append('import sys')
+    lines.append('')
+    lines.append(f"RULEBOOK_SHA256 = '{rulebook_sha256}'")
+    lines.append('')
+
+    bint_fields = set()
+    computed = []
+    inputs = []
+    body = []
+    for level_idx, level_fields in enumerate(dag_levels):
+        lines.append('')
+        lines.append(f'# Level {level_idx + 1}')
+        body.append(f'    # Level {level_idx + 1} calculations')
+        for field in level_fields:
+            snake_name = to_snake_case(field['name'])
+            func_name = f"calc_{entity_snake}_{snake_name}"
+            ast = parse_formula(field.get('formula', ''))
+            deps = [to_snake_case(d) for d in get_field_dependencies(ast)]
+            inputs.extend(d for d in deps if d not in computed and d not in inputs)
+            computed.append(snake_name)
+
+            python_expr = compile_to_python(ast)
+            if is_computed_label(ast):
+                python_expr = f'sys.intern({python_expr})'
+            lines.append('')
+            if _is_truthiness_formula(ast):
+                bint_fields.add(snake_name)
+                # bool() is redundant on a C truth value and would need the GIL
+                if python_expr.startswith('bool('):
+                    python_expr = python_expr[len('bool'):]
+                params = ', '.join(f'bint {d}' for d in deps)
+                lines.append(f'cpdef bint {func_name}({params}) noexcept nogil:')
+            else:
+                lines.append(f"cpdef object {func_name}({', '.join(deps)}):")
+            lines.append(f'    return {python_expr}')
 
-    lines.append('    else:')
-    lines.append('        # Unknown entity, return as-is')
-    lines.append('        return dict(record)')
+            body.append(f"    {snake_name} = {func_name}({', '.join(deps)})")
+            if snake_name in string_fields:
+                body.append(f"    result['{snake_name}'] = None if {snake_name} == '' else {snake_name}")
+            else:
+                body.append(f"    result['{snake_name}'] = {snake_name}")
+        body.append('')
+
+    lines.append('')
+    lines.append('')
+    lines.append(f'cpdef dict compute_{entity_snake}_fields(dict record, bint inplace=False):')
+    lines.append(f'    """Compute all calculated fields for {entity_name}."""')
+    lines.append('    cdef dict result = record if inplace else dict(record)')
+    for name in inputs:
+        ctype = 'bint' if name in bint_fields else 'object'
+        lines.append(f"    cdef {ctype} {name} = result.get('{name}')")
+    for name in computed:
+        if name not in inputs:
+            lines.append(f"    cdef {'bint' if name in bint_fields else 'object'} {name}")
+    lines.append('')
+    lines.extend(body)
+    lines.append('    return result')
+    lines.append('')
 
     return '\n'.join(lines)
 
 
-def generate_erb_calc(rulebook: Dict) -> str:
-    """Generate the complete erb_calc.py content for ALL entities."""
+def generate_cython_hooks(entities_with_calcs: List[str], rulebook_sha256: str) -> str:
+    """Generate the imports that swap in the compiled Cython compute functions."""
+    lines = []
+    lines.append('# Compiled Cython versions (inject-into-python.py --cython) replace the')
+    lines.append('# compute functions above when built for this rulebook; otherwise the')
+    lines.append('# pure-Python functions are used')
+    lines.append(f"_RULEBOOK_SHA256 = '{rulebook_sha256}'")
+    for entity in entities_with_calcs:
+        entity_snake = to_snake_case(entity)
+        module = cython_module_name(entity)
+        lines.append('')
+        lines.append('try:')
+        lines.append(f'    import {module} as _cy_{entity_snake}')
+        lines.append('except ImportError:')
+        lines.append(f'    _cy_{entity_snake} = None')
+        lines.append(f'if _cy_{entity_snake} is not None and _cy_{entity_snake}.RULEBOOK_SHA256 == _RULEBOOK_SHA256:')
+        lines.append(f'    compute_{entity_snake}_fields = _cy_{entity_snake}.compute_{entity_snake}_fields')
+    return '\n'.join(lines)
+
+
+def generate_erb_calc(rulebook: Dict, cython: bool = False) -> str:
+    """Generate the complete erb_calc.py content for ALL entities.
+
+    With cython=True the module also picks up the compiled per-entity
+    modules written by generate_cython_module.
+    """
     lines = []
 
     # Header
@@ -223,8 +581,32 @@ def generate_erb_calc(rulebook: Dict) -> str:
     lines.append('from raw field values. Supports multiple entities.')
     lines.append('"""')
     lines.append('')
+    lines.append('import sys')
+    lines.append('from functools import lru_cache')
+    lines.append('from operator import itemgetter')
     lines.append('from typing import Optional, Any')
     lines.append('')
+    lines.append('# NumPy evaluates boolean/integer formulas a whole column at a time in the')
+    lines.append('# *_batch functions; without it they run the per-record functions')
+    lines.append('try:')
+    lines.append('    import numpy as np')
+    lines.append('    NUMPY_AVAILABLE = True')
+    lines.append('except ImportError:')
+    lines.append('    NUMPY_AVAILABLE = False')
+    lines.append('')
+    lines.append('# Numba fuses each column kernel into one native loop; only worth its')
+    lines.append('# compile time for batches of at least NUMBA_MIN_RECORDS records')
+    lines.append('try:')
+    lines.append('    from numba import njit')
+    lines.append('    NUMBA_AVAILABLE = True')
+    lines.append('except ImportError:')
+    lines.append('    NUMBA_AVAILABLE = False')
+    lines.append('')
+    lines.append('NUMBA_MIN_RECORDS = 10000')
+    lines.append('')
+    lines.append('')
+    lines.append(generate_batch_helpers())
+    lines.append('')
 
     # Discover all entities
     entities = discover_entities(rulebook)
@@ -242,11 +624,12 @@ def generate_erb_calc(rulebook: Dict) -> str:
         raw_fields = get_raw_fields(schema)
         raw_field_names = {f['name'] for f in raw_fields}
 
-        # Find string calculated fields (for empty string -> None conversion)
+        # Find string calculated fields whose formulas can produce '' (for
+        # empty string -> None conversion)
         string_fields = [
             to_snake_case(f['name'])
             for f in calculated_fields
-            if f.get('datatype') == 'string'
+            if f.get('datatype') == 'string' and formula_can_be_empty(f)
         ]
 
         # Build DAG levels
@@ -274,6 +657,16 @@ def generate_erb_calc(rulebook: Dict) -> str:
         lines.append(generate_entity_compute_function(
             entity_name, calculated_fields, dag_levels, string_fields
         ))
+        lines.append('')
+        lines.append('')
+        lines.append(generate_entity_batch_function(
+            entity_name, dag_levels, string_fields, numpy_field_kinds(schema)
+        ))
+
+    if cython:
+        lines.append('')
+        lines.append('')
+        lines.append(generate_cython_hooks(entities_with_calcs, rulebook_sha256(rulebook)))
 
     # Generate dispatcher function
     lines.append('')
@@ -291,7 +684,7 @@ def main():
     # Files actually generated by THIS script
     GENERATED_FILES = [
         'erb_calc.py',
-    ]
+    ] + sorted(p.name for p in Path.cwd().glob('erb_calc_*.pyx'))
 
     # Handle --clean argument
     if handle_clean_arg(GENERATED_FILES, "Python substrate: Removes generated calculation library"):
@@ -335,13 +728,25 @@ def main():
     print()
 
     # Generate erb_calc.py
+    cython = '--cython' in sys.argv
     print("Generating erb_calc.py...")
-    erb_calc_content = generate_erb_calc(rulebook)
+    erb_calc_content = generate_erb_calc(rulebook, cython=cython)
 
     erb_calc_path = script_dir / "erb_calc.py"
     erb_calc_path.write_text(erb_calc_content, encoding='utf-8')
     print(f"Wrote: {erb_calc_path} ({len(erb_calc_content)} bytes)")
 
+    # Generate one Cython module per entity (build with cythonize -3 -i)
+    if cython:
+        sha256 = rulebook_sha256(rulebook)
+        for entity_name in entities:
+            if not get_calculated_fields(get_entity_schema(rulebook, entity_name)):
+                continue
+            pyx_content = generate_cython_module(rulebook, entity_name, sha256)
+            pyx_path = script_dir / f"{cython_module_name(entity_name)}.pyx"
+            pyx_path.write_text(pyx_content, encoding='utf-8')
+            print(f"Wrote: {pyx_path} ({len(pyx_content)} bytes)")
+
     print()
     print("=" * 70)
     print("Generation complete!")
@@ -14,36 +14,40 @@ rulebook and contains all calculation functions.
 
 import argparse
 import glob
-import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # Add current directory to path to allow imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
+# Add project root to path for shared imports
+sys.path.insert(0, os.path.join(script_dir, "..", ".."))
 
-from erb_calc import compute_all_calculated_fields
+from erb_calc import compute_all_calculated_fields_batch
+from orchestration.shared import read_json, write_json
 
 
-def process_entity(input_path: str, output_path: str, entity_name: str) -> int:
-    """Process a single entity file, computing all calculated fields."""
-    with open(input_path, 'r') as f:
-        records = json.load(f)
+def process_entity(input_path: str, output_path: str, entity_name: str,
+                   compact: bool = None) -> int:
+    """Process a single entity file, computing all calculated fields.
 
-    # Compute all calculated fields for each record
-    computed_records = []
-    for record in records:
-        computed = compute_all_calculated_fields(record, entity_name)
-        computed_records.append(computed)
+    compact writes the answers as compact JSON (see write_json).
+    """
+    records = read_json(input_path)
 
-    # Save results
-    with open(output_path, 'w') as f:
-        json.dump(computed_records, f, indent=2)
+    # Compute all calculated fields a column at a time
+    # The records were just parsed and are not shared: fill them in place
+    computed_records = compute_all_calculated_fields_batch(records, entity_name, inplace=True)
+
+    # Save results (orjson when available)
+    write_json(computed_records, output_path, compact)
 
     return len(computed_records)
 
 
-def run_multi_entity():
+def run_multi_entity(compact: bool = None):
     """Process all entity files from shared testing/blank-tests/ directory."""
     # Use shared blank-tests directory at project root
     project_root = os.path.join(script_dir, "..", "..")
@@ -61,6 +65,7 @@ def run_multi_entity():
     total_records = 0
     entity_count = 0
 
+    tasks = []
     for input_path in sorted(glob.glob(os.path.join(blank_tests_dir, "*.json"))):
         filename = os.path.basename(input_path)
 
@@ -70,8 +75,18 @@ def run_multi_entity():
 
         entity = filename.replace('.json', '')
         output_path = os.path.join(test_answers_dir, filename)
-
-        count = process_entity(input_path, output_path, entity)
+        tasks.append((input_path, output_path, entity))
+
+    # Entity files are independent, so several are computed in parallel
+    # worker processes; results come back in file order
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        counts = [process_entity(*task, compact=compact) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(partial(process_entity, compact=compact), *zip(*tasks)))
+
+    for (_, _, entity), count in zip(tasks, counts):
         total_records += count
         entity_count += 1
 
@@ -95,7 +110,14 @@ def run_legacy():
 
 
 def main():
-    run_multi_entity()
+    parser = argparse.ArgumentParser(description="Python substrate test runner")
+    parser.add_argument("--multi-entity", action="store_true",
+                        help="Process all blank-tests/ entity files (the default mode)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write test answers as compact JSON, one record per line "
+                             "(default: 2-space indented, or ERB_COMPACT_JSON=1)")
+    args = parser.parse_args()
+    run_multi_entity(compact=args.compact or None)
 
 
 if __name__ == "__main__":
@@ -17,9 +17,7 @@ This script is 100% domain-agnostic - all field names come from the rulebook.
 
 import argparse
 import glob as glob_module
-import json
 import os
-import re
 from pathlib import Path
 import sys
 from dataclasses import dataclass
@@ -29,7 +27,7 @@ from enum import Enum, auto
 # Add project root to path for shared imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from orchestration.shared import load_rulebook
+from orchestration.shared import camel_to_snake, load_rulebook, read_json, write_json
 
 # Add Python substrate directory to path for shared library
 script_dir = Path(__file__).parent.resolve()
@@ -602,13 +600,6 @@ class OCLInterpreter:
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def camel_to_snake(name: str) -> str:
-    """Convert CamelCase to snake_case for output compatibility."""
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-    # Normalize consecutive underscores to single underscore
-    return re.sub('_+', '_', s2)
-
 
 def snake_to_pascal(name: str) -> str:
     """Convert snake_case to PascalCase for OCL class lookup."""
@@ -694,8 +685,7 @@ def topological_sort_constraints(class_constraints: Dict[str, str]) -> List[tupl
 def process_entity(input_path: str, output_path: str, entity_name: str,
                    all_constraints: Dict[str, Dict[str, str]]) -> int:
     """Process a single entity file using OCL interpreter."""
-    with open(input_path, 'r', encoding='utf-8') as f:
-        records = json.load(f)
+    records = read_json(input_path)
 
     # Convert entity name to PascalCase for OCL class lookup
     class_name = snake_to_pascal(entity_name)
@@ -726,8 +716,7 @@ def process_entity(input_path: str, output_path: str, entity_name: str,
 
         computed_records.append(record)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(computed_records, f, indent=2)
+    write_json(computed_records, output_path)
 
     return len(computed_records)
 
@@ -808,8 +797,7 @@ def run_legacy():
             sys.exit(1)
 
     print("Loading model...")
-    with open(model_path) as f:
-        model = json.load(f)
+    model = read_json(model_path)
 
     print(f"   Loaded {len(model['instances'])} instances")
 
@@ -860,8 +848,7 @@ def run_legacy():
     print(f"   Evaluated {len(results)} records")
 
     print(f"\nSaving results to: {test_file}")
-    with open(test_file, "w", encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
+    write_json(results, test_file)
 
     print("\n" + "=" * 70)
     print("Test execution complete!")
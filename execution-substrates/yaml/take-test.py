@@ -15,9 +15,10 @@ with the Python substrate.
 
 import argparse
 import glob
-import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # Get script directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +26,8 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 # Add Python substrate directory to path for shared library
 python_substrate_dir = os.path.join(script_dir, "..", "python")
 sys.path.insert(0, python_substrate_dir)
+# Add project root to path for shared imports
+sys.path.insert(0, os.path.join(script_dir, "..", ".."))
 
 # Try to import yaml for schema reading (optional - for logging purposes)
 try:
@@ -34,7 +37,8 @@ except ImportError:
     YAML_AVAILABLE = False
     print("Warning: PyYAML not installed. Schema details will not be logged.")
 
-from erb_calc import compute_all_calculated_fields
+from erb_calc import compute_all_calculated_fields_batch
+from orchestration.shared import read_json, write_json
 
 
 def load_schema(schema_path: str) -> dict:
@@ -90,25 +94,26 @@ def log_schema_info():
             print(f"  ... and {len(calculated_fields) - 5} more")
 
 
-def process_entity(input_path: str, output_path: str, entity_name: str) -> int:
-    """Process a single entity file, computing all calculated fields."""
-    with open(input_path, 'r') as f:
-        records = json.load(f)
+def process_entity(input_path: str, output_path: str, entity_name: str,
+                   compact: bool = None) -> int:
+    """Process a single entity file, computing all calculated fields.
 
-    # Compute all calculated fields for each record
-    computed_records = []
-    for record in records:
-        computed = compute_all_calculated_fields(record, entity_name)
-        computed_records.append(computed)
+    compact writes the answers as compact JSON (see write_json).
+    """
+    records = read_json(input_path)
 
-    # Save results
-    with open(output_path, 'w') as f:
-        json.dump(computed_records, f, indent=2)
+    # Compute all calculated fields a column at a time (NumPy, and Numba
+    # for large batches, when installed)
+    # The records were just parsed and are not shared: fill them in place
+    computed_records = compute_all_calculated_fields_batch(records, entity_name, inplace=True)
+
+    # Save results (orjson when available)
+    write_json(computed_records, output_path, compact)
 
     return len(computed_records)
 
 
-def run_multi_entity():
+def run_multi_entity(compact: bool = None):
     """Process all entity files from shared testing/blank-tests/ directory."""
     # Use shared blank-tests directory at project root
     project_root = os.path.join(script_dir, "..", "..")
@@ -129,6 +134,7 @@ def run_multi_entity():
     total_records = 0
     entity_count = 0
 
+    tasks = []
     for input_path in sorted(glob.glob(os.path.join(blank_tests_dir, "*.json"))):
         filename = os.path.basename(input_path)
 
@@ -138,8 +144,18 @@ def run_multi_entity():
 
         entity = filename.replace('.json', '')
         output_path = os.path.join(test_answers_dir, filename)
-
-        count = process_entity(input_path, output_path, entity)
+        tasks.append((input_path, output_path, entity))
+
+    # Entity files are independent, so several are computed in parallel
+    # worker processes; results come back in file order
+    workers = min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        counts = [process_entity(*task, compact=compact) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(partial(process_entity, compact=compact), *zip(*tasks)))
+
+    for (_, _, entity), count in zip(tasks, counts):
         total_records += count
         entity_count += 1
 
@@ -161,26 +177,28 @@ def run_legacy():
     log_schema_info()
 
     # Load test data
-    with open(input_path, 'r') as f:
-        records = json.load(f)
+    records = read_json(input_path)
 
     print(f"YAML substrate: Processing {len(records)} records...")
 
-    # Compute all calculated fields for each record using shared library
-    computed_records = []
-    for record in records:
-        computed = compute_all_calculated_fields(record)
-        computed_records.append(computed)
+    # Compute all calculated fields using shared library
+    computed_records = compute_all_calculated_fields_batch(records, inplace=True)
 
     # Save results
-    with open(output_path, 'w') as f:
-        json.dump(computed_records, f, indent=2)
+    write_json(computed_records, output_path)
 
     print(f"YAML substrate: Saved results to {output_path}")
 
 
 def main():
-    run_multi_entity()
+    parser = argparse.ArgumentParser(description="YAML substrate test runner")
+    parser.add_argument("--multi-entity", action="store_true",
+                        help="Process all blank-tests/ entity files (the default mode)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write test answers as compact JSON, one record per line "
+                             "(default: 2-space indented, or ERB_COMPACT_JSON=1)")
+    args = parser.parse_args()
+    run_multi_entity(compact=args.compact or None)
 
 
 if __name__ == "__main__":
@@ -16,7 +16,7 @@ Extracted from: execution-substrates/owl/inject-into-owl.py
 
 import re
 from dataclasses import dataclass
-from typing import List, Any
+from typing import List, Any, Optional
 from enum import Enum, auto
 
 
@@ -416,21 +416,85 @@ def _is_boolean_expr(ast: ASTNode) -> bool:
     return False
 
 
-def _compile_and_arg(ast: ASTNode) -> str:
-    """Compile an AND/OR argument with appropriate boolean coercion."""
-    compiled = compile_to_python(ast)
-    # If it's already a boolean expression, don't wrap with 'is True'
+def _is_string_expr(ast: ASTNode) -> bool:
+    """Check if an AST node always produces a str (never None)."""
+    if isinstance(ast, (LiteralString, Concat)):
+        return True
+    if isinstance(ast, FuncCall):
+        if ast.name in ('LOWER', 'CAST'):
+            return True
+        if ast.name == 'IF' and len(ast.args) == 3:
+            return _is_string_expr(ast.args[1]) and _is_string_expr(ast.args[2])
+    return False
+
+
+def can_be_empty_string(ast: ASTNode) -> bool:
+    """Check if an AST node may evaluate to '' (conservative: True if unsure)."""
+    if isinstance(ast, LiteralString):
+        return ast.value == ''
+    if isinstance(ast, Concat):
+        return all(can_be_empty_string(part) for part in ast.parts)
+    if isinstance(ast, FuncCall) and ast.name == 'IF' and len(ast.args) == 3:
+        return can_be_empty_string(ast.args[1]) or can_be_empty_string(ast.args[2])
+    return True
+
+
+def _is_label_expr(ast: ASTNode) -> bool:
+    """Check if an AST node evaluates to one of a fixed set of literal strings."""
+    if isinstance(ast, LiteralString):
+        return True
+    if isinstance(ast, Concat):
+        return all(_is_label_expr(part) for part in ast.parts)
+    if isinstance(ast, FuncCall) and ast.name == 'IF' and len(ast.args) == 3:
+        return _is_label_expr(ast.args[1]) and _is_label_expr(ast.args[2])
+    return False
+
+
+def is_computed_label(ast: ASTNode) -> bool:
+    """Check if an AST node builds a fresh copy of one of a fixed set of
+    strings on every call (a concatenation of literals / IF choices)."""
+    if isinstance(ast, Concat):
+        return _is_label_expr(ast)
+    if isinstance(ast, FuncCall) and ast.name == 'IF' and len(ast.args) == 3:
+        return (_is_label_expr(ast) and
+                (is_computed_label(ast.args[1]) or is_computed_label(ast.args[2])))
+    return False
+
+
+def python_return_type(ast: ASTNode) -> Optional[str]:
+    """Name of the Python type compile_to_python's code for ast always returns
+    ('bool' or 'str'), or None when it may vary (e.g. a None field value)."""
     if _is_boolean_expr(ast):
-        return compiled
-    # Field references need 'is True' for None handling
-    return f'({compiled} is True)'
+        return 'bool'
+    if _is_string_expr(ast):
+        return 'str'
+    return None
+
+
+def _compile_truthy(ast: ASTNode) -> str:
+    """Compile an AST whose value is only tested for truthiness.
+
+    Field references are used bare (None is falsy) and AND/OR chains skip
+    their bool() wrapper, so a test compiles to plain jumps.
+    """
+    if isinstance(ast, FuncCall) and ast.name in ('AND', 'OR'):
+        joiner = ' and ' if ast.name == 'AND' else ' or '
+        return '(' + joiner.join(_compile_truthy(arg) for arg in ast.args) + ')'
+    return compile_to_python(ast)
+
+
+def _fstring_literal(text: str) -> str:
+    """Escape literal text for a single-quoted f-string."""
+    return (text.replace('\\', '\\\\').replace("'", "\\'")
+            .replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+            .replace('{', '{{').replace('}', '}}'))
 
 
 def compile_to_python(ast: ASTNode) -> str:
     """Compile an AST to a Python expression.
 
-    Handles None values by using 'is True' and 'is not True' patterns.
-    Field references are converted to snake_case variable names.
+    Boolean fields hold True/False/None and are tested by truthiness, so None
+    acts as false. Field references are converted to snake_case variable names.
     """
     if isinstance(ast, LiteralBool):
         return 'True' if ast.value else 'False'
@@ -446,12 +510,7 @@ def compile_to_python(ast: ASTNode) -> str:
 
     if isinstance(ast, UnaryOp):
         if ast.op == 'NOT':
-            operand = compile_to_python(ast.operand)
-            # For field refs, use 'is not True' for None safety
-            if isinstance(ast.operand, FieldRef):
-                return f'({operand} is not True)'
-            # For other expressions, use regular not
-            return f'(not {operand})'
+            return f'(not {_compile_truthy(ast.operand)})'
         raise ValueError(f"Unknown unary op: {ast.op}")
 
     if isinstance(ast, BinaryOp):
@@ -461,18 +520,19 @@ def compile_to_python(ast: ASTNode) -> str:
         return f'({left} {op_map[ast.op]} {right})'
 
     if isinstance(ast, FuncCall):
-        if ast.name == 'AND':
-            parts = [_compile_and_arg(arg) for arg in ast.args]
-            return '(' + ' and '.join(parts) + ')'
-
-        if ast.name == 'OR':
-            parts = [_compile_and_arg(arg) for arg in ast.args]
-            return '(' + ' or '.join(parts) + ')'
+        if ast.name in ('AND', 'OR'):
+            chain = _compile_truthy(ast)
+            # and/or return an operand; only comparisons/NOTs are already bool
+            if all(_is_boolean_expr(arg) and not (isinstance(arg, FuncCall) and
+                                                  arg.name in ('AND', 'OR'))
+                   for arg in ast.args):
+                return chain
+            return f'bool{chain}'
 
         if ast.name == 'IF':
             if len(ast.args) < 2:
                 raise ValueError("IF requires at least 2 arguments")
-            cond = compile_to_python(ast.args[0])
+            cond = _compile_truthy(ast.args[0])
             then_val = compile_to_python(ast.args[1])
             else_val = compile_to_python(ast.args[2]) if len(ast.args) > 2 else 'None'
             return f'({then_val} if {cond} else {else_val})'
@@ -480,8 +540,7 @@ def compile_to_python(ast: ASTNode) -> str:
         if ast.name == 'NOT':
             if len(ast.args) != 1:
                 raise ValueError("NOT requires 1 argument")
-            operand = compile_to_python(ast.args[0])
-            return f'({operand} is not True)'
+            return f'(not {_compile_truthy(ast.args[0])})'
 
         if ast.name == 'LOWER':
             if len(ast.args) != 1:
@@ -514,7 +573,19 @@ def compile_to_python(ast: ASTNode) -> str:
         raise ValueError(f"Unknown function: {ast.name}")
 
     if isinstance(ast, Concat):
-        # Use string concatenation to avoid nested f-string issues
+        # Literals and plain field refs only: one f-string (a single
+        # BUILD_STRING instead of a str() call and + per part)
+        if all(isinstance(part, (LiteralString, FieldRef)) for part in ast.parts):
+            pieces = []
+            for part in ast.parts:
+                if isinstance(part, LiteralString):
+                    pieces.append(_fstring_literal(part.value))
+                else:
+                    pieces.append('{' + compile_to_python(part) + ' or ""}')
+            return "f'" + ''.join(pieces) + "'"
+
+        # IF choices and other expressions can't safely nest in an f-string
+        # (quotes/backslashes before Python 3.12): join the parts instead
         parts = []
         for part in ast.parts:
             if isinstance(part, LiteralString):
@@ -522,15 +593,151 @@ def compile_to_python(ast: ASTNode) -> str:
             elif isinstance(part, FieldRef):
                 var = compile_to_python(part)
                 parts.append(f'str({var} or "")')
+            elif _is_string_expr(part):
+                # Already a str (e.g. IF between two literals) - evaluate once
+                parts.append(compile_to_python(part))
             else:
                 # Complex expression - wrap in str() with None handling
                 expr = compile_to_python(part)
                 parts.append(f'str({expr} if {expr} is not None else "")')
+        if len(parts) > 2:
+            # One join copies each part once; a + chain builds every prefix
+            return "''.join((" + ', '.join(parts) + '))'
         return '(' + ' + '.join(parts) + ')'
 
     raise ValueError(f"Unknown AST node type: {type(ast)}")
 
 
+# =============================================================================
+# NUMPY CODE GENERATOR
+# =============================================================================
+# Compiles boolean/integer formulas to whole-column NumPy expressions. Columns
+# are plain lists in a dict named by col_name; the generated module provides
+# the coercion helpers _values (raw values, no None) and _truthy (bool(v)),
+# mirroring how compile_to_python treats a field reference in each position. Anything else (strings, IF without else, ...) raises
+# ValueError and is left to the scalar calc_* function.
+
+_NUMPY_KINDS = {'boolean': 'bool', 'integer': 'int'}
+
+
+def _numpy_column(ast: FieldRef, column_ref, field_kinds: dict, helper: str) -> str:
+    name = to_snake_case(ast.name)
+    if field_kinds.get(name) not in ('bool', 'int'):
+        raise ValueError(f"Field is not boolean/integer: {name}")
+    return column_ref(helper, name)
+
+
+def _compile_numpy_bool(ast: ASTNode, column_ref, field_kinds: dict) -> str:
+    expr, kind, vector = _compile_numpy(ast, column_ref, field_kinds)
+    if kind != 'bool' or not vector:
+        raise ValueError("Expected a boolean column expression")
+    return expr
+
+
+def _compile_numpy(ast: ASTNode, column_ref, field_kinds: dict):
+    """Compile to (expression, kind, is_column); kind is 'bool' or 'int'."""
+    if isinstance(ast, LiteralBool):
+        return ('True' if ast.value else 'False'), 'bool', False
+
+    if isinstance(ast, LiteralInt):
+        return str(ast.value), 'int', False
+
+    if isinstance(ast, FieldRef):
+        name = to_snake_case(ast.name)
+        return _numpy_column(ast, column_ref, field_kinds, '_values'), field_kinds[name], True
+
+    if isinstance(ast, UnaryOp) and ast.op == 'NOT':
+        if isinstance(ast.operand, FieldRef):
+            return f"(~{_numpy_column(ast.operand, column_ref, field_kinds, '_truthy')})", 'bool', True
+        return f'(~{_compile_numpy_bool(ast.operand, column_ref, field_kinds)})', 'bool', True
+
+    if isinstance(ast, BinaryOp):
+        left, _, left_vector = _compile_numpy(ast.left, column_ref, field_kinds)
+        right, _, right_vector = _compile_numpy(ast.right, column_ref, field_kinds)
+        if not (left_vector or right_vector):
+            raise ValueError("Comparison has no column operand")
+        op_map = {'=': '==', '<>': '!=', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+        return f'({left} {op_map[ast.op]} {right})', 'bool', True
+
+    if isinstance(ast, FuncCall):
+        if ast.name in ('AND', 'OR'):
+            parts = []
+            for arg in ast.args:
+                if isinstance(arg, FieldRef):
+                    parts.append(_numpy_column(arg, column_ref, field_kinds, '_truthy'))
+                else:
+                    parts.append(_compile_numpy_bool(arg, column_ref, field_kinds))
+            if not parts:
+                raise ValueError(f"{ast.name} requires arguments")
+            joiner = ' & ' if ast.name == 'AND' else ' | '
+            return '(' + joiner.join(parts) + ')', 'bool', True
+
+        if ast.name == 'NOT':
+            if len(ast.args) != 1:
+                raise ValueError("NOT requires 1 argument")
+            operand = ast.args[0]
+            if isinstance(operand, FieldRef):
+                return f"(~{_numpy_column(operand, column_ref, field_kinds, '_truthy')})", 'bool', True
+            return f'(~{_compile_numpy_bool(operand, column_ref, field_kinds)})', 'bool', True
+
+        if ast.name == 'IF':
+            if len(ast.args) != 3:
+                raise ValueError("IF needs an else branch to vectorize")
+            cond_ast = ast.args[0]
+            if isinstance(cond_ast, FieldRef):
+                cond = _numpy_column(cond_ast, column_ref, field_kinds, '_truthy')
+            else:
+                cond = _compile_numpy_bool(cond_ast, column_ref, field_kinds)
+            then_val, then_kind, _ = _compile_numpy(ast.args[1], column_ref, field_kinds)
+            else_val, else_kind, _ = _compile_numpy(ast.args[2], column_ref, field_kinds)
+            if then_kind != else_kind:
+                raise ValueError("IF branches have different kinds")
+            return f'np.where({cond}, {then_val}, {else_val})', then_kind, True
+
+        if ast.name == 'SUM':
+            parts = []
+            for arg in ast.args:
+                expr, kind, _ = _compile_numpy(arg, column_ref, field_kinds)
+                # bool arrays add as logical OR, so only sum integers
+                if kind != 'int':
+                    raise ValueError("SUM arguments must be integers")
+                parts.append(expr)
+            if not parts:
+                raise ValueError("SUM requires arguments")
+            return '(' + ' + '.join(parts) + ')', 'int', True
+
+    raise ValueError(f"Cannot vectorize: {ast}")
+
+
+def compile_to_numpy(ast: ASTNode, field_kinds: dict, col_name: str = 'cols',
+                     column_ref=None) -> str:
+    """Compile a boolean/integer AST to a NumPy expression over whole columns.
+
+    field_kinds maps snake_case field names to 'bool' or 'int' (see
+    numpy_field_kinds). Raises ValueError if the formula cannot be vectorized
+    with results identical to compile_to_python.
+
+    column_ref(helper, field_name) -> str overrides how a coerced column is
+    referenced (default: helper(col_name['field_name'])), e.g. to emit the
+    expression as a kernel over pre-coerced array parameters.
+    """
+    if column_ref is None:
+        column_ref = lambda helper, name: f"{helper}({col_name}['{name}'])"
+    expr, _, vector = _compile_numpy(ast, column_ref, field_kinds)
+    if not vector:
+        raise ValueError("Formula does not depend on any column")
+    return expr
+
+
+def numpy_field_kinds(schema: list) -> dict:
+    """Map snake_case field names to NumPy kinds for compile_to_numpy."""
+    return {
+        to_snake_case(field['name']): _NUMPY_KINDS[field.get('datatype')]
+        for field in schema
+        if field.get('datatype') in _NUMPY_KINDS
+    }
+
+
 # =============================================================================
 # JAVASCRIPT CODE GENERATOR
 # =============================================================================
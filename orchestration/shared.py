@@ -6,9 +6,23 @@ All inject-into-*.py scripts use these common utilities.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+# orjson parses and serializes several times faster than the stdlib; the
+# helpers below fall back to json when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ERB_COMPACT_JSON=1 makes write_json skip pretty-printing (one record per
+# line) for output only other tools read; indentation costs several times
+# the serialization time and file size on large entities
+COMPACT_JSON = os.environ.get("ERB_COMPACT_JSON") == "1"
+
 
 def get_rulebook_path():
     """Get the path to the effortless-rulebook.json file.
@@ -30,6 +44,118 @@ def load_rulebook():
         return json.load(f)
 
 
+def read_json(path):
+    """Load a JSON file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def loads_json(data):
+    """Parse JSON from str or bytes, using orjson when available.
+
+    Both backends raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(data, path, compact=None):
+    """Write data as 2-space indented JSON, using orjson when available.
+
+    With compact (default: COMPACT_JSON), a list is written compactly one
+    item per line (other values on a single line). The serialized bytes go
+    straight to disk with no intermediate str.
+    """
+    if compact is None:
+        compact = COMPACT_JSON
+    if not compact:
+        content = dumps_json(data, indent=True)
+    elif isinstance(data, list) and data:
+        content = b'[\n' + b',\n'.join(map(dumps_json, data)) + b'\n]'
+    else:
+        content = dumps_json(data)
+    Path(path).write_bytes(content)
+
+
+def write_json_records(records, path, compact=None):
+    """Stream a list of records to path, byte-identical to write_json(records, path, compact).
+
+    Records are serialized one at a time, so no buffer of the whole file is
+    built. Output goes to a temporary file that atomically replaces path.
+    """
+    path = Path(path)
+    if compact is None:
+        compact = COMPACT_JSON
+    if not records:
+        write_json(records, path, compact)
+        return
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        write = f.write
+        if compact:
+            separator = b'[\n'
+            for record in records:
+                write(separator)
+                write(dumps_json(record))
+                separator = b',\n'
+            write(b'\n]')
+        else:
+            # Each record's indented form, nested one level deeper (JSON
+            # strings never contain a raw newline)
+            separator = b'[\n  '
+            for record in records:
+                write(separator)
+                write(dumps_json(record, indent=True).replace(b'\n', b'\n  '))
+                separator = b',\n  '
+            write(b'\n]')
+    os.replace(tmp_path, path)
+
+
+def dumps_json(data, indent=False, sort_keys=False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available.
+
+    Compact output matches orjson's separators in both paths, so hashes
+    computed over the result do not depend on which backend is installed.
+    """
+    if ORJSON_AVAILABLE:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+    if indent:
+        text = json.dumps(data, indent=2, sort_keys=sort_keys, ensure_ascii=False)
+    else:
+        text = json.dumps(data, separators=(',', ':'), sort_keys=sort_keys,
+                          ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+# id(rulebook) -> (rulebook, canonical bytes); the rulebook is held so its id stays unique
+_canonical_bytes_cache = {}
+
+
+def rulebook_canonical(rulebook) -> bytes:
+    """Canonical (key-sorted, compact) JSON bytes of a loaded rulebook.
+
+    Cached per rulebook object so every consumer hashing or embedding the
+    rulebook in one process shares a single serialization. Do not mutate a
+    rulebook after canonicalizing it.
+    """
+    cached = _canonical_bytes_cache.get(id(rulebook))
+    if cached is not None and cached[0] is rulebook:
+        return cached[1]
+    content = dumps_json(rulebook, sort_keys=True)
+    _canonical_bytes_cache[id(rulebook)] = (rulebook, content)
+    return content
+
+
 def ensure_output_folder():
     """Ensure the current working directory exists (it should, since we run from there)."""
     cwd = Path.cwd()
@@ -157,15 +283,39 @@ def handle_clean_arg(generated_files: list, description: str = None):
 
 import re
 
+# Use [^_] to avoid doubling underscores when input already has them
+_SNAKE_RE1 = re.compile('([^_])([A-Z][a-z]+)')
+_SNAKE_RE2 = re.compile('([a-z0-9])([A-Z])')
 
+
+@lru_cache(maxsize=None)
 def to_snake_case(name: str) -> str:
     """Convert PascalCase to snake_case: UserAccounts -> user_accounts
 
     Also handles fields with existing underscores: Bio_HockettScore -> bio_hockett_score
+
+    Memoized: the same schema and entity names are converted over and over.
+    """
+    s1 = _SNAKE_RE1.sub(r'\1_\2', name)
+    return _SNAKE_RE2.sub(r'\1_\2', s1).lower()
+
+
+_CAMEL_RE1 = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_RE2 = re.compile('([a-z0-9])([A-Z])')
+_UNDERSCORES_RE = re.compile('_+')
+
+
+@lru_cache(maxsize=None)
+def camel_to_snake(name: str) -> str:
+    """Convert CamelCase to snake_case for output compatibility.
+
+    Unlike to_snake_case, runs of underscores collapse to one. Memoized: the
+    OWL and UML substrates call it for every key of every extracted record.
     """
-    # Use [^_] to avoid doubling underscores when input already has them
-    s1 = re.sub('([^_])([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    s1 = _CAMEL_RE1.sub(r'\1_\2', name)
+    s2 = _CAMEL_RE2.sub(r'\1_\2', s1).lower()
+    # Normalize consecutive underscores to single underscore
+    return _UNDERSCORES_RE.sub('_', s2)
 
 
 def to_pascal_case(name: str) -> str: